@@ -48,7 +48,14 @@ from server.app.domain.auth.models import (  # noqa: E402, F401
     TbTokenBlacklist,
 )
 from server.app.domain.board.models.notice import WbBoardInfo  # noqa: E402, F401
-from server.app.domain.logistics.models import Aw01010, Aw01011  # noqa: E402, F401
+from server.app.domain.logistics.models import (  # noqa: E402, F401
+    Aw01010,
+    Aw01010DailyStat,
+    Aw01010DelLog,
+    Aw01011,
+    Aw01010Ngram,
+    Aw01010Search,
+)
 
 # Add more imports as you create new domains
 
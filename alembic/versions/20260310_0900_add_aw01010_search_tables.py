@@ -0,0 +1,91 @@
+"""Add AW01010 search index tables
+
+Revision ID: c4d8f0a1e237
+Revises: a3c7e9f12b45
+Create Date: 2026-03-10 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d8f0a1e237"
+down_revision: Union[str, None] = "a3c7e9f12b45"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FULLTEXT_CATALOG = "ftc_logistics"
+
+
+def _is_mssql() -> bool:
+    return op.get_bind().dialect.name == "mssql"
+
+
+def upgrade() -> None:
+    """Apply migration changes to database."""
+    # AW01010_SEARCH - 반출입 검색 문서 (MSSQL 전문 검색 대상)
+    op.create_table(
+        "AW01010_SEARCH",
+        sa.Column("DOC_NO", sa.Unicode(length=13), nullable=False, comment="반출입번호"),
+        sa.Column(
+            "COMPANY_TEXT", sa.Unicode(length=100), nullable=False, comment="협력업체 검색 텍스트"
+        ),
+        sa.Column(
+            "MATERIAL_TEXT", sa.UnicodeText(), nullable=False, comment="자재명/규격/메이커 검색 텍스트"
+        ),
+        sa.PrimaryKeyConstraint("DOC_NO", name=op.f("pk_AW01010_SEARCH")),
+    )
+
+    # AW01010_NGRAM - 반출입 n-gram 검색 색인
+    op.create_table(
+        "AW01010_NGRAM",
+        sa.Column("FIELD_CD", sa.String(length=1), nullable=False, comment="검색 필드 구분"),
+        sa.Column("GRAM", sa.Unicode(length=2), nullable=False, comment="n-gram"),
+        sa.Column("DOC_NO", sa.Unicode(length=13), nullable=False, comment="반출입번호"),
+        sa.PrimaryKeyConstraint("FIELD_CD", "GRAM", "DOC_NO", name=op.f("pk_AW01010_NGRAM")),
+    )
+    op.create_index("ix_AW01010_NGRAM_DOC_NO", "AW01010_NGRAM", ["DOC_NO"])
+
+    # MSSQL 전문 검색 (Full-Text Search 기능이 설치된 인스턴스에서만 생성)
+    # CREATE FULLTEXT CATALOG/INDEX는 사용자 트랜잭션 안에서 실행할 수 없으므로 autocommit 사용
+    if _is_mssql():
+        with op.get_context().autocommit_block():
+            op.execute(
+                f"""
+                IF FULLTEXTSERVICEPROPERTY('IsFullTextInstalled') = 1
+                BEGIN
+                    IF NOT EXISTS (SELECT 1 FROM sys.fulltext_catalogs WHERE name = '{FULLTEXT_CATALOG}')
+                        CREATE FULLTEXT CATALOG {FULLTEXT_CATALOG};
+                    CREATE FULLTEXT INDEX ON AW01010_SEARCH (
+                        COMPANY_TEXT LANGUAGE 1042,
+                        MATERIAL_TEXT LANGUAGE 1042
+                    )
+                    KEY INDEX pk_AW01010_SEARCH ON {FULLTEXT_CATALOG}
+                    WITH CHANGE_TRACKING AUTO;
+                END
+                """
+            )
+
+
+def downgrade() -> None:
+    """Revert migration changes from database."""
+    if _is_mssql():
+        with op.get_context().autocommit_block():
+            op.execute(
+                f"""
+                IF EXISTS (
+                    SELECT 1 FROM sys.fulltext_indexes
+                    WHERE object_id = OBJECT_ID('AW01010_SEARCH')
+                )
+                    DROP FULLTEXT INDEX ON AW01010_SEARCH;
+                IF EXISTS (SELECT 1 FROM sys.fulltext_catalogs WHERE name = '{FULLTEXT_CATALOG}')
+                    DROP FULLTEXT CATALOG {FULLTEXT_CATALOG};
+                """
+            )
+
+    op.drop_index("ix_AW01010_NGRAM_DOC_NO", table_name="AW01010_NGRAM")
+    op.drop_table("AW01010_NGRAM")
+    op.drop_table("AW01010_SEARCH")
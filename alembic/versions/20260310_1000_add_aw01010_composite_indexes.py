@@ -0,0 +1,45 @@
+"""Add AW01010 composite indexes for list filters
+
+Revision ID: d5e9a1b2f348
+Revises: c4d8f0a1e237
+Create Date: 2026-03-10 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e9a1b2f348"
+down_revision: Union[str, None] = "c4d8f0a1e237"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Apply migration changes to database."""
+    # 사업장 + 상태 + 반출일자 범위 (목록 기본 조회 형태)
+    op.create_index(
+        "ix_AW01010_place_status_export",
+        "AW01010",
+        ["BUSI_PLACE", "STATUS", "EXPORT_DATE"],
+        mssql_include=["AUTHOR_DEPT", "IN_DATE"],
+        postgresql_include=["AUTHOR_DEPT", "IN_DATE"],
+    )
+    # 부서 + 반출일자 범위
+    op.create_index("ix_AW01010_dept_export", "AW01010", ["AUTHOR_DEPT", "EXPORT_DATE"])
+    # 등록일자 역순 정렬
+    op.create_index("ix_AW01010_in_date_desc", "AW01010", [sa.text("IN_DATE DESC")])
+
+    # 복합 인덱스의 선두 컬럼과 중복되는 단일 컬럼 인덱스 제거
+    op.drop_index("ix_AW01010_busi_place", table_name="AW01010")
+
+
+def downgrade() -> None:
+    """Revert migration changes from database."""
+    op.create_index("ix_AW01010_busi_place", "AW01010", ["BUSI_PLACE"])
+    op.drop_index("ix_AW01010_in_date_desc", table_name="AW01010")
+    op.drop_index("ix_AW01010_dept_export", table_name="AW01010")
+    op.drop_index("ix_AW01010_place_status_export", table_name="AW01010")
@@ -0,0 +1,53 @@
+"""Add AW01010 daily stat summary table
+
+Revision ID: e6f0b2c3a459
+Revises: d5e9a1b2f348
+Create Date: 2026-03-11 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f0b2c3a459"
+down_revision: Union[str, None] = "d5e9a1b2f348"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Apply migration changes to database."""
+    # AW01010_DAILY_STAT - 반출입 일별 집계 (/logistics/stats summary 원본)
+    op.create_table(
+        "AW01010_DAILY_STAT",
+        sa.Column("STAT_DATE", sa.DateTime(), nullable=False, comment="반출 일자"),
+        sa.Column("BUSI_PLACE", sa.Unicode(length=1), nullable=False, comment="반출 사업장코드"),
+        sa.Column(
+            "AUTHOR_DEPT", sa.Unicode(length=20), nullable=False, comment="작성 담당자 부서코드"
+        ),
+        sa.Column("STATUS", sa.Unicode(length=2), nullable=False, comment="상태(반출/반입)"),
+        sa.Column("TRANSPORT_TYPE", sa.Unicode(length=2), nullable=False, comment="운송 유형 코드"),
+        sa.Column("DOC_CNT", sa.Integer(), nullable=False, comment="문서 수"),
+        sa.Column(
+            "SECURITY_PENDING_CNT", sa.Integer(), nullable=False, comment="경비실 확인 대기 건수"
+        ),
+        sa.Column(
+            "RECEIVER_PENDING_CNT", sa.Integer(), nullable=False, comment="인수자 확인 대기 건수"
+        ),
+        sa.PrimaryKeyConstraint(
+            "STAT_DATE",
+            "BUSI_PLACE",
+            "AUTHOR_DEPT",
+            "STATUS",
+            "TRANSPORT_TYPE",
+            name=op.f("pk_AW01010_DAILY_STAT"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Revert migration changes from database."""
+    op.drop_table("AW01010_DAILY_STAT")
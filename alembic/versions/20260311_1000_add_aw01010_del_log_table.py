@@ -0,0 +1,43 @@
+"""Add AW01010 delete log table for incremental sync
+
+Revision ID: f7a1c3d4b56a
+Revises: e6f0b2c3a459
+Create Date: 2026-03-11 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a1c3d4b56a"
+down_revision: Union[str, None] = "e6f0b2c3a459"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Apply migration changes to database."""
+    # AW01010_DEL_LOG - 반출입 삭제 이력 (/logistics/sync tombstone)
+    op.create_table(
+        "AW01010_DEL_LOG",
+        sa.Column("LOG_SEQ", sa.Integer(), autoincrement=True, nullable=False, comment="이력 순번"),
+        sa.Column("DOC_NO", sa.Unicode(length=13), nullable=False, comment="반출입번호"),
+        sa.Column("BUSI_PLACE", sa.Unicode(length=1), nullable=False, comment="반출 사업장코드"),
+        sa.Column("DEL_DATE", sa.DateTime(), nullable=False, comment="삭제 일시"),
+        sa.Column("DEL_USER", sa.Unicode(length=50), nullable=True, comment="삭제자"),
+        sa.PrimaryKeyConstraint("LOG_SEQ", name=op.f("pk_AW01010_DEL_LOG")),
+    )
+    op.create_index("ix_AW01010_DEL_LOG_DEL_DATE", "AW01010_DEL_LOG", ["DEL_DATE"])
+
+    # 증분 동기화 - 수정일자 조건
+    op.create_index("ix_AW01010_up_date", "AW01010", ["UP_DATE"])
+
+
+def downgrade() -> None:
+    """Revert migration changes from database."""
+    op.drop_index("ix_AW01010_up_date", table_name="AW01010")
+    op.drop_index("ix_AW01010_DEL_LOG_DEL_DATE", table_name="AW01010_DEL_LOG")
+    op.drop_table("AW01010_DEL_LOG")
@@ -0,0 +1,98 @@
+"""
+BaseFormatter.format_list 벤치마크
+
+같은 입력을 기존 방식(항목마다 format()을 순서대로 await)과 새 실행 경로로 변환하여 처리 속도를 비교합니다.
+
+    - 순수 포맷터 (SimpleMockFormatter, 입력 1건 = 샘플 항목 items개)
+        - sequential: 항목마다 await format() (기존 format_list)
+        - many:       format_many() 1회 (동기 일괄 변환 경로)
+    - I/O 포맷터 (format()이 --io-ms 만큼 await, 코드명 조회 같은 외부 호출 가정)
+        - sequential:      항목마다 await format()
+        - concurrent(N):   작업자 N개가 format()을 나눠 실행
+
+사용법:
+    python -m benchmarks.bench_format_list
+    python -m benchmarks.bench_format_list --inputs 5000 --items 10 --io-ms 2 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from server.app.examples.sample_domain.formatters import SimpleMockFormatter
+from server.app.examples.sample_domain.schemas import SimpleFormatterInput
+from server.app.shared.base import BaseFormatter
+
+
+class SleepFormatter(BaseFormatter[int, int]):
+    """format()마다 io_seconds 동안 I/O를 기다리는 포맷터"""
+
+    def __init__(self, io_seconds: float) -> None:
+        self.io_seconds = io_seconds
+
+    async def format(self, input_data: int) -> int:
+        await asyncio.sleep(self.io_seconds)
+        return input_data
+
+
+def build_inputs(inputs: int, items: int) -> list[SimpleFormatterInput]:
+    rows = [
+        {
+            "id": i,
+            "name": f"샘플 {i}",
+            "description": "벤치마크 항목",
+            "category": "A",
+            "status": "active",
+        }
+        for i in range(items)
+    ]
+    return [SimpleFormatterInput(processed_items=rows, total_count=items) for _ in range(inputs)]
+
+
+async def sequential(formatter: BaseFormatter, inputs: list) -> list:
+    """기존 format_list 구현"""
+    return [await formatter.format(item) for item in inputs]
+
+
+async def _per_second(fn: Callable[[], Awaitable[list]], count: int, repeat: int) -> float:
+    await fn()  # 워밍업
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await fn()
+    return count * repeat / (time.perf_counter() - started)
+
+
+def _report(name: str, rate: float, baseline: float) -> None:
+    print(f"  {name:<16} {rate:12,.0f} inputs/s  x{rate / baseline:.1f}")
+
+
+async def run(inputs: int, items: int, repeat: int, io_ms: float, concurrency: int) -> None:
+    formatter = SimpleMockFormatter()
+    data = build_inputs(inputs, items)
+    print(f"순수 포맷터 (SimpleMockFormatter) 입력 {inputs:,}건 x 항목 {items}개 x {repeat}회")
+    baseline = await _per_second(lambda: sequential(formatter, data), inputs, repeat)
+    _report("sequential", baseline, baseline)
+    rate = await _per_second(lambda: formatter.format_list(data), inputs, repeat)
+    _report("many", rate, baseline)
+
+    io_formatter = SleepFormatter(io_ms / 1000)
+    io_inputs = list(range(max(concurrency * 4, 100)))
+    print(f"\nI/O 포맷터 (format()당 {io_ms}ms) 입력 {len(io_inputs):,}건")
+    baseline = await _per_second(lambda: sequential(io_formatter, io_inputs), len(io_inputs), 1)
+    _report("sequential", baseline, baseline)
+    rate = await _per_second(
+        lambda: io_formatter.format_list(io_inputs, concurrency=concurrency), len(io_inputs), 1
+    )
+    _report(f"concurrent({concurrency})", rate, baseline)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--inputs", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--io-ms", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(run(args.inputs, args.items, args.repeat, args.io_ms, args.concurrency))
@@ -0,0 +1,94 @@
+"""
+JSON 응답 인코딩 벤치마크
+
+반출입 목록 응답(LogisticsListResponse, 기본 5,000행)을 HTTP 본문으로 만드는 비용을
+응답 방식별로 비교합니다.
+
+    - fastapi+json:   response_model 재검증/직렬화 + 표준 JSONResponse (기존 방식)
+    - fastapi+orjson: response_model 재검증/직렬화 + FastJSONResponse (앱 기본 응답 클래스)
+    - ModelResponse:  재검증 없이 model_dump_json(by_alias=True)
+
+사용법:
+    python -m benchmarks.bench_json_response
+    python -m benchmarks.bench_json_response --rows 20000 --repeat 10
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from server.app.core.responses import FastJSONResponse, ModelResponse
+from server.app.domain.logistics.schemas import LogisticsListItemSchema, LogisticsListResponse
+
+
+def build_response(rows: int) -> LogisticsListResponse:
+    items = [
+        LogisticsListItemSchema(
+            doc_no=f"{i % 3 + 1}{i:012d}",
+            out_site=str(i % 3 + 1),
+            out_site_name=f"사업장{i % 3 + 1}",
+            department=f"D{i % 20:02d}",
+            manager="홍길동",
+            company=f"협력업체{i % 50}",
+            material="육각볼트 M10",
+            quantity=float(i % 100),
+            unit="EA",
+            security_check="N",
+            receiver_check="N",
+            status="반출",
+            reg_dt=f"2026-03-{i % 28 + 1:02d} 08:00",
+        )
+        for i in range(rows)
+    ]
+    return LogisticsListResponse(items=items, total=rows)
+
+
+async def _measure(fn: Callable[[], Awaitable[bytes]], repeat: int) -> tuple[float, int]:
+    body = await fn()  # 워밍업
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await fn()
+    return (time.perf_counter() - started) / repeat, len(body)
+
+
+async def run(rows: int, repeat: int) -> None:
+    model = build_response(rows)
+    field = create_response_field("Response_bench", LogisticsListResponse, mode="serialization")
+
+    async def fastapi_json() -> bytes:
+        content = await serialize_response(field=field, response_content=model)
+        return JSONResponse(content).body
+
+    async def fastapi_orjson() -> bytes:
+        content = await serialize_response(field=field, response_content=model)
+        return FastJSONResponse(content).body
+
+    async def model_response() -> bytes:
+        return ModelResponse(model).body
+
+    print(f"LogisticsListResponse {rows:,}행, {repeat}회 평균")
+    baseline = None
+    for name, fn in (
+        ("fastapi+json", fastapi_json),
+        ("fastapi+orjson", fastapi_orjson),
+        ("ModelResponse", model_response),
+    ):
+        seconds, size = await _measure(fn, repeat)
+        baseline = baseline or seconds
+        print(
+            f"  {name:<15} {seconds * 1000:8.2f} ms  "
+            f"{size / 1024:8.1f} KiB  x{baseline / seconds:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.repeat))
@@ -0,0 +1,89 @@
+"""
+반출입 목록 변환 벤치마크
+
+목록 Row → 목록 응답 본문(JSON bytes)까지의 처리 속도(행/초)를 비교합니다.
+
+    - validated: 행마다 LogisticsListItemSchema 생성(검증) + model_dump_json (기존 방식)
+    - construct: 행마다 model_construct(검증 생략) + model_dump_json
+                 (비교용, pydantic 2.5에서는 순수 Python 구현이라 검증 생성보다 빠르지 않음)
+    - dict:      LogisticsListFormatter camelCase dict + orjson (목록 응답 방식)
+
+DB 없이 측정하도록 목록 Row(LogisticsRepository.LIST_COLUMNS)와 같은 속성을 가진 객체를 만듭니다.
+
+사용법:
+    python -m benchmarks.bench_logistics_formatter
+    python -m benchmarks.bench_logistics_formatter --rows 20000 --repeat 10
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Callable
+
+from server.app.core.responses import FastJSONResponse
+from server.app.domain.logistics.formatters import LogisticsListFormatter
+from server.app.domain.logistics.schemas import LogisticsListItemSchema, LogisticsListResponse
+
+
+def build_rows(rows: int) -> list[SimpleNamespace]:
+    base = datetime(2026, 1, 1)
+    return [
+        SimpleNamespace(
+            doc_no=f"{i % 3 + 1}{i:012d}",
+            busi_place=str(i % 3 + 1),
+            author_dept=f"D{i % 20:02d}",
+            author_name="홍길동",
+            partner_company=f"협력업체{i % 50}",
+            security_check_yn="N",
+            receiver_check_yn="N",
+            status="반출",
+            in_date=base + timedelta(minutes=i),
+            up_date=None,
+            item_name="육각볼트 M10",
+            quantity=Decimal(i % 100 + 1),
+            unit_code="EA",
+        )
+        for i in range(rows)
+    ]
+
+
+def _rows_per_second(fn: Callable[[list], bytes], list_rows: list, repeat: int) -> float:
+    fn(list_rows[:100])  # 워밍업
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(list_rows)
+    return len(list_rows) * repeat / (time.perf_counter() - started)
+
+
+def run(rows: int, repeat: int) -> None:
+    formatter = LogisticsListFormatter()
+    list_rows = build_rows(rows)
+
+    def validated(batch: list) -> bytes:
+        items = [LogisticsListItemSchema(**formatter.to_row(h)) for h in batch]
+        return LogisticsListResponse(items=items, total=len(items)).model_dump_json(by_alias=True)
+
+    def construct(batch: list) -> bytes:
+        items = [LogisticsListItemSchema.model_construct(**formatter.to_row(h)) for h in batch]
+        response = LogisticsListResponse.model_construct(items=items, total=len(items))
+        return response.model_dump_json(by_alias=True)
+
+    def as_dict(batch: list) -> bytes:
+        return FastJSONResponse(formatter.format(batch)).body
+
+    print(f"반출입 목록 변환 + 직렬화 {rows:,}행 x {repeat}회")
+    baseline = None
+    for name, fn in (("validated", validated), ("construct", construct), ("dict", as_dict)):
+        rate = _rows_per_second(fn, list_rows, repeat)
+        baseline = baseline or rate
+        print(f"  {name:<10} {rate:12,.0f} rows/s  x{rate / baseline:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
@@ -0,0 +1,345 @@
+"""
+API 핫패스 벤치마크 (로그인 / 반출입 목록·상세·등록·수정 / 공통 사업장·부서)
+
+시드 고정 로컬 DB(benchmarks.seed)를 만들고, 애플리케이션을 프로세스 내 ASGI로 호출하여
+시나리오별 지연시간(mean/p50/p95/p99), 처리량(요청/초), 요청당 쿼리 수를 측정합니다.
+결과는 JSON으로 출력하므로 커밋 간 결과 파일을 비교(--compare)할 수 있습니다.
+
+    - 요청은 순차 실행합니다. (동시 부하 측정은 부하 생성기를 사용)
+    - 로그인 속도 제한(5회/분)에 걸리지 않도록 속도 제한 미들웨어 없이 앱을 생성합니다.
+    - get_db만 벤치마크 DB 세션 팩토리로 오버라이드하며, 나머지 미들웨어/라우트는 운영과 같습니다.
+    - 쿼리 수는 엔진의 before_cursor_execute 이벤트로 셉니다.
+    - 요청 로그 출력이 측정값에 섞이지 않도록 INFO 이하 로그는 끕니다.
+
+사용법:
+    python -m benchmarks.run_benchmarks --output bench-before.json
+    python -m benchmarks.run_benchmarks --docs 20000 --iterations 200 --output bench-after.json \\
+        --compare bench-before.json
+    python -m benchmarks.run_benchmarks --scenario list --scenario detail
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from fastapi import FastAPI
+from httpx import AsyncClient, Response
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from benchmarks.seed import SeedConfig, create_schema, doc_no, seed_database, user_id
+from server.app.core.config import settings
+from server.app.core.database import LazyAsyncSession, get_db
+
+API = settings.API_V1_PREFIX
+
+
+@dataclass
+class BenchContext:
+    """시나리오 실행 상태 (클라이언트, 시드 설정, 난수, 인증 헤더)"""
+
+    client: AsyncClient
+    config: SeedConfig
+    rng: random.Random
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def random_doc_no(self) -> str:
+        return doc_no(self.rng.randrange(self.config.docs), self.config)
+
+    def random_site(self) -> str:
+        return str(self.rng.randrange(self.config.sites) + 1)
+
+
+def document_body(ctx: BenchContext) -> dict[str, Any]:
+    site = ctx.random_site()
+    return {
+        "busiPlace": site,
+        "exportDate": "2026-03-10",
+        "authorName": "벤치",
+        "authorDept": f"{site}D00",
+        "partnerCompany": f"협력업체{ctx.rng.randrange(ctx.config.companies):03d}",
+        "transportType": "01",
+        "items": [
+            {"itemName": f"육각볼트 {n}", "quantity": n + 1, "unitCode": "EA"} for n in range(3)
+        ],
+    }
+
+
+async def scenario_login(ctx: BenchContext) -> Response:
+    login_id = user_id(ctx.rng.randrange(ctx.config.users))
+    body = {"loginId": login_id, "password": ctx.config.password}
+    return await ctx.client.post(f"{API}/auth/login", json=body)
+
+
+async def scenario_list(ctx: BenchContext) -> Response:
+    params = {"outSite": ctx.random_site()}
+    return await ctx.client.get(f"{API}/logistics", params=params, headers=ctx.headers)
+
+
+async def scenario_list_filtered(ctx: BenchContext) -> Response:
+    params = {
+        "outSite": ctx.random_site(),
+        "company": f"협력업체{ctx.rng.randrange(ctx.config.companies):03d}",
+        "startDate": "2025-07-01",
+        "endDate": "2025-12-31",
+    }
+    return await ctx.client.get(f"{API}/logistics", params=params, headers=ctx.headers)
+
+
+async def scenario_detail(ctx: BenchContext) -> Response:
+    return await ctx.client.get(f"{API}/logistics/{ctx.random_doc_no()}", headers=ctx.headers)
+
+
+async def scenario_create(ctx: BenchContext) -> Response:
+    return await ctx.client.post(f"{API}/logistics", json=document_body(ctx), headers=ctx.headers)
+
+
+async def scenario_update(ctx: BenchContext) -> Response:
+    body = {"status": ctx.rng.choice(["반출", "반입"]), "receiverCheckYn": ctx.rng.choice("YN")}
+    return await ctx.client.put(
+        f"{API}/logistics/{ctx.random_doc_no()}", json=body, headers=ctx.headers
+    )
+
+
+async def scenario_sites_depts(ctx: BenchContext) -> Response:
+    return await ctx.client.get(f"{API}/common/sites-depts", headers=ctx.headers)
+
+
+SCENARIOS: dict[str, Callable[[BenchContext], Awaitable[Response]]] = {
+    "login": scenario_login,
+    "list": scenario_list,
+    "list_filtered": scenario_list_filtered,
+    "detail": scenario_detail,
+    "create": scenario_create,
+    "update": scenario_update,
+    "sites_depts": scenario_sites_depts,
+}
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies: list[float], elapsed: float, queries: int, errors: int, size: int) -> dict:
+    """시나리오 측정값 요약 (지연시간 단위: ms)"""
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "iterations": count,
+        "errors": errors,
+        "mean_ms": round(sum(ordered) / count, 3) if count else 0.0,
+        "p50_ms": round(percentile(ordered, 50), 3),
+        "p95_ms": round(percentile(ordered, 95), 3),
+        "p99_ms": round(percentile(ordered, 99), 3),
+        "max_ms": round(ordered[-1], 3) if count else 0.0,
+        "rps": round(count / elapsed, 1) if elapsed else 0.0,
+        "queries_per_request": round(queries / count, 2) if count else 0.0,
+        "bytes_per_request": size // count if count else 0,
+    }
+
+
+async def run_scenario(
+    ctx: BenchContext,
+    scenario: Callable[[BenchContext], Awaitable[Response]],
+    counter: list[int],
+    iterations: int,
+    warmup: int,
+) -> dict:
+    for _ in range(warmup):
+        await scenario(ctx)
+
+    latencies: list[float] = []
+    errors = size = 0
+    counter[0] = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        request_started = time.perf_counter()
+        response = await scenario(ctx)
+        latencies.append((time.perf_counter() - request_started) * 1000)
+        size += len(response.content)
+        if response.status_code >= 400:
+            errors += 1
+    elapsed = time.perf_counter() - started
+    return summarize(latencies, elapsed, counter[0], errors, size)
+
+
+def create_bench_app(session_factory: async_sessionmaker[AsyncSession]) -> FastAPI:
+    """
+    벤치마크 DB 세션을 사용하는 애플리케이션을 생성합니다.
+
+    로그인 시나리오가 5회/분 제한에 걸리지 않도록 속도 제한 없이 생성하고,
+    요청 로그 출력이 측정값에 섞이지 않도록 INFO 이하 로그를 끕니다.
+    """
+    settings.RATE_LIMIT_ENABLED = False
+    from server.main import create_application
+
+    app = create_application()
+    logging.disable(logging.INFO)
+
+    async def override_get_db():
+        session = LazyAsyncSession(session_factory)
+        try:
+            yield session
+        finally:
+            await session.release()
+
+    app.dependency_overrides[get_db] = override_get_db
+    return app
+
+
+async def login_headers(ctx: BenchContext) -> dict[str, str]:
+    """시드 사용자로 로그인하여 인증 헤더를 만듭니다."""
+    login = await scenario_login(ctx)
+    login.raise_for_status()
+    return {"Authorization": f"Bearer {login.json()['accessToken']}"}
+
+
+def git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+async def run(
+    url: str, config: SeedConfig, scenarios: list[str], iterations: int, warmup: int
+) -> dict:
+    engine = create_async_engine(url)
+    counter = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count_query(*_args: Any) -> None:
+        counter[0] += 1
+
+    await create_schema(engine)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+    async with session_factory() as session:
+        counts = await seed_database(session, config)
+
+    app = create_bench_app(session_factory)
+    results: dict[str, dict] = {}
+    try:
+        async with AsyncClient(app=app, base_url="http://bench") as client:
+            ctx = BenchContext(client=client, config=config, rng=random.Random(config.seed))
+            ctx.headers = await login_headers(ctx)
+
+            for name in scenarios:
+                results[name] = await run_scenario(ctx, SCENARIOS[name], counter, iterations, warmup)
+                print(f"  {name:<14} {_format_result(results[name])}", file=sys.stderr)
+    finally:
+        await engine.dispose()
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": engine.url.render_as_string(hide_password=True),
+            "iterations": iterations,
+            "warmup": warmup,
+            "seed": config.to_dict(),
+            "rows": counts,
+        },
+        "results": results,
+    }
+
+
+def _format_result(result: dict) -> str:
+    return (
+        f"p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms  "
+        f"p99 {result['p99_ms']:8.2f}ms  {result['rps']:8.1f} req/s  "
+        f"{result['queries_per_request']:5.2f} q/req  err {result['errors']}"
+    )
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    기준 결과 대비 p95 지연시간/요청당 쿼리 수를 비교하여 출력하고, 회귀한 시나리오 목록을 반환합니다.
+
+    Args:
+        current: 이번 실행 결과
+        baseline: 기준 결과 (--output으로 저장한 JSON)
+        threshold: 회귀로 판단할 p95 증가 비율 (0.2 = 20%)
+    """
+    regressions = []
+    commits = f"{baseline['meta'].get('commit')} → {current['meta'].get('commit')}"
+    print(f"기준 → 현재: {commits}", file=sys.stderr)
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = result["p95_ms"] / before["p95_ms"] - 1 if before["p95_ms"] else 0.0
+        query_delta = result["queries_per_request"] - before["queries_per_request"]
+        regressed = ratio > threshold or query_delta > 0
+        if regressed:
+            regressions.append(name)
+        print(
+            f"  {name:<14} p95 {before['p95_ms']:8.2f} → {result['p95_ms']:8.2f}ms ({ratio:+.1%})  "
+            f"q/req {before['queries_per_request']:.2f} → {result['queries_per_request']:.2f}"
+            f"{'  ⚠️ 회귀' if regressed else ''}",
+            file=sys.stderr,
+        )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="벤치마크 DB URL (기본값: 임시 디렉터리의 SQLite 파일)")
+    parser.add_argument("--docs", type=int, default=SeedConfig.docs)
+    parser.add_argument("--users", type=int, default=SeedConfig.users)
+    parser.add_argument("--seed", type=int, default=SeedConfig.seed)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS))
+    parser.add_argument("--output", type=Path, help="결과 JSON 파일 (기본값: 표준 출력)")
+    parser.add_argument("--compare", type=Path, help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=0.2, help="p95 회귀 판단 비율")
+    args = parser.parse_args()
+
+    config = SeedConfig(docs=args.docs, users=args.users, seed=args.seed)
+    scenarios = args.scenario or list(SCENARIOS)
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        print(
+            f"벤치마크: {config.docs:,}건, {args.iterations}회 x {len(scenarios)}개 시나리오",
+            file=sys.stderr,
+        )
+        result = asyncio.run(run(url, config, scenarios, args.iterations, args.warmup))
+
+    output = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if compare(result, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
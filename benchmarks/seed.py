@@ -0,0 +1,278 @@
+"""
+벤치마크용 로컬 DB 시드 생성기
+
+벤치마크 대상 테이블만 SQLite(aiosqlite)에 생성하고, 시드 고정 난수로 같은 데이터를 만듭니다.
+같은 SeedConfig이면 커밋이 달라도 같은 데이터로 측정되므로 결과를 커밋 간에 비교할 수 있습니다.
+
+    - 사용자/권한: ST00400, TB_ROLE, TB_USER_ROLE (비밀번호는 모두 SeedConfig.password)
+    - 공통코드: CM_BusiPlace, CM_CodeMaster, CM_CodeDetail (부서 MT20, 단위 MT35, 운송유형 MT16)
+    - 반출입: AW01010, AW01011 (+ 검색 색인/일별 집계/삭제 이력 테이블)
+
+MSSQL 전용 기본값(GETDATE())은 SQLite DDL로 만들 수 없어,
+테이블을 복사한 메타데이터에서 CURRENT_TIMESTAMP로 바꿔 생성합니다. (모델 메타데이터는 변경하지 않음)
+
+사용법:
+    python -m benchmarks.seed --docs 20000 --url sqlite+aiosqlite:///bench.db
+"""
+
+import argparse
+import asyncio
+import random
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import DefaultClause, MetaData, insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from server.app.domain.auth.calculators import PasswordCalculator
+from server.app.domain.auth.models import (
+    CmBusiPlace,
+    CmCodeDetail,
+    CmCodeMaster,
+    St00400,
+    TbRole,
+    TbUserRole,
+)
+from server.app.domain.logistics.models import (
+    Aw01010,
+    Aw01010DailyStat,
+    Aw01010DelLog,
+    Aw01010Ngram,
+    Aw01010Search,
+    Aw01011,
+)
+from server.app.domain.logistics.repositories.stats_repository import LogisticsStatsRepository
+
+COMP_CD = "01"
+BATCH_SIZE = 1000
+
+BENCH_TABLES = [
+    St00400.__table__,
+    TbRole.__table__,
+    TbUserRole.__table__,
+    CmBusiPlace.__table__,
+    CmCodeMaster.__table__,
+    CmCodeDetail.__table__,
+    Aw01010.__table__,
+    Aw01011.__table__,
+    Aw01010Search.__table__,
+    Aw01010Ngram.__table__,
+    Aw01010DailyStat.__table__,
+    Aw01010DelLog.__table__,
+]
+
+UNITS = ["EA", "BOX", "SET", "KG", "M"]
+TRANSPORT_TYPES = ["01", "02", "03"]
+MATERIALS = ["육각볼트", "너트", "베어링", "모터", "케이블", "센서", "PCB", "금형", "치공구", "필터"]
+STATUSES = ["반출", "반입"]
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    """시드 데이터 규모 설정"""
+
+    docs: int = 5000
+    max_items_per_doc: int = 5
+    users: int = 50
+    sites: int = 3
+    depts_per_site: int = 10
+    companies: int = 200
+    days: int = 365
+    seed: int = 42
+    password: str = "bench1234"
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def user_id(index: int) -> str:
+    """시드 사용자 ID (B00001 형식)"""
+    return f"B{index + 1:05d}"
+
+
+def doc_no(index: int, config: SeedConfig) -> str:
+    """시드 반출입번호 (사업장코드 + 12자리 순번)"""
+    return f"{index % config.sites + 1}{index + 1:012d}"
+
+
+def _sqlite_metadata() -> MetaData:
+    """벤치마크 테이블 복사본 (GETDATE() 기본값 → CURRENT_TIMESTAMP)"""
+    metadata = MetaData()
+    for table in BENCH_TABLES:
+        copied = table.to_metadata(metadata)
+        for column in copied.columns:
+            default = column.server_default
+            if default is not None and "GETDATE" in str(getattr(default, "arg", "")).upper():
+                column.server_default = DefaultClause(text("CURRENT_TIMESTAMP"))
+    return metadata
+
+
+async def create_schema(engine: AsyncEngine) -> None:
+    """벤치마크 테이블을 새로 생성합니다. (기존 테이블은 삭제)"""
+    metadata = _sqlite_metadata()
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+
+
+async def _insert_many(session: AsyncSession, model: Any, rows: list[dict]) -> None:
+    for start in range(0, len(rows), BATCH_SIZE):
+        await session.execute(insert(model), rows[start : start + BATCH_SIZE])
+
+
+def _users(config: SeedConfig, now: datetime) -> tuple[list[dict], list[dict], list[dict]]:
+    password = PasswordCalculator.encode(config.password)
+    users = [
+        {
+            "user_id": user_id(i),
+            "user_name": f"벤치{i + 1}",
+            "password": password,
+            "emp_no": user_id(i),
+            "use_yn": "Y",
+            "ext_char1": f"D{i % config.depts_per_site:02d}",
+        }
+        for i in range(config.users)
+    ]
+    roles = [
+        {"role_id": 1, "role_cd": "ADMIN", "role_nm": "관리자", "create_dt": now, "create_user": "bench"},
+        {"role_id": 2, "role_cd": "USER", "role_nm": "사용자", "create_dt": now, "create_user": "bench"},
+    ]
+    user_roles = [
+        {
+            "user_id": user_id(i),
+            "role_id": 1 if i == 0 else 2,
+            "grant_dt": now,
+            "grant_user": "bench",
+            "use_yn": "Y",
+        }
+        for i in range(config.users)
+    ]
+    return users, roles, user_roles
+
+
+def _codes(config: SeedConfig, now: datetime) -> tuple[list[dict], list[dict], list[dict]]:
+    sites = [
+        {"comp_cd": COMP_CD, "busi_place": str(s + 1), "busi_place_name": f"사업장{s + 1}"}
+        for s in range(config.sites)
+    ]
+    masters = [
+        {"comp_cd": COMP_CD, "code_type": code_type, "code_type_name": name, "in_date": now}
+        for code_type, name in (("MT20", "부서"), ("MT35", "단위"), ("MT16", "운송유형"))
+    ]
+
+    def detail(code_type: str, code: str, name: str, seq: int, site: str | None = None) -> dict:
+        return {
+            "comp_cd": COMP_CD,
+            "code_type": code_type,
+            "code": code,
+            "code_name": name,
+            "sort_seq": seq,
+            "use_yn": "Y",
+            "mgt_char1": site,
+            "in_date": now,
+        }
+
+    details = [
+        detail("MT20", f"{s + 1}D{d:02d}", f"부서{s + 1}-{d}", d, str(s + 1))
+        for s in range(config.sites)
+        for d in range(config.depts_per_site)
+    ]
+    details += [detail("MT35", unit, unit, i) for i, unit in enumerate(UNITS)]
+    details += [detail("MT16", code, f"운송{code}", i) for i, code in enumerate(TRANSPORT_TYPES)]
+    return sites, masters, details
+
+
+def _documents(config: SeedConfig, now: datetime) -> tuple[list[dict], list[dict]]:
+    rng = random.Random(config.seed)
+    start = now - timedelta(days=config.days)
+    headers: list[dict] = []
+    items: list[dict] = []
+    for i in range(config.docs):
+        number = doc_no(i, config)
+        site = number[0]
+        in_date = start + timedelta(seconds=rng.randrange(config.days * 86400))
+        headers.append(
+            {
+                "doc_no": number,
+                "busi_place": site,
+                "export_date": in_date.replace(hour=0, minute=0, second=0),
+                "author_name": f"벤치{rng.randrange(config.users) + 1}",
+                "author_dept": f"{site}D{rng.randrange(config.depts_per_site):02d}",
+                "partner_company": f"협력업체{rng.randrange(config.companies):03d}",
+                "transport_type": rng.choice(TRANSPORT_TYPES),
+                "status": rng.choice(STATUSES),
+                "security_check_yn": rng.choice("YN"),
+                "receiver_check_yn": rng.choice("YN"),
+                "in_date": in_date,
+                "in_user": user_id(rng.randrange(config.users)),
+            }
+        )
+        for seq in range(1, rng.randint(1, config.max_items_per_doc) + 1):
+            items.append(
+                {
+                    "doc_no": number,
+                    "item_seq": seq,
+                    "item_name": f"{rng.choice(MATERIALS)} {rng.randrange(100):02d}",
+                    "unit_code": rng.choice(UNITS),
+                    "quantity": rng.randint(1, 500),
+                }
+            )
+    return headers, items
+
+
+async def seed_database(session: AsyncSession, config: SeedConfig) -> dict[str, int]:
+    """
+    시드 데이터를 입력하고 테이블별 행 수를 반환합니다.
+
+    Args:
+        session: create_schema로 테이블을 만든 DB 세션
+        config: 데이터 규모
+    """
+    now = datetime(2026, 1, 1)  # 고정 기준 시각 (실행 시각과 무관하게 같은 데이터)
+    users, roles, user_roles = _users(config, now)
+    sites, masters, details = _codes(config, now)
+    headers, items = _documents(config, now)
+
+    for model, rows in (
+        (St00400, users),
+        (TbRole, roles),
+        (TbUserRole, user_roles),
+        (CmBusiPlace, sites),
+        (CmCodeMaster, masters),
+        (CmCodeDetail, details),
+        (Aw01010, headers),
+        (Aw01011, items),
+    ):
+        await _insert_many(session, model, rows)
+    stat_rows = await LogisticsStatsRepository(session).rebuild()
+    await session.commit()
+
+    return {
+        "users": len(users),
+        "codes": len(details),
+        "docs": len(headers),
+        "items": len(items),
+        "daily_stats": stat_rows,
+    }
+
+
+async def _main(url: str, config: SeedConfig) -> None:
+    engine = create_async_engine(url)
+    try:
+        await create_schema(engine)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            counts = await seed_database(session, config)
+    finally:
+        await engine.dispose()
+    print(f"✅ 시드 생성 완료: {url} {counts}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="sqlite+aiosqlite:///bench.db")
+    parser.add_argument("--docs", type=int, default=SeedConfig.docs)
+    parser.add_argument("--users", type=int, default=SeedConfig.users)
+    parser.add_argument("--seed", type=int, default=SeedConfig.seed)
+    args = parser.parse_args()
+    asyncio.run(_main(args.url, SeedConfig(docs=args.docs, users=args.users, seed=args.seed)))
@@ -1,5 +1,5 @@
 import { apiClient } from '@/core/api/client';
-import type { NoticeListResponse, PopupNoticeListResponse } from './types';
+import type { Notice, NoticeListResponse, PopupNoticeListResponse } from './types';
 
 export const boardApi = {
   getPopupNotices: async (): Promise<PopupNoticeListResponse> => {
@@ -7,8 +7,17 @@ export const boardApi = {
     return response.data;
   },
 
-  getNotices: async (): Promise<NoticeListResponse> => {
-    const response = await apiClient.get<NoticeListResponse>('/v1/board/notices');
+  getNotices: async (page = 1, size = 20): Promise<NoticeListResponse> => {
+    const response = await apiClient.get<NoticeListResponse>('/v1/board/notices', {
+      params: { page, size },
+    });
+    return response.data;
+  },
+
+  getNotice: async (projectCd: string, menuCd: string, boardSeq: string): Promise<Notice> => {
+    const response = await apiClient.get<Notice>(
+      `/v1/board/notices/${encodeURIComponent(projectCd)}/${encodeURIComponent(menuCd)}/${encodeURIComponent(boardSeq)}`,
+    );
     return response.data;
   },
 };
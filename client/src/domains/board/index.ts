@@ -1,4 +1,10 @@
 export { NoticePopup } from './components/NoticePopup';
 export { NoticePage } from './pages/NoticePage';
 export { boardApi } from './api';
-export type { Notice, NoticeListResponse, PopupNotice, PopupNoticeListResponse } from './types';
+export type {
+  Notice,
+  NoticeListResponse,
+  NoticeSummary,
+  PopupNotice,
+  PopupNoticeListResponse,
+} from './types';
@@ -12,7 +12,9 @@ import {
 } from 'lucide-react';
 import { useAuthStore } from '@/core/store/useAuthStore';
 import { boardApi } from '../api';
-import type { Notice } from '../types';
+import type { NoticeSummary } from '../types';
+
+const PAGE_SIZE = 20;
 
 const SIDEBAR_NAV = [
   { icon: Home, label: '홈', active: false, path: '/' },
@@ -42,25 +44,40 @@ function isNew(regDt: string | null): boolean {
 export function NoticePage() {
   const { user, logout } = useAuthStore();
   const navigate = useNavigate();
-  const [notices, setNotices] = useState<Notice[]>([]);
+  const [notices, setNotices] = useState<NoticeSummary[]>([]);
+  const [page, setPage] = useState(1);
+  const [total, setTotal] = useState(0);
   const [loading, setLoading] = useState(true);
   const [expandedSeq, setExpandedSeq] = useState<string | null>(null);
+  // 본문은 펼칠 때 상세 API로 조회 (key → 본문)
+  const [bodies, setBodies] = useState<Record<string, string | null>>({});
 
   useEffect(() => {
+    setLoading(true);
     boardApi
-      .getNotices()
-      .then((res) => setNotices(res.notices))
-      .catch(() => setNotices([]))
+      .getNotices(page, PAGE_SIZE)
+      .then((res) => {
+        setNotices((prev) => (page === 1 ? res.notices : [...prev, ...res.notices]));
+        setTotal(res.total);
+      })
+      .catch(() => {
+        if (page === 1) setNotices([]);
+      })
       .finally(() => setLoading(false));
-  }, []);
+  }, [page]);
 
   const handleLogout = async () => {
     await logout();
     navigate('/login');
   };
 
-  const toggleExpand = (seq: string | null) => {
-    setExpandedSeq((prev) => (prev === seq ? null : seq));
+  const toggleExpand = (key: string, notice: NoticeSummary) => {
+    setExpandedSeq((prev) => (prev === key ? null : key));
+    if (key in bodies || !notice.boardSeq) return;
+    boardApi
+      .getNotice(notice.projectCd, notice.menuCd, notice.boardSeq)
+      .then((detail) => setBodies((prev) => ({ ...prev, [key]: detail.boardTxt })))
+      .catch(() => setBodies((prev) => ({ ...prev, [key]: null })));
   };
 
   return (
@@ -147,7 +164,7 @@ export function NoticePage() {
 
             {/* Notice List */}
             <div className="flex flex-col">
-              {loading && (
+              {loading && notices.length === 0 && (
                 <div className="py-16 text-center text-sm text-slate-400">불러오는 중...</div>
               )}
 
@@ -155,60 +172,70 @@ export function NoticePage() {
                 <div className="py-16 text-center text-sm text-slate-400">공지사항이 없습니다.</div>
               )}
 
-              {!loading &&
-                notices.map((notice) => {
-                  const key = notice.boardSeq ?? notice.boardTitle ?? '';
-                  const expanded = expandedSeq === key;
+              {notices.map((notice) => {
+                const key = `${notice.projectCd}/${notice.menuCd}/${notice.boardSeq ?? ''}`;
+                const expanded = expandedSeq === key;
 
-                  return (
-                    <div
-                      key={key}
-                      className="border-b border-slate-100 last:border-b-0"
+                return (
+                  <div
+                    key={key}
+                    className="border-b border-slate-100 last:border-b-0"
+                  >
+                    {/* 제목 행 (클릭 시 내용 토글) */}
+                    <button
+                      type="button"
+                      onClick={() => toggleExpand(key, notice)}
+                      className="flex w-full cursor-pointer items-start justify-between px-4 py-5 text-left transition-colors hover:bg-slate-50 active:bg-slate-50"
                     >
-                      {/* 제목 행 (클릭 시 내용 토글) */}
-                      <button
-                        type="button"
-                        onClick={() => toggleExpand(key)}
-                        className="flex w-full cursor-pointer items-start justify-between px-4 py-5 text-left transition-colors hover:bg-slate-50 active:bg-slate-50"
-                      >
-                        <div className="flex flex-col gap-1 pr-4">
-                          <div className="flex items-center gap-2">
-                            {notice.importYn === 'Y' && (
-                              <span className="shrink-0 rounded-sm bg-seah-orange-500 px-1.5 py-0.5 text-[10px] font-bold text-white">
-                                중요
-                              </span>
-                            )}
-                            <h3 className="text-[15px] font-bold leading-snug text-seah-gray-500">
-                              {notice.boardTitle ?? '(제목 없음)'}
-                            </h3>
-                            {isNew(notice.regDt) && (
-                              <span className="shrink-0 rounded-sm bg-seah-orange-500/10 px-1.5 py-0.5 text-[10px] font-bold text-seah-orange-500">
-                                NEW
-                              </span>
-                            )}
-                          </div>
-                          <span className="text-xs text-slate-400">{formatDate(notice.regDt)}</span>
-                        </div>
-                        <ChevronDown
-                          size={18}
-                          className={[
-                            'mt-0.5 shrink-0 text-slate-400 transition-transform duration-200',
-                            expanded ? 'rotate-180' : '',
-                          ].join(' ')}
-                        />
-                      </button>
-
-                      {/* 내용 (아코디언) */}
-                      {expanded && (
-                        <div className="border-t border-slate-100 bg-slate-50 px-4 py-4">
-                          <p className="whitespace-pre-wrap text-sm leading-relaxed text-slate-600">
-                            {notice.boardTxt ?? '내용이 없습니다.'}
-                          </p>
+                      <div className="flex flex-col gap-1 pr-4">
+                        <div className="flex items-center gap-2">
+                          {notice.importYn === 'Y' && (
+                            <span className="shrink-0 rounded-sm bg-seah-orange-500 px-1.5 py-0.5 text-[10px] font-bold text-white">
+                              중요
+                            </span>
+                          )}
+                          <h3 className="text-[15px] font-bold leading-snug text-seah-gray-500">
+                            {notice.boardTitle ?? '(제목 없음)'}
+                          </h3>
+                          {isNew(notice.regDt) && (
+                            <span className="shrink-0 rounded-sm bg-seah-orange-500/10 px-1.5 py-0.5 text-[10px] font-bold text-seah-orange-500">
+                              NEW
+                            </span>
+                          )}
                         </div>
-                      )}
-                    </div>
-                  );
-                })}
+                        <span className="text-xs text-slate-400">{formatDate(notice.regDt)}</span>
+                      </div>
+                      <ChevronDown
+                        size={18}
+                        className={[
+                          'mt-0.5 shrink-0 text-slate-400 transition-transform duration-200',
+                          expanded ? 'rotate-180' : '',
+                        ].join(' ')}
+                      />
+                    </button>
+
+                    {/* 내용 (아코디언) */}
+                    {expanded && (
+                      <div className="border-t border-slate-100 bg-slate-50 px-4 py-4">
+                        <p className="whitespace-pre-wrap text-sm leading-relaxed text-slate-600">
+                          {key in bodies ? (bodies[key] ?? '내용이 없습니다.') : '불러오는 중...'}
+                        </p>
+                      </div>
+                    )}
+                  </div>
+                );
+              })}
+
+              {notices.length < total && (
+                <button
+                  type="button"
+                  onClick={() => setPage((prev) => prev + 1)}
+                  disabled={loading}
+                  className="border-t border-slate-100 py-4 text-sm font-medium text-slate-500 transition-colors hover:bg-slate-50 disabled:text-slate-300"
+                >
+                  {loading ? '불러오는 중...' : '더보기'}
+                </button>
+              )}
             </div>
           </div>
         </main>
@@ -9,14 +9,25 @@ export interface PopupNoticeListResponse {
   notices: PopupNotice[];
 }
 
-export interface Notice {
+export interface NoticeSummary {
+  projectCd: string;
+  menuCd: string;
   boardSeq: string | null;
   boardTitle: string | null;
-  boardTxt: string | null;
   importYn: string | null;
+  popupYn: string | null;
+  boardCategory: string | null;
   regDt: string | null;
+  modDt: string | null;
+}
+
+export interface Notice extends NoticeSummary {
+  boardTxt: string | null;
 }
 
 export interface NoticeListResponse {
-  notices: Notice[];
+  notices: NoticeSummary[];
+  total: number;
+  page: number;
+  size: number;
 }
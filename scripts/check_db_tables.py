@@ -1,10 +1,10 @@
 import asyncio
 import os
 from sqlalchemy import text
-from server.app.core.database import engine
+from server.app.core.database import get_engine
 
 async def check_tables():
-    async with engine.connect() as conn:
+    async with get_engine().connect() as conn:
         # Get list of tables in MSSQL
         result = await conn.execute(text("SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_TYPE = 'BASE TABLE'"))
         tables = [row[0] for row in result.fetchall()]
@@ -0,0 +1,106 @@
+"""
+import 시간 프로파일러
+
+`python -X importtime`으로 모듈을 새 프로세스에서 import하고,
+누적 시간 상위 모듈 / 최상위 패키지별 자체 시간 합계를 출력합니다.
+워커 기동 시간과 테스트 수집 시간을 늘리는 import를 찾을 때 사용합니다.
+
+사용법:
+    python -m scripts.profile_imports
+    python -m scripts.profile_imports --module server.app.core.database --top 30
+    python -m scripts.profile_imports --json > imports.json
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """모듈 1개의 import 시간 (마이크로초)"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """-X importtime 출력(stderr)을 파싱합니다."""
+    timings = []
+    for line in output.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(
+                ImportTiming(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return timings
+
+
+def by_package(timings: list[ImportTiming]) -> dict[str, int]:
+    """최상위 패키지별 자체 시간 합계 (내림차순)"""
+    totals: dict[str, int] = defaultdict(int)
+    for timing in timings:
+        totals[timing.module.split(".")[0]] += timing.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def profile(module: str) -> tuple[list[ImportTiming], float]:
+    """새 인터프리터에서 module을 import하고 (시간 목록, 전체 소요 초)를 반환합니다."""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise SystemExit(result.stderr.strip().splitlines()[-1])
+    return parse_importtime(result.stderr), elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="server.main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    timings, elapsed = profile(args.module)
+    root = next((t for t in timings if t.module == args.module), None)
+    slowest = sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[: args.top]
+    packages = by_package(timings)
+
+    if args.json:
+        report = {
+            "module": args.module,
+            "process_seconds": round(elapsed, 3),
+            "import_ms": round(root.cumulative_us / 1000, 1) if root else None,
+            "modules": len(timings),
+            "slowest": [asdict(t) for t in slowest],
+            "packages_self_us": packages,
+        }
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    import_ms = root.cumulative_us / 1000 if root else 0
+    print(f"⏱️  import {args.module}: {import_ms:.1f}ms (프로세스 {elapsed:.2f}s, 모듈 {len(timings)}개)")
+    print(f"\n누적 시간 상위 {args.top}")
+    for t in slowest:
+        print(f"  {t.cumulative_us / 1000:9.1f}ms  {t.self_us / 1000:8.1f}ms  {'  ' * t.depth}{t.module}")
+    print("\n패키지별 자체 시간")
+    for package, self_us in list(packages.items())[: args.top]:
+        print(f"  {self_us / 1000:9.1f}ms  {package}")
+
+
+if __name__ == "__main__":
+    main()
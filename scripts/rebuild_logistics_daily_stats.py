@@ -0,0 +1,27 @@
+"""
+반출입 일별 집계(AW01010_DAILY_STAT) 재생성 스크립트
+
+집계 테이블 마이그레이션 적용 후, 기존 문서를 집계하기 위해 1회 실행합니다.
+실행 후 .env의 LOGISTICS_STATS_SOURCE를 summary로 전환하세요.
+
+사용법:
+    python -m scripts.rebuild_logistics_daily_stats
+"""
+
+import asyncio
+
+from server.app.core.database import get_session_factory
+from server.app.domain.logistics.repositories.stats_repository import (
+    LogisticsStatsRepository,
+)
+
+
+async def rebuild_daily_stats():
+    async with get_session_factory()() as session:
+        count = await LogisticsStatsRepository(session).rebuild()
+        await session.commit()
+        print(f"✅ 반출입 일별 집계 재생성 완료: {count}행")
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_daily_stats())
@@ -0,0 +1,27 @@
+"""
+반출입 검색 색인(AW01010_SEARCH, AW01010_NGRAM) 재생성 스크립트
+
+색인 테이블 마이그레이션 적용 후, 기존 문서를 색인하기 위해 1회 실행합니다.
+실행 후 .env의 LOGISTICS_SEARCH_MODE를 ngram 또는 fulltext로 전환하세요.
+
+사용법:
+    python -m scripts.rebuild_logistics_search_index
+"""
+
+import asyncio
+
+from server.app.core.database import get_session_factory
+from server.app.domain.logistics.repositories.search_repository import (
+    LogisticsSearchRepository,
+)
+
+
+async def rebuild_index():
+    async with get_session_factory()() as session:
+        count = await LogisticsSearchRepository(session).rebuild()
+        await session.commit()
+        print(f"✅ 반출입 검색 색인 재생성 완료: {count}건")
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_index())
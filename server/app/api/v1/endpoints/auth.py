@@ -8,13 +8,22 @@ import logging
 from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from server.app.core.dependencies import get_current_user, get_database_session
+from server.app.core.dependencies import (
+    SessionReleasingRoute,
+    get_current_user,
+    get_database_session,
+)
+from server.app.core.rate_limit import enforce_login_rate_limit
 from server.app.domain.auth.schemas import LoginRequest, LoginResponse
 from server.app.domain.auth.service import AuthService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/auth", tags=["auth"])
+router = APIRouter(
+    prefix="/auth",
+    tags=["auth"],
+    route_class=SessionReleasingRoute,
+)
 
 
 @router.post(
@@ -24,6 +33,7 @@ router = APIRouter(prefix="/auth", tags=["auth"])
     summary="로그인",
     description="사용자 ID와 비밀번호로 로그인하여 JWT 토큰을 발급받습니다.",
     response_model_by_alias=True,
+    dependencies=[Depends(enforce_login_rate_limit)],
 )
 async def login(
     request: LoginRequest,
@@ -5,16 +5,28 @@ Board API 엔드포인트
 
 import logging
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from server.app.core.dependencies import get_current_user, get_database_session
-from server.app.domain.board.schemas import NoticeListResponse, PopupNoticeListResponse
+from server.app.core.dependencies import (
+    SessionReleasingRoute,
+    get_current_user,
+    get_database_session,
+)
+from server.app.domain.board.schemas import (
+    NoticeListResponse,
+    NoticeSchema,
+    PopupNoticeListResponse,
+)
 from server.app.domain.board.service import BoardService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/board", tags=["board"])
+router = APIRouter(
+    prefix="/board",
+    tags=["board"],
+    route_class=SessionReleasingRoute,
+)
 
 
 @router.get(
@@ -26,16 +38,19 @@ router = APIRouter(prefix="/board", tags=["board"])
     response_model_by_alias=True,
 )
 async def get_popup_notices(
+    request: Request,
     db: AsyncSession = Depends(get_database_session),
     current_user: dict = Depends(get_current_user),
-) -> PopupNoticeListResponse:
+) -> Response:
     """
     팝업 공지사항 목록 조회
 
     오늘 날짜 기준으로 팝업 표시 기간 내의 공지사항을 반환합니다.
+    날짜 단위 캐시에 인코딩/압축된 JSON을 그대로 응답합니다. (자정/공지 변경 시 갱신)
     """
     service = BoardService(db)
-    return await service.get_popup_notices()
+    payload = await service.get_popup_notices_json()
+    return payload.response(request)
 
 
 @router.get(
@@ -43,13 +58,57 @@ async def get_popup_notices(
     response_model=NoticeListResponse,
     status_code=status.HTTP_200_OK,
     summary="공지사항 목록 조회",
-    description="공지사항 전체 목록을 최신순으로 조회합니다.",
+    description="공지사항 목록을 최신순으로 페이지 단위 조회합니다. (본문 제외)",
     response_model_by_alias=True,
 )
 async def get_notices(
+    page: int = Query(1, ge=1, description="페이지 번호 (1부터)"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    category: str | None = Query(None, description="게시물 카테고리"),
     db: AsyncSession = Depends(get_database_session),
     current_user: dict = Depends(get_current_user),
 ) -> NoticeListResponse:
     """공지사항 목록 조회 (최신순)"""
     service = BoardService(db)
-    return await service.get_notices()
+    return await service.get_notices(page, size, category)
+
+
+@router.get(
+    "/notices/{project_cd}/{menu_cd}/{board_seq}",
+    response_model=NoticeSchema,
+    status_code=status.HTTP_200_OK,
+    summary="공지사항 상세 조회",
+    description="공지사항 본문을 포함한 상세 정보를 조회합니다.",
+    response_model_by_alias=True,
+)
+async def get_notice(
+    project_cd: str,
+    menu_cd: str,
+    board_seq: str,
+    db: AsyncSession = Depends(get_database_session),
+    current_user: dict = Depends(get_current_user),
+) -> NoticeSchema:
+    """공지사항 상세 조회"""
+    service = BoardService(db)
+    notice = await service.get_notice(project_cd, menu_cd, board_seq)
+    if notice is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"공지사항을 찾을 수 없습니다: {board_seq}",
+        )
+    return notice
+
+
+@router.post(
+    "/notices/invalidate",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="공지사항 캐시 무효화",
+    description="공지사항(WB_BOARD_INFO) 등록/수정/삭제 후 호출하여 모든 워커의 공지 캐시를 비웁니다.",
+)
+async def invalidate_notice_cache(
+    db: AsyncSession = Depends(get_database_session),
+    current_user: dict = Depends(get_current_user),
+) -> None:
+    """공지사항 캐시 무효화"""
+    service = BoardService(db)
+    await service.invalidate_notice_cache()
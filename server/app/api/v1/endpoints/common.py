@@ -8,13 +8,21 @@ import logging
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from server.app.core.dependencies import get_current_user, get_database_session
+from server.app.core.dependencies import (
+    SessionReleasingRoute,
+    get_current_user,
+    get_database_session,
+)
 from server.app.domain.common.schemas import SitesDeptResponse, TransportTypesResponse, UnitsResponse
 from server.app.domain.common.service import CommonService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/common", tags=["common"])
+router = APIRouter(
+    prefix="/common",
+    tags=["common"],
+    route_class=SessionReleasingRoute,
+)
 
 
 @router.get(
@@ -8,9 +8,11 @@ import os
 from pathlib import Path
 from typing import Dict
 
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse, Response
 
+from server.app.core.document_cache import get_document_cache
+from server.app.core.executor import ExecutorSaturatedException
 from server.app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -39,19 +41,27 @@ ALLOWED_DOCS: Dict[str, Path] = {
     "",
     response_class=PlainTextResponse,
     summary="문서 파일 조회",
-    description="프로젝트 문서 파일(Markdown)을 조회합니다.",
+    description=(
+        "프로젝트 문서 파일(Markdown)을 조회합니다. "
+        "ETag/If-None-Match 조건부 요청을 지원하며, 변경이 없으면 304를 반환합니다."
+    ),
 )
 async def get_document(
-    path: str = Query(..., description="문서 파일 경로 (예: /ARCHITECTURE.md)")
-) -> str:
+    request: Request,
+    path: str = Query(..., description="문서 파일 경로 (예: /ARCHITECTURE.md)"),
+) -> Response:
     """
     프로젝트 문서 파일 조회
 
+    문서는 경로 + 수정 시각 기준으로 캐시되며(사전 압축 포함),
+    If-None-Match가 현재 ETag와 일치하면 본문 없이 304를 반환합니다.
+
     Args:
+        request: 요청 (Accept-Encoding, If-None-Match)
         path: 문서 파일 경로
 
     Returns:
-        str: 문서 파일 내용 (Markdown)
+        Response: 문서 파일 내용 (Markdown) 또는 304
 
     Raises:
         HTTPException: 파일을 찾을 수 없거나 읽을 수 없는 경우
@@ -66,19 +76,16 @@ async def get_document(
 
     file_path = ALLOWED_DOCS[path]
 
-    # 파일 존재 확인
-    if not file_path.exists():
+    try:
+        document = await get_document_cache().get(file_path)
+    except FileNotFoundError:
         logger.error(f"Document file not found: {file_path}")
         raise HTTPException(
             status_code=404,
             detail="문서 파일이 존재하지 않습니다."
         )
-
-    # 파일 읽기
-    try:
-        content = file_path.read_text(encoding="utf-8")
-        logger.info(f"Document served: {path}")
-        return content
+    except ExecutorSaturatedException:
+        raise
     except Exception as e:
         logger.error(f"Failed to read document {file_path}: {str(e)}")
         raise HTTPException(
@@ -86,6 +93,9 @@ async def get_document(
             detail="문서를 읽을 수 없습니다."
         )
 
+    logger.debug(f"Document served: {path}")
+    return document.response(request)
+
 
 @router.get(
     "/list",
@@ -99,13 +109,14 @@ async def list_documents() -> Dict[str, list]:
     Returns:
         dict: 문서 목록 정보
     """
+    exists = await get_document_cache().exists(list(ALLOWED_DOCS.values()))
     documents = [
         {
             "path": path,
             "title": path.split("/")[-1],
-            "exists": file_path.exists(),
+            "exists": found,
         }
-        for path, file_path in ALLOWED_DOCS.items()
+        for path, found in zip(ALLOWED_DOCS, exists, strict=True)
     ]
 
     return {
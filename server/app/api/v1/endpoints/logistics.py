@@ -4,24 +4,40 @@ Logistics API 엔드포인트
 """
 
 import logging
+from datetime import datetime
+from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from server.app.core.dependencies import get_current_user, get_database_session
+from server.app.core.dependencies import (
+    SessionReleasingRoute,
+    get_current_user,
+    get_database_session,
+)
+from server.app.core.pubsub import get_broker, sse_stream
+from server.app.core.responses import FastJSONResponse, ModelResponse
+from server.app.domain.logistics.formatters import LogisticsExportFormatter
 from server.app.domain.logistics.schemas import (
     DocNoResponse,
     LogisticsCreateRequest,
     LogisticsDetailSchema,
     LogisticsListResponse,
     LogisticsSearchParams,
+    LogisticsStatsResponse,
+    LogisticsSyncResponse,
     LogisticsUpdateRequest,
 )
 from server.app.domain.logistics.service import LogisticsService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/logistics", tags=["logistics"])
+router = APIRouter(
+    prefix="/logistics",
+    tags=["logistics"],
+    route_class=SessionReleasingRoute,
+)
 
 
 @router.get(
@@ -40,7 +56,7 @@ async def get_logistics_list(
     end_date: str | None = Query(None, alias="endDate", description="종료일 (YYYY-MM-DD)"),
     db: AsyncSession = Depends(get_database_session),
     _current_user: dict = Depends(get_current_user),
-) -> LogisticsListResponse:
+) -> Response:
     """반출입 목록을 검색 조건으로 조회합니다."""
     params = LogisticsSearchParams(
         out_site=out_site,
@@ -53,7 +69,7 @@ async def get_logistics_list(
         status=None,
     )
     service = LogisticsService(db)
-    return await service.get_list(params)
+    return FastJSONResponse(await service.get_list(params))
 
 
 @router.get(
@@ -71,7 +87,7 @@ async def get_logistics_completed(
     end_date: str | None = Query(None, alias="endDate"),
     db: AsyncSession = Depends(get_database_session),
     _current_user: dict = Depends(get_current_user),
-) -> LogisticsListResponse:
+) -> Response:
     """반입 완료된 목록을 조회합니다."""
     params = LogisticsSearchParams(
         out_site=out_site,
@@ -83,7 +99,124 @@ async def get_logistics_completed(
         status="반입",
     )
     service = LogisticsService(db)
-    return await service.get_list(params)
+    return FastJSONResponse(await service.get_list(params))
+
+
+@router.get(
+    "/stats",
+    response_model=LogisticsStatsResponse,
+    summary="반출입 통계 조회",
+    response_model_by_alias=True,
+)
+async def get_logistics_stats(
+    out_site: str | None = Query(None, alias="outSite", description="반출 사업장코드"),
+    out_dept: str | None = Query(None, alias="outDept", description="반출 부서코드"),
+    start_date: str | None = Query(None, alias="startDate", description="시작일 (YYYY-MM-DD)"),
+    end_date: str | None = Query(None, alias="endDate", description="종료일 (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_database_session),
+    _current_user: dict = Depends(get_current_user),
+) -> LogisticsStatsResponse:
+    """기간 내 상태/사업장/부서/일자/운송 유형별 건수와 확인 대기 건수를 조회합니다."""
+    params = LogisticsSearchParams(
+        out_site=out_site,
+        out_dept=out_dept,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    service = LogisticsService(db)
+    return await service.get_stats(params)
+
+
+@router.get(
+    "/sync",
+    response_model=LogisticsSyncResponse,
+    summary="반출입 증분 동기화",
+    response_model_by_alias=True,
+)
+async def sync_logistics(
+    since: datetime | None = Query(
+        None, description="마지막 동기화 응답의 watermark (없으면 전체)"
+    ),
+    out_site: str | None = Query(None, alias="outSite", description="반출 사업장코드"),
+    limit: int = Query(500, ge=1, le=2000, description="최대 변경 문서 수"),
+    after_doc_no: str | None = Query(
+        None, alias="afterDocNo", description="이전 응답의 afterDocNo (hasMore일 때 이어받기 기준)"
+    ),
+    db: AsyncSession = Depends(get_database_session),
+    _current_user: dict = Depends(get_current_user),
+) -> Response:
+    """since 이후 등록/수정/삭제된 반출입 문서만 조회합니다."""
+    service = LogisticsService(db)
+    return ModelResponse(await service.sync(since, out_site, limit, after_doc_no))
+
+
+@router.get(
+    "/events",
+    summary="반출입 변경 이벤트 구독 (SSE)",
+    response_class=StreamingResponse,
+)
+async def subscribe_logistics_events(
+    out_site: str | None = Query(None, alias="outSite", description="반출 사업장코드 (없으면 전체)"),
+    _current_user: dict = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    반출입 등록/수정/삭제 이벤트를 Server-Sent Events로 전송합니다.
+
+    이벤트 이름은 created / updated / deleted 이며, data는 LogisticsChangeEvent JSON입니다.
+    목록 폴링 대신 이 스트림을 구독하고, 이벤트 수신 시 해당 문서만 다시 조회합니다.
+    """
+    return StreamingResponse(
+        sse_stream(get_broker(), LogisticsService.event_topics(out_site)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/export",
+    summary="반출입 이력 내보내기 (CSV/XLSX)",
+    response_class=StreamingResponse,
+)
+async def export_logistics(
+    file_format: Literal["csv", "xlsx"] = Query("csv", alias="format", description="파일 형식"),
+    out_site: str | None = Query(None, alias="outSite"),
+    out_dept: str | None = Query(None, alias="outDept"),
+    company: str | None = Query(None),
+    material: str | None = Query(None),
+    status_: str | None = Query(None, alias="status", description="상태(반출/반입)"),
+    start_date: str | None = Query(None, alias="startDate"),
+    end_date: str | None = Query(None, alias="endDate"),
+    db: AsyncSession = Depends(get_database_session),
+    _current_user: dict = Depends(get_current_user),
+) -> StreamingResponse:
+    """검색 조건에 해당하는 반출입 이력(헤더 + 물품)을 파일로 스트리밍합니다."""
+    if file_format == "xlsx" and not LogisticsExportFormatter.xlsx_available():
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="openpyxl 패키지가 설치되지 않았습니다. pip install openpyxl을 실행하세요.",
+        )
+
+    params = LogisticsSearchParams(
+        out_site=out_site,
+        out_dept=out_dept,
+        company=company,
+        material=material,
+        start_date=start_date,
+        end_date=end_date,
+        status=status_,
+    )
+    media_type = (
+        LogisticsExportFormatter.XLSX_MEDIA_TYPE
+        if file_format == "xlsx"
+        else LogisticsExportFormatter.CSV_MEDIA_TYPE
+    )
+    filename = f"logistics_{datetime.now():%Y%m%d_%H%M%S}.{file_format}"
+    service = LogisticsService(db)
+    return StreamingResponse(
+        service.export(params, file_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get(
@@ -96,7 +229,7 @@ async def get_logistics_detail(
     doc_no: str,
     db: AsyncSession = Depends(get_database_session),
     _current_user: dict = Depends(get_current_user),
-) -> LogisticsDetailSchema:
+) -> Response:
     """반출입번호로 상세 정보를 조회합니다."""
     service = LogisticsService(db)
     result = await service.get_detail(doc_no)
@@ -105,7 +238,7 @@ async def get_logistics_detail(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"반출입 문서를 찾을 수 없습니다: {doc_no}",
         )
-    return result
+    return ModelResponse(result)
 
 
 @router.post(
@@ -161,8 +294,9 @@ async def delete_logistics(
     current_user: dict = Depends(get_current_user),
 ) -> None:
     """반출입 문서를 삭제합니다."""
+    login_id: str = current_user.get("login_id", "UNKNOWN")
     service = LogisticsService(db)
-    deleted = await service.delete(doc_no)
+    deleted = await service.delete(doc_no, login_id)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
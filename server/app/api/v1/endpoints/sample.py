@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.app.core.dependencies import (
+    SessionReleasingRoute,
     get_database_session,
     get_optional_current_user,
     get_pagination,
@@ -29,6 +30,7 @@ from server.app.examples.sample_domain.schemas import (
 router = APIRouter(
     prefix="/sample",
     tags=["sample"],
+    route_class=SessionReleasingRoute,
     responses={
         404: {"description": "Not found"},
         500: {"description": "Internal server error"},
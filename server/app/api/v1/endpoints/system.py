@@ -10,6 +10,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.app.core.config import settings
 from server.app.core.database import get_db
+from server.app.core.dependencies import SessionReleasingRoute
+from server.app.core.executor import (
+    ExecutorSaturatedException,
+    get_blocking_executor,
+    run_blocking,
+)
+from server.app.core.process_pool import get_process_pool
 from server.app.domain.system.repositories import (
     ConnectionTestRepository,
     TestTableRepository,
@@ -20,7 +27,11 @@ from server.app.domain.system.schemas import (
     TestTableItem,
 )
 
-router = APIRouter(prefix="/system", tags=["system"])
+router = APIRouter(
+    prefix="/system",
+    tags=["system"],
+    route_class=SessionReleasingRoute,
+)
 
 
 @router.get(
@@ -86,23 +97,7 @@ async def check_mssql_mcp_connection() -> DBCheckResponse:
     .env 파일의 MSSQL 설정으로 연결 후 @@VERSION 정보를 조회합니다.
     """
     try:
-        import pymssql
-
-        conn = pymssql.connect(
-            server=settings.MSSQL_HOST,
-            port=settings.MSSQL_PORT,
-            user=settings.MSSQL_USER,
-            password=settings.MSSQL_PASSWORD,
-            database=settings.MSSQL_DATABASE,
-            timeout=settings.MSSQL_TIMEOUT,
-            login_timeout=settings.MSSQL_TIMEOUT,
-        )
-        cursor = conn.cursor()
-        cursor.execute("SELECT @@VERSION")
-        row = cursor.fetchone()
-        version_info = row[0] if row else "버전 정보를 가져올 수 없습니다."
-        cursor.close()
-        conn.close()
+        version_info = await run_blocking(_query_mssql_version)
 
         return DBCheckResponse(
             success=True,
@@ -115,6 +110,8 @@ async def check_mssql_mcp_connection() -> DBCheckResponse:
             status_code=500,
             detail="pymssql 패키지가 설치되지 않았습니다. pip install pymssql을 실행하세요.",
         )
+    except ExecutorSaturatedException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -122,6 +119,49 @@ async def check_mssql_mcp_connection() -> DBCheckResponse:
         )
 
 
+def _query_mssql_version() -> str:
+    """pymssql로 연결하여 @@VERSION 조회 (동기, run_blocking으로 실행)"""
+    import pymssql
+
+    conn = pymssql.connect(
+        server=settings.MSSQL_HOST,
+        port=settings.MSSQL_PORT,
+        user=settings.MSSQL_USER,
+        password=settings.MSSQL_PASSWORD,
+        database=settings.MSSQL_DATABASE,
+        timeout=settings.MSSQL_TIMEOUT,
+        login_timeout=settings.MSSQL_TIMEOUT,
+    )
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT @@VERSION")
+        row = cursor.fetchone()
+        cursor.close()
+    finally:
+        conn.close()
+    return row[0] if row else "버전 정보를 가져올 수 없습니다."
+
+
+@router.get(
+    "/executor-stats",
+    summary="블로킹 실행기 지표",
+    description="동기 호출 전용 스레드풀의 대기열 깊이, 실행 중/완료/거절 건수를 반환합니다.",
+)
+async def get_executor_stats() -> dict[str, int]:
+    """블로킹 실행기 지표 (queued = 현재 대기열 깊이, max_queued = 최대 대기열 깊이)"""
+    return get_blocking_executor().stats()
+
+
+@router.get(
+    "/process-pool-stats",
+    summary="프로세스 풀 지표",
+    description="CPU 집약 계산 전용 프로세스 풀의 대기 작업 수, 완료/거절 건수, 공유 메모리 전달량을 반환합니다.",
+)
+async def get_process_pool_stats() -> dict[str, int]:
+    """프로세스 풀 지표 (pending = 실행 중 + 대기 중인 작업 수)"""
+    return get_process_pool().stats()
+
+
 @router.post(
     "/orm-test",
     response_model=OrmTestResponse,
@@ -0,0 +1,271 @@
+"""
+Response Compression
+
+응답 본문 압축(gzip, brotli) 유틸리티와 ASGI 미들웨어입니다.
+- CompressionMiddleware: Accept-Encoding에 맞춰 응답을 압축 (최소 크기 + Content-Type 허용 목록)
+    - 일반 응답: 본문 전체를 압축 (큰 본문은 스레드풀에서 압축하여 이벤트 루프 차단 방지)
+    - 스트리밍 응답(CSV 내보내기 등): 청크 단위 스트림 압축
+    - 이미 Content-Encoding이 있는 응답은 그대로 통과
+- PrecompressedBody: 캐시 항목용 사전 압축 본문 (적재 시 1회 압축, 요청마다 인코딩만 선택)
+
+brotli는 선택 의존성입니다. 설치되지 않았으면 gzip만 사용합니다.
+"""
+
+import gzip
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from server.app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+# 압축 대상 Content-Type (text/event-stream 등 실시간 스트림은 제외)
+COMPRESSIBLE_TYPES: frozenset[str] = frozenset(
+    {
+        "application/json",
+        "application/javascript",
+        "image/svg+xml",
+        "text/css",
+        "text/csv",
+        "text/html",
+        "text/javascript",
+        "text/markdown",
+        "text/plain",
+    }
+)
+
+# brotli 품질 (0~11, 응답 시 압축이므로 속도 위주)
+BROTLI_QUALITY = 4
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 사용할 인코딩을 고릅니다.
+
+    Returns:
+        Optional[str]: "br" | "gzip" | None (압축 불가)
+    """
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip())
+
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str, level: int = settings.COMPRESSION_GZIP_LEVEL) -> bytes:
+    """본문을 지정한 인코딩으로 압축합니다."""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class _StreamCompressor:
+    """스트리밍 응답용 청크 단위 압축기"""
+
+    def __init__(self, encoding: str, level: int) -> None:
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._compress = self._compressor.process
+            self._finish = self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+            self._compress = self._compressor.compress
+            self._finish = self._compressor.flush
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compress(chunk)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+# ====================
+# Pre-compressed cache entries
+# ====================
+
+
+@dataclass(frozen=True)
+class PrecompressedBody:
+    """
+    사전 압축 응답 본문
+
+    캐시에 적재할 때 한 번만 압축해 두고, 요청마다 Accept-Encoding에 맞는 본문을 고릅니다.
+    """
+
+    identity: bytes
+    gzip: bytes
+    br: Optional[bytes] = None
+
+    @classmethod
+    def build(cls, body: bytes) -> "PrecompressedBody":
+        """원본 본문과 압축 본문을 생성합니다."""
+        return cls(
+            identity=body,
+            gzip=compress(body, "gzip"),
+            br=compress(body, "br") if brotli is not None else None,
+        )
+
+    def select(self, accept_encoding: str) -> tuple[bytes, Optional[str]]:
+        """
+        요청에 맞는 본문을 고릅니다.
+
+        Returns:
+            tuple[bytes, Optional[str]]: (본문, Content-Encoding 또는 None)
+        """
+        if len(self.identity) < settings.COMPRESSION_MIN_SIZE:
+            return self.identity, None
+        encoding = choose_encoding(accept_encoding)
+        if encoding == "br" and self.br is not None:
+            return self.br, "br"
+        if encoding is not None:
+            return self.gzip, "gzip"
+        return self.identity, None
+
+    def response(self, request: Request, media_type: str = "application/json") -> Response:
+        """요청의 Accept-Encoding에 맞춘 응답을 생성합니다."""
+        content, encoding = self.select(request.headers.get("accept-encoding", ""))
+        headers = {"Vary": "Accept-Encoding"}
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        return Response(content=content, media_type=media_type, headers=headers)
+
+
+# ====================
+# Middleware
+# ====================
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 ASGI 미들웨어
+
+    압축 조건:
+        - 클라이언트가 br 또는 gzip을 허용
+        - Content-Type이 허용 목록에 포함
+        - Content-Encoding이 없는 응답 (사전 압축 응답은 그대로 통과)
+        - 일반 응답은 minimum_size 이상 (스트리밍 응답은 크기를 미리 알 수 없으므로 항상 압축)
+    threadpool_min_size 이상인 본문/청크는 스레드풀에서 압축합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        threadpool_min_size: int = 64 * 1024,
+        gzip_level: int = 6,
+        content_types: frozenset[str] = COMPRESSIBLE_TYPES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.threadpool_min_size = threadpool_min_size
+        self.gzip_level = gzip_level
+        self.content_types = content_types
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def is_compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return media_type in self.content_types
+
+    async def compress_body(self, encoding: str, body: bytes) -> bytes:
+        """본문 전체를 압축합니다. (큰 본문은 스레드풀)"""
+        return await self._run(compress, body, encoding, self.gzip_level)
+
+    async def compress_chunk(self, compressor: _StreamCompressor, chunk: bytes) -> bytes:
+        """스트리밍 청크를 압축합니다. (큰 청크는 스레드풀)"""
+        return await self._run(compressor.compress, chunk)
+
+    async def _run(self, fn, body: bytes, *args):
+        if len(body) >= self.threadpool_min_size:
+            return await run_in_threadpool(fn, body, *args)
+        return fn(body, *args)
+
+
+class _CompressionResponder:
+    """응답 1건의 send를 가로채 압축 여부를 결정하고 본문을 압축합니다."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Optional[Message] = None
+        self._compressor: Optional[_StreamCompressor] = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self._start is not None:
+            start, self._start = self._start, None
+            headers = Headers(raw=start["headers"])
+            if not self.middleware.is_compressible(headers) or (
+                not more_body and len(body) < self.middleware.minimum_size
+            ):
+                self._passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+
+            mutable = MutableHeaders(raw=start["headers"])
+            mutable["Content-Encoding"] = self.encoding
+            mutable.add_vary_header("Accept-Encoding")
+
+            if not more_body:
+                compressed = await self.middleware.compress_body(self.encoding, body)
+                mutable["Content-Length"] = str(len(compressed))
+                await self._send(start)
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+
+            del mutable["Content-Length"]
+            self._compressor = _StreamCompressor(self.encoding, self.middleware.gzip_level)
+            await self._send(start)
+
+        if self._passthrough or self._compressor is None:
+            await self._send(message)
+            return
+
+        chunk = await self.middleware.compress_chunk(self._compressor, body) if body else b""
+        if not more_body:
+            chunk += self._compressor.finish()
+        if chunk or not more_body:
+            await self._send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
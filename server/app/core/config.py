@@ -215,12 +215,172 @@ class Settings(BaseSettings):
         description="로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
     )
 
+    # ====================
+    # Cache Invalidation Settings
+    # ====================
+    CACHE_INVALIDATION_TRANSPORT: Literal["local", "uds"] = Field(
+        default="local",
+        description=(
+            "워커 간 캐시 무효화 전파 방식 "
+            "(local: 전파 없음/단일 워커, uds: 같은 호스트 워커 간 Unix 도메인 소켓)"
+        )
+    )
+    CACHE_INVALIDATION_SOCKET_DIR: str = Field(
+        default="/tmp/app-cache-invalidation",
+        description="uds 전파 방식에서 워커별 소켓 파일을 둘 디렉터리 (같은 앱의 워커끼리 공유)"
+    )
+
+    # ====================
+    # Rate Limiting Settings
+    # ====================
+    RATE_LIMIT_ENABLED: bool = Field(
+        default=True,
+        description="토큰 버킷 요청 속도 제한 사용 여부"
+    )
+    RATE_LIMIT_MAX_KEYS: int = Field(
+        default=100_000,
+        ge=1,
+        description="워커당 보관할 최대 버킷 수 (초과 시 가장 오래 미사용 버킷부터 제거)"
+    )
+    RATE_LIMIT_IDLE_SECONDS: int = Field(
+        default=600,
+        ge=1,
+        description="이 시간(초) 동안 요청이 없는 버킷은 제거"
+    )
+    RATE_LIMIT_TRUST_FORWARDED: bool = Field(
+        default=False,
+        description=(
+            "X-Forwarded-For 첫 번째 값을 클라이언트 IP로 사용 "
+            "(리버스 프록시 뒤에서만 True, 직접 노출 시 헤더 위조로 우회 가능)"
+        )
+    )
+
+    # ====================
+    # Compression Settings
+    # ====================
+    COMPRESSION_ENABLED: bool = Field(
+        default=True,
+        description="응답 gzip/brotli 압축 사용 여부"
+    )
+    COMPRESSION_MIN_SIZE: int = Field(
+        default=1024,
+        ge=0,
+        description="이 크기(바이트) 미만의 응답은 압축하지 않음"
+    )
+    COMPRESSION_THREADPOOL_MIN_SIZE: int = Field(
+        default=64 * 1024,
+        ge=0,
+        description="이 크기(바이트) 이상의 본문은 스레드풀에서 압축 (이벤트 루프 차단 방지)"
+    )
+    COMPRESSION_GZIP_LEVEL: int = Field(
+        default=6,
+        ge=1,
+        le=9,
+        description="gzip 압축 레벨 (1: 빠름 ~ 9: 최대 압축)"
+    )
+
+    # ====================
+    # Blocking Executor Settings
+    # ====================
+    BLOCKING_EXECUTOR_MAX_WORKERS: int = Field(
+        default=8,
+        ge=1,
+        description="동기(블로킹) 호출 전용 스레드풀 작업자 수 (pymssql 연결, 파일 읽기 등)"
+    )
+    BLOCKING_EXECUTOR_MAX_QUEUE: int = Field(
+        default=64,
+        ge=0,
+        description="작업자를 기다릴 수 있는 최대 작업 수 (초과 시 503 응답)"
+    )
+    SLOW_CALLBACK_THRESHOLD_MS: int = Field(
+        default=100,
+        ge=0,
+        description=(
+            "DEBUG 모드에서 이벤트 루프를 이 시간(ms) 이상 점유한 콜백을 경고 "
+            "(asyncio 디버그 모드, 0이면 사용 안 함)"
+        )
+    )
+
+    # ====================
+    # Process Pool Settings
+    # ====================
+    PROCESS_POOL_MAX_WORKERS: int = Field(
+        default=0,
+        ge=0,
+        description="CPU 집약 계산(분석 커널) 전용 프로세스 풀 작업자 수 (0: CPU 코어 수)"
+    )
+    PROCESS_POOL_MAX_QUEUE: int = Field(
+        default=16,
+        ge=0,
+        description="작업자를 기다릴 수 있는 최대 계산 작업 수 (초과 시 503 응답)"
+    )
+    PROCESS_POOL_MIN_ITEMS: int = Field(
+        default=100_000,
+        ge=0,
+        description=(
+            "이 크기 이상의 배열만 프로세스 풀에서 계산 (작은 배열은 블로킹 실행기 스레드에서 계산, "
+            "0: 프로세스 풀 사용 안 함)"
+        )
+    )
+
+    # ====================
+    # Document Cache Settings
+    # ====================
+    DOCS_CACHE_CHECK_SECONDS: float = Field(
+        default=2.0,
+        ge=0,
+        description="문서 캐시 변경 확인(stat) 주기(초). 이 시간 안의 반복 조회는 디스크 I/O 없음 (0: 매 요청 확인)"
+    )
+
+    # ====================
+    # Warm-up Settings
+    # ====================
+    WARMUP_ENABLED: bool = Field(
+        default=True,
+        description=(
+            "기동 시 워밍업 실행 (DB_POOL_SIZE개 연결 사전 생성, 주요 쿼리 사전 컴파일, "
+            "공통 코드/팝업 공지 캐시 적재)"
+        )
+    )
+    WARMUP_TIMEOUT_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        description="워밍업 전체 제한 시간(초). 초과 시 남은 단계를 건너뛰고 기동"
+    )
+
     # ====================
     # Domain Plugin Settings
     # ====================
     # 여기에 도메인별 설정을 추가할 수 있습니다
     # 예: ENABLE_SAMPLE_DOMAIN: bool = True
 
+    LOGISTICS_SEARCH_MODE: Literal["like", "ngram", "fulltext"] = Field(
+        default="like",
+        description=(
+            "반출입 협력업체/자재 검색 방식 "
+            "(like: LIKE 검색, ngram: n-gram 색인 테이블, fulltext: MSSQL 전문 검색)"
+        )
+    )
+    NOTICE_CACHE_MAX_AGE_SECONDS: int = Field(
+        default=60,
+        description=(
+            "팝업 공지 캐시 최대 보관 시간(초). 자정에 항상 만료되며, "
+            "0이면 자정/무효화 시에만 만료 (WB_BOARD_INFO를 이 서비스만 수정하는 경우)"
+        )
+    )
+    COMMON_CODE_CACHE_TTL_SECONDS: int = Field(
+        default=600,
+        ge=0,
+        description="사업장/부서/단위/운송유형 응답 캐시 보관 시간(초) (0: 캐시 사용 안 함)"
+    )
+    LOGISTICS_STATS_SOURCE: Literal["live", "summary"] = Field(
+        default="live",
+        description=(
+            "반출입 통계 집계 원본 "
+            "(live: AW01010 GROUP BY, summary: AW01010_DAILY_STAT 일별 집계 테이블)"
+        )
+    )
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -62,19 +62,55 @@ def create_database_engine() -> AsyncEngine:
     return engine
 
 
-engine = create_database_engine()
+# 엔진/세션 팩토리는 첫 사용 시점에 생성합니다.
+# (모듈 import만으로 DB 드라이버 로딩/엔진 생성 비용을 치르지 않도록 함:
+#  워커 기동, 테스트 수집, 스크립트 import 시간 단축)
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_engine() -> AsyncEngine:
+    """애플리케이션 공용 엔진 (최초 호출 시 생성)"""
+    global _engine
+    if _engine is None:
+        _engine = create_database_engine()
+    return _engine
+
 
 # ====================
 # Session Factory
 # ====================
 
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,  # 커밋 후에도 객체 접근 가능
-    autoflush=False,
-    autocommit=False,
-)
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """애플리케이션 공용 세션 팩토리 (최초 호출 시 엔진과 함께 생성)"""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            get_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,  # 커밋 후에도 객체 접근 가능
+            autoflush=False,
+            autocommit=False,
+        )
+    return _session_factory
+
+
+async def dispose_engine() -> None:
+    """엔진을 생성했다면 모든 연결을 닫고 폐기합니다. (다음 사용 시 다시 생성)"""
+    global _engine, _session_factory
+    if _engine is not None:
+        engine, _engine, _session_factory = _engine, None, None
+        await engine.dispose()
+
+
+def __getattr__(name: str) -> Any:
+    """기존 import 호환 (engine, AsyncSessionLocal 접근 시 지연 생성)"""
+    if name == "engine":
+        return get_engine()
+    if name == "AsyncSessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ====================
 # Base Model
@@ -107,6 +143,76 @@ class Base(DeclarativeBase):
     metadata = metadata
 
 
+# ====================
+# Lazy Session
+# ====================
+
+
+class LazyAsyncSession:
+    """
+    첫 사용 시점에 AsyncSession을 생성하는 세션 프록시
+
+    엔드포인트가 검증 오류, 캐시 적중, 404 등으로 DB를 쓰지 않고 반환하면
+    세션 생성과 커넥션 체크아웃이 모두 생략됩니다.
+
+    - 첫 속성 접근(execute, add, get 등) 시 세션 생성
+    - commit/rollback 시 트랜잭션이 끝나므로 커넥션은 즉시 풀로 반환됨
+    - release() 호출 시 세션을 닫고 미사용 상태로 되돌림
+      (이후 다시 사용하면 새 세션을 생성)
+
+    AsyncSession의 모든 속성은 그대로 위임되므로
+    Repository/Service 코드는 AsyncSession과 동일하게 사용합니다.
+    """
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession] | None = None
+    ) -> None:
+        """
+        Args:
+            session_factory: 세션 팩토리 (기본값: 공용 세션 팩토리, 첫 사용 시 생성)
+        """
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+
+    @property
+    def is_acquired(self) -> bool:
+        """실제 세션이 생성되었는지 여부"""
+        return self._session is not None
+
+    def _acquire(self) -> AsyncSession:
+        if self._session is None:
+            factory = self._session_factory or get_session_factory()
+            self._session = factory()
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._acquire(), name)
+
+    async def commit(self) -> None:
+        """트랜잭션 커밋 (세션 미사용 시 아무것도 하지 않음)"""
+        if self._session is not None:
+            await self._session.commit()
+
+    async def rollback(self) -> None:
+        """트랜잭션 롤백 (세션 미사용 시 아무것도 하지 않음)"""
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def release(self) -> None:
+        """
+        세션을 닫고 커넥션을 풀로 반환합니다.
+
+        커밋되지 않은 변경사항은 롤백됩니다.
+        """
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+
+    async def close(self) -> None:
+        """release()의 별칭 (AsyncSession 호환)"""
+        await self.release()
+
+
 # ====================
 # Database Dependency
 # ====================
@@ -116,7 +222,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI dependency: 데이터베이스 세션 제공
 
-    비동기 컨텍스트 매니저를 통해 세션을 생성하고
+    실제 세션은 첫 사용 시점에 생성되는 LazyAsyncSession을 제공하고
     요청이 끝나면 자동으로 세션을 닫습니다.
 
     사용법:
@@ -125,13 +231,13 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             ...
 
     Yields:
-        AsyncSession: 데이터베이스 세션
+        AsyncSession: 데이터베이스 세션 (LazyAsyncSession 프록시)
     """
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+    session = LazyAsyncSession()
+    try:
+        yield session  # type: ignore[misc]
+    finally:
+        await session.release()
 
 
 # ====================
@@ -154,7 +260,7 @@ class DatabaseManager:
 
         주의: 운영 환경에서는 Alembic 마이그레이션을 사용하세요.
         """
-        async with engine.begin() as conn:
+        async with get_engine().begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
     @staticmethod
@@ -165,7 +271,7 @@ class DatabaseManager:
         주의: 운영 환경에서는 절대 사용하지 마세요.
         테스트 환경에서만 사용합니다.
         """
-        async with engine.begin() as conn:
+        async with get_engine().begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
 
     @staticmethod
@@ -183,6 +289,6 @@ class DatabaseManager:
         """
         모든 데이터베이스 연결을 닫습니다.
 
-        애플리케이션 종료 시 호출되어야 합니다.
+        애플리케이션 종료 시 호출되어야 합니다. (엔진을 만든 적이 없으면 아무것도 하지 않음)
         """
-        await engine.dispose()
+        await dispose_engine()
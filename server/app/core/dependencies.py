@@ -4,13 +4,16 @@ FastAPI 공통 의존성 (Dependencies)
 라우터에서 사용할 수 있는 재사용 가능한 의존성 함수들을 정의합니다.
 """
 
-from typing import Optional
+import asyncio
+import functools
+from typing import Any, Callable, Optional
 
 from fastapi import Depends, Header, HTTPException, status
+from fastapi.routing import APIRoute
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.app.core.config import settings
-from server.app.core.database import get_db
+from server.app.core.database import LazyAsyncSession, get_db
 from server.app.domain.auth.service import AuthService
 
 
@@ -19,17 +22,62 @@ from server.app.domain.auth.service import AuthService
 # ====================
 
 
-async def get_database_session() -> AsyncSession:
+async def get_database_session(db: AsyncSession = Depends(get_db)) -> AsyncSession:
     """
     데이터베이스 세션 의존성
 
+    get_db가 제공하는 지연 세션을 그대로 반환합니다.
+    (테스트에서 get_db를 오버라이드하면 이 의존성에도 그대로 적용됩니다)
+
     사용법:
         @router.get("/items")
         async def get_items(db: AsyncSession = Depends(get_database_session)):
             ...
     """
-    async for session in get_db():
-        yield session
+    return db
+
+
+class SessionReleasingRoute(APIRoute):
+    """
+    엔드포인트 반환 직후 지연 세션을 반환하는 라우트 클래스
+
+    FastAPI(0.106+)는 yield 의존성의 정리 코드를 응답 모델 검증/직렬화가 끝난 뒤(전송 전)에
+    실행하므로, 그대로 두면 큰 JSON 응답을 직렬화하는 동안에도 커넥션이 점유됩니다.
+    이 라우트는 엔드포인트가 반환(또는 예외 발생)하는 즉시
+    인자로 주입된 LazyAsyncSession을 닫아 직렬화 전에 커넥션을 풀로 돌려보냅니다.
+    StreamingResponse 본문은 반환 이후에 순회되므로, 스트림은 필요할 때
+    LazyAsyncSession이 커넥션을 다시 얻어 사용하고 스트림 종료 시 반환합니다.
+
+    사용법:
+        router = APIRouter(prefix="/items", route_class=SessionReleasingRoute)
+
+    주의:
+        엔드포인트 반환값은 세션이 닫힌 뒤 직렬화되므로
+        지연 로딩(lazy load)이 필요한 ORM 객체가 아닌 스키마를 반환해야 합니다.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, self._wrap_endpoint(endpoint), **kwargs)
+
+    @staticmethod
+    def _wrap_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        if not asyncio.iscoroutinefunction(endpoint) or getattr(
+            endpoint, "__releases_session__", False
+        ):
+            # include_router가 라우트를 재생성할 때 중복 래핑 방지
+            return endpoint
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                for value in kwargs.values():
+                    if isinstance(value, LazyAsyncSession):
+                        await value.release()
+
+        wrapper.__releases_session__ = True  # type: ignore[attr-defined]
+        return wrapper
 
 
 # ====================
@@ -0,0 +1,182 @@
+"""
+Document Cache
+
+/api/v1/docs 문서 파일 캐시입니다.
+- 파일 경로 + 수정 시각(mtime_ns)/크기를 키로 원본과 사전 압축 본문(gzip/brotli)을 보관
+- 내용 해시 기반 강한 ETag, If-None-Match 조건부 요청(304) 처리
+- check_seconds 동안은 stat도 생략하여 반복 조회 시 디스크 I/O 없음
+
+파일 stat/읽기/압축은 run_blocking으로 이벤트 루프 밖에서 실행합니다.
+
+사용법:
+    document = await get_document_cache().get(file_path)
+    return document.response(request)
+"""
+
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from fastapi import Request, Response
+
+from server.app.core.compression import PrecompressedBody
+from server.app.core.config import settings
+from server.app.core.executor import run_blocking
+
+DOCUMENT_MEDIA_TYPE = "text/plain; charset=utf-8"
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    """캐시된 문서 1건 (원본/사전 압축 본문 + 식별 정보)"""
+
+    mtime_ns: int
+    size: int
+    digest: str
+    body: PrecompressedBody
+
+    def etag(self, encoding: Optional[str]) -> str:
+        """
+        표현(Content-Encoding)별 강한 ETag
+
+        같은 내용이라도 gzip/br 본문은 바이트가 다르므로 접미사로 구분합니다.
+        """
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """If-None-Match가 이 문서의 어떤 표현과든 일치하는지 (약한 비교)"""
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*":
+                return True
+            tag = tag.removeprefix("W/").strip('"')
+            if tag == self.digest or tag.startswith(f"{self.digest}-"):
+                return True
+        return False
+
+    def response(self, request: Request, media_type: str = DOCUMENT_MEDIA_TYPE) -> Response:
+        """조건부 요청이면 304, 아니면 Accept-Encoding에 맞는 사전 압축 본문 응답"""
+        content, encoding = self.body.select(request.headers.get("accept-encoding", ""))
+        headers = {
+            "ETag": self.etag(encoding),
+            "Cache-Control": "no-cache",  # 매번 재검증 (변경 없으면 304)
+            "Vary": "Accept-Encoding",
+        }
+        if self.matches(request.headers.get("if-none-match")):
+            return Response(status_code=304, headers=headers)
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        return Response(content=content, media_type=media_type, headers=headers)
+
+
+def _stat(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load(path: Path) -> CachedDocument:
+    stat = path.stat()
+    content = path.read_bytes()
+    return CachedDocument(
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        digest=hashlib.sha256(content).hexdigest()[:32],
+        body=PrecompressedBody.build(content),
+    )
+
+
+class DocumentCache:
+    """
+    문서 파일 캐시 (경로 + mtime 키)
+
+    마지막 확인 후 check_seconds가 지나면 stat으로 수정 시각/크기를 비교하여
+    바뀐 경우에만 다시 읽습니다. (0이면 요청마다 stat)
+    """
+
+    def __init__(
+        self, check_seconds: float = 2.0, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.check_seconds = check_seconds
+        self._clock = clock
+        self._documents: dict[Path, CachedDocument] = {}
+        self._checked_at: dict[Path, float] = {}
+        self._exists: dict[Path, tuple[bool, float]] = {}
+        self._lock = asyncio.Lock()
+
+    def _fresh(self, path: Path) -> bool:
+        checked_at = self._checked_at.get(path)
+        return checked_at is not None and self._clock() - checked_at < self.check_seconds
+
+    async def get(self, path: Path) -> CachedDocument:
+        """
+        문서를 반환합니다. (없거나 바뀌었으면 다시 읽어 적재)
+
+        Raises:
+            FileNotFoundError: 파일이 없는 경우
+        """
+        document = self._documents.get(path)
+        if document is not None and self._fresh(path):
+            return document
+
+        async with self._lock:
+            document = self._documents.get(path)
+            if document is not None and self._fresh(path):
+                return document
+
+            stat = await run_blocking(_stat, path)
+            if stat is None:
+                self.discard(path)
+                raise FileNotFoundError(path)
+            if document is None or (document.mtime_ns, document.size) != stat:
+                document = await run_blocking(_load, path)
+                self._documents[path] = document
+            self._checked_at[path] = self._clock()
+            return document
+
+    async def exists(self, paths: list[Path]) -> list[bool]:
+        """
+        파일 존재 여부 목록 (문서 목록용)
+
+        check_seconds 안에 확인한 결과는 재사용하고, 나머지는 한 번의 블로킹 호출로 확인합니다.
+        """
+        now = self._clock()
+        stale = [
+            path
+            for path in paths
+            if path not in self._exists or now - self._exists[path][1] >= self.check_seconds
+        ]
+        if stale:
+            found = await run_blocking(lambda: [path.exists() for path in stale])
+            for path, exists in zip(stale, found, strict=True):
+                self._exists[path] = (exists, now)
+        return [self._exists[path][0] for path in paths]
+
+    def discard(self, path: Path) -> None:
+        """경로의 캐시 항목을 제거합니다."""
+        self._documents.pop(path, None)
+        self._checked_at.pop(path, None)
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 제거합니다."""
+        self._documents.clear()
+        self._checked_at.clear()
+        self._exists.clear()
+
+
+_document_cache: Optional[DocumentCache] = None
+
+
+def get_document_cache() -> DocumentCache:
+    """공용 문서 캐시"""
+    global _document_cache
+    if _document_cache is None:
+        _document_cache = DocumentCache(settings.DOCS_CACHE_CHECK_SECONDS)
+    return _document_cache
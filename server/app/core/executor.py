@@ -0,0 +1,170 @@
+"""
+Blocking Call Executor
+
+동기(블로킹) 호출을 이벤트 루프 밖에서 실행하는 공용 스레드풀입니다.
+- BlockingExecutor: 작업자 수와 대기열 길이가 제한된 스레드풀 (대기열 깊이 등 지표 제공)
+- run_blocking(): 공용 실행기에서 함수를 실행하고 결과를 await
+- install_slow_callback_detector(): 디버그 모드에서 이벤트 루프를 오래 점유한 콜백 경고
+
+async def 안에서 pymssql 연결, 파일 읽기 같은 동기 I/O를 직접 호출하면
+그동안 같은 워커의 모든 요청이 멈춥니다. 이런 호출은 run_blocking으로 감싸세요.
+
+사용법:
+    from server.app.core.executor import run_blocking
+
+    content = await run_blocking(file_path.read_text, encoding="utf-8")
+
+대기열이 가득 차면 ExecutorSaturatedException(503)을 발생시켜
+느린 외부 자원 때문에 요청이 끝없이 쌓이지 않도록 합니다.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from server.app.core.config import settings
+from server.app.core.logging import get_logger
+from server.app.shared.exceptions import ApplicationException
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class ExecutorSaturatedException(ApplicationException):
+    """블로킹 작업 대기열이 가득 찬 경우 (503)"""
+
+    def __init__(self, message: str = "서버가 혼잡합니다. 잠시 후 다시 시도하세요."):
+        super().__init__(message, status_code=503)
+
+
+class BlockingExecutor:
+    """
+    대기열 길이가 제한된 스레드풀 실행기
+
+    ThreadPoolExecutor의 내부 대기열은 무제한이므로,
+    제출 시점에 대기 중인 작업 수를 세어 max_queue를 넘으면 거절합니다.
+
+    지표:
+        - queued: 작업자를 기다리는 작업 수 (대기열 깊이)
+        - active: 실행 중인 작업 수
+        - max_queued: 지금까지의 최대 대기열 깊이
+        - completed / failed / rejected: 누적 건수
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, name: str = "blocking") -> None:
+        """
+        Args:
+            max_workers: 작업자 스레드 수
+            max_queue: 작업자를 기다릴 수 있는 최대 작업 수 (초과 시 거절)
+            name: 스레드 이름 접두사
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        fn(*args, **kwargs)를 작업자 스레드에서 실행하고 결과를 반환합니다.
+
+        Raises:
+            ExecutorSaturatedException: 대기열이 가득 찬 경우
+        """
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                logger.warning(
+                    f"Blocking executor saturated: queued={self.queued}, active={self.active}"
+                )
+                raise ExecutorSaturatedException()
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+        loop = asyncio.get_running_loop()
+        call = functools.partial(fn, *args, **kwargs)
+        return await loop.run_in_executor(self._pool, self._execute, call)
+
+    def _execute(self, call: Callable[[], T]) -> T:
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+        try:
+            result = call()
+        except BaseException:
+            with self._lock:
+                self.failed += 1
+            raise
+        else:
+            with self._lock:
+                self.completed += 1
+            return result
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def stats(self) -> dict[str, int]:
+        """현재 지표 스냅샷"""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self.queued,
+                "active": self.active,
+                "max_queued": self.max_queued,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_executor: Optional[BlockingExecutor] = None
+
+
+def get_blocking_executor() -> BlockingExecutor:
+    """공용 블로킹 실행기 (첫 사용 시 설정값으로 생성)"""
+    global _executor
+    if _executor is None:
+        _executor = BlockingExecutor(
+            max_workers=settings.BLOCKING_EXECUTOR_MAX_WORKERS,
+            max_queue=settings.BLOCKING_EXECUTOR_MAX_QUEUE,
+        )
+    return _executor
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """공용 블로킹 실행기에서 fn(*args, **kwargs)를 실행합니다."""
+    return await get_blocking_executor().run(fn, *args, **kwargs)
+
+
+def shutdown_blocking_executor() -> None:
+    """공용 실행기 종료 (애플리케이션 종료 시)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+def install_slow_callback_detector(threshold_ms: int) -> None:
+    """
+    현재 이벤트 루프를 asyncio 디버그 모드로 전환하여 느린 콜백을 경고합니다.
+
+    콜백 한 번이 threshold_ms 이상 루프를 점유하면 asyncio 로거가
+    "Executing <Task ...> took 0.250 seconds" 경고를 남깁니다.
+    (run_blocking으로 옮기지 않은 블로킹 호출을 찾는 용도, 디버그 모드 오버헤드가 있어 개발 환경 전용)
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_debug(True)
+    loop.slow_callback_duration = threshold_ms / 1000
+    logger.info(f"🐢 Slow callback detector enabled ({threshold_ms}ms)")
@@ -0,0 +1,240 @@
+"""
+Cache Invalidation Bus
+
+프로세스 메모리 캐시(공통코드, 팝업 공지, 사용자 정보 등)를 여러 워커 프로세스에서
+일관되게 무효화하기 위한 이벤트 버스입니다.
+
+- InvalidationBus: 채널별 무효화 핸들러 등록 + 발행 (로컬 즉시 실행 후 다른 워커로 전파)
+- InvalidationTransport: 워커 간 전파 방식 (구현체 교체 가능)
+    - LocalTransport: 전파 없음 (단일 워커)
+    - UnixSocketTransport: 같은 호스트의 워커끼리 Unix 도메인 데이터그램 소켓으로 브로드캐스트
+
+사용법:
+    bus = get_invalidation_bus()
+    bus.subscribe("notice", lambda key: notice_cache.clear())
+    await bus.publish("notice")           # 모든 워커에서 핸들러 실행
+
+설정 (.env):
+    CACHE_INVALIDATION_TRANSPORT=local | uds
+    CACHE_INVALIDATION_SOCKET_DIR=/tmp/app-cache-invalidation
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import socket
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from server.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+InvalidationHandler = Callable[[Optional[str]], Union[None, Awaitable[None]]]
+MessageCallback = Callable[[bytes], None]
+
+
+# ====================
+# Transports
+# ====================
+
+
+class InvalidationTransport(ABC):
+    """워커 간 무효화 메시지 전파 방식"""
+
+    @abstractmethod
+    async def start(self, on_message: MessageCallback) -> None:
+        """수신을 시작합니다. 다른 워커가 보낸 메시지마다 on_message를 호출합니다."""
+        pass
+
+    @abstractmethod
+    async def send(self, payload: bytes) -> None:
+        """다른 모든 워커에 메시지를 보냅니다. (자기 자신 제외)"""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """수신을 중지하고 자원을 정리합니다."""
+        pass
+
+
+class LocalTransport(InvalidationTransport):
+    """단일 워커용 전파 없는 전송 계층"""
+
+    async def start(self, on_message: MessageCallback) -> None:
+        pass
+
+    async def send(self, payload: bytes) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class UnixSocketTransport(InvalidationTransport):
+    """
+    Unix 도메인 데이터그램 소켓 브로드캐스트
+
+    각 워커는 socket_dir 아래에 `<worker_id>.sock`을 바인드하고,
+    발행 시 디렉터리의 다른 모든 소켓으로 데이터그램을 보냅니다.
+    응답이 없는(종료된 워커의) 소켓 파일은 전송 중 정리합니다.
+    네트워크나 외부 브로커 없이 같은 호스트의 워커 간에만 동작합니다. (Linux/macOS)
+    """
+
+    SUFFIX = ".sock"
+
+    def __init__(self, socket_dir: Union[str, Path], worker_id: Optional[str] = None) -> None:
+        self.socket_dir = Path(socket_dir)
+        self.worker_id = worker_id or str(os.getpid())
+        self.path = self.socket_dir / f"{self.worker_id}{self.SUFFIX}"
+        self._sock: Optional[socket.socket] = None
+
+    async def start(self, on_message: MessageCallback) -> None:
+        self.socket_dir.mkdir(parents=True, exist_ok=True)
+        self.path.unlink(missing_ok=True)
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        sock.bind(str(self.path))
+        self._sock = sock
+
+        def _on_readable() -> None:
+            while True:
+                try:
+                    payload = sock.recv(65536)
+                except (BlockingIOError, InterruptedError):
+                    return
+                except OSError:
+                    logger.exception("캐시 무효화 메시지 수신 실패")
+                    return
+                on_message(payload)
+
+        asyncio.get_running_loop().add_reader(sock.fileno(), _on_readable)
+
+    async def send(self, payload: bytes) -> None:
+        if self._sock is None:
+            return
+        for peer in self.socket_dir.glob(f"*{self.SUFFIX}"):
+            if peer == self.path:
+                continue
+            try:
+                self._sock.sendto(payload, str(peer))
+            except (ConnectionRefusedError, FileNotFoundError):
+                # 종료된 워커의 소켓 파일
+                peer.unlink(missing_ok=True)
+            except BlockingIOError:
+                logger.warning("캐시 무효화 메시지 전송 지연으로 누락: %s", peer.name)
+
+    async def close(self) -> None:
+        if self._sock is None:
+            return
+        asyncio.get_running_loop().remove_reader(self._sock.fileno())
+        self._sock.close()
+        self._sock = None
+        self.path.unlink(missing_ok=True)
+
+
+# ====================
+# Bus
+# ====================
+
+
+class InvalidationBus:
+    """
+    캐시 무효화 이벤트 버스
+
+    publish()는 현재 워커의 핸들러를 즉시 실행한 뒤 전송 계층으로 다른 워커에 전파합니다.
+    다른 워커에서 받은 메시지는 같은 채널의 핸들러를 실행합니다.
+    핸들러 예외는 로그만 남기고 다른 핸들러 실행을 막지 않습니다.
+    """
+
+    def __init__(self, transport: Optional[InvalidationTransport] = None) -> None:
+        self.transport = transport or LocalTransport()
+        self._handlers: dict[str, list[InvalidationHandler]] = {}
+        self._started = False
+        # 수신 메시지 처리 태스크 (이벤트 루프는 태스크를 약하게 참조하므로 완료 전 GC 방지)
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def subscribe(self, channel: str, handler: InvalidationHandler) -> None:
+        """채널 무효화 핸들러를 등록합니다. 핸들러는 key(없으면 None)를 인자로 받습니다."""
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def unsubscribe(self, channel: str, handler: InvalidationHandler) -> None:
+        """등록한 핸들러를 해제합니다."""
+        handlers = self._handlers.get(channel, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    async def start(self) -> None:
+        """다른 워커의 메시지 수신을 시작합니다. (lifespan 시작 시 호출)"""
+        if self._started:
+            return
+        await self.transport.start(self._on_message)
+        self._started = True
+
+    async def close(self) -> None:
+        """수신을 중지합니다. (lifespan 종료 시 호출)"""
+        if not self._started:
+            return
+        await self.transport.close()
+        self._started = False
+        # 이미 수신한 무효화는 마저 처리 (핸들러 예외는 _dispatch에서 로그로 처리)
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def publish(self, channel: str, key: Optional[str] = None) -> None:
+        """
+        채널 무효화 이벤트를 발행합니다.
+
+        Args:
+            channel: 캐시 채널 (예: "common_codes", "notice")
+            key: 무효화할 항목 키 (None이면 채널 전체)
+        """
+        await self._dispatch(channel, key)
+        payload = json.dumps({"channel": channel, "key": key}).encode("utf-8")
+        try:
+            await self.transport.send(payload)
+        except Exception:
+            logger.exception("캐시 무효화 전파 실패: channel=%s, key=%s", channel, key)
+
+    def _on_message(self, payload: bytes) -> None:
+        try:
+            message: dict[str, Any] = json.loads(payload)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            logger.warning("잘못된 캐시 무효화 메시지 무시: %r", payload[:100])
+            return
+        task = asyncio.get_running_loop().create_task(
+            self._dispatch(message.get("channel", ""), message.get("key"))
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, channel: str, key: Optional[str]) -> None:
+        for handler in list(self._handlers.get(channel, [])):
+            try:
+                result = handler(key)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("캐시 무효화 핸들러 실패: channel=%s", channel)
+
+
+def create_transport() -> InvalidationTransport:
+    """설정(CACHE_INVALIDATION_TRANSPORT)에 맞는 전송 계층을 생성합니다."""
+    if settings.CACHE_INVALIDATION_TRANSPORT == "uds":
+        return UnixSocketTransport(settings.CACHE_INVALIDATION_SOCKET_DIR)
+    return LocalTransport()
+
+
+_bus: Optional[InvalidationBus] = None
+
+
+def get_invalidation_bus() -> InvalidationBus:
+    """애플리케이션 전역 무효화 버스를 반환합니다."""
+    global _bus
+    if _bus is None:
+        _bus = InvalidationBus(create_transport())
+    return _bus
@@ -0,0 +1,196 @@
+"""
+CPU Process Pool
+
+CPU 집약 계산(NumPy 분석 커널 등)을 별도 프로세스에서 실행하는 공용 프로세스 풀입니다.
+- ProcessPool: 작업자 수와 대기 작업 수가 제한된 프로세스 풀 (지표 제공)
+- run_array_kernel(): 배열 크기에 따라 스레드(작은 입력) 또는 프로세스 풀(큰 입력)에서 커널 실행
+
+작은 배열은 프로세스 전송/기동 비용이 계산보다 크므로 블로킹 실행기(스레드)에서 실행하고,
+PROCESS_POOL_MIN_ITEMS 이상인 배열만 프로세스 풀로 보냅니다.
+큰 배열은 pickle로 파이프를 통해 복사하지 않고 공유 메모리(multiprocessing.shared_memory)로 전달합니다.
+
+사용법:
+    from server.app.core.process_pool import run_array_kernel
+
+    metrics = await run_array_kernel(statistical_kernel, values)
+
+커널은 프로세스 간 전달이 가능하도록 모듈 최상위 함수여야 합니다.
+numpy는 커널을 실행할 때 import합니다. (기동 시간에 포함되지 않도록)
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+from server.app.core.config import settings
+from server.app.core.executor import ExecutorSaturatedException, run_blocking
+from server.app.core.logging import get_logger
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def _run_shared(
+    kernel: Callable[..., T],
+    name: str,
+    shape: tuple[int, ...],
+    dtype: str,
+    kwargs: dict[str, Any],
+) -> T:
+    """
+    작업자 프로세스: 공유 메모리의 배열로 커널을 실행합니다.
+
+    공유 메모리의 생성/해제(unlink)는 부모 프로세스가 담당하고, 여기서는 연결만 닫습니다.
+    (spawn 작업자는 부모의 resource_tracker를 함께 쓰므로 별도 등록 해제가 필요 없음)
+    """
+    import numpy as np
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        values = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        values.flags.writeable = False
+        result = kernel(values, **kwargs)
+        # 커널 결과가 버퍼를 참조하면 close()가 실패하므로 결과는 파이썬 값이어야 함
+        del values
+        return result
+    finally:
+        shm.close()
+
+
+class ProcessPool:
+    """
+    대기 작업 수가 제한된 프로세스 풀
+
+    작업자는 spawn 방식으로 시작합니다. (fork는 이벤트 루프/DB 연결/스레드 상태를 복제하므로 사용하지 않음)
+    작업자 수를 넘는 작업이 max_queue개를 넘게 쌓이면 ExecutorSaturatedException(503)으로 거절합니다.
+
+    지표:
+        - pending: 제출되었지만 끝나지 않은 작업 수 (실행 중 + 대기)
+        - completed / failed / rejected: 누적 건수
+        - shared_bytes: 공유 메모리로 전달한 누적 바이트
+    """
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        """
+        Args:
+            max_workers: 작업자 프로세스 수
+            max_queue: 작업자를 기다릴 수 있는 최대 작업 수 (초과 시 거절)
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.shared_bytes = 0
+
+    async def run_array(
+        self, kernel: Callable[..., T], values: "np.ndarray", **kwargs: Any
+    ) -> T:
+        """
+        values를 공유 메모리에 복사하고 작업자 프로세스에서 kernel(values, **kwargs)를 실행합니다.
+
+        Raises:
+            ExecutorSaturatedException: 대기 작업이 가득 찬 경우
+        """
+        import numpy as np
+
+        with self._lock:
+            if self.pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                logger.warning(f"Process pool saturated: pending={self.pending}")
+                raise ExecutorSaturatedException()
+            self.pending += 1
+
+        shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        try:
+            shared = np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)
+            shared[...] = values
+            del shared
+
+            loop = asyncio.get_running_loop()
+            call = functools.partial(
+                _run_shared, kernel, shm.name, values.shape, values.dtype.str, kwargs
+            )
+            result = await loop.run_in_executor(self._pool, call)
+        except BaseException:
+            with self._lock:
+                self.failed += 1
+            raise
+        else:
+            with self._lock:
+                self.completed += 1
+                self.shared_bytes += values.nbytes
+            return result
+        finally:
+            with self._lock:
+                self.pending -= 1
+            # 요청이 취소되어 작업자가 아직 사용 중이어도 unlink는 안전 (매핑은 작업자가 닫을 때 해제)
+            shm.close()
+            shm.unlink()
+
+    def stats(self) -> dict[str, int]:
+        """현재 지표 스냅샷"""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "pending": self.pending,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "shared_bytes": self.shared_bytes,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_process_pool: Optional[ProcessPool] = None
+
+
+def get_process_pool() -> ProcessPool:
+    """공용 프로세스 풀 (첫 사용 시 설정값으로 생성, 작업자는 첫 작업 제출 시 시작)"""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPool(
+            max_workers=settings.PROCESS_POOL_MAX_WORKERS or os.cpu_count() or 1,
+            max_queue=settings.PROCESS_POOL_MAX_QUEUE,
+        )
+    return _process_pool
+
+
+async def run_array_kernel(
+    kernel: Callable[..., T], values: "np.ndarray", **kwargs: Any
+) -> T:
+    """
+    배열 크기에 따라 kernel(values, **kwargs)를 실행할 곳을 고릅니다.
+
+    - PROCESS_POOL_MIN_ITEMS 미만: 블로킹 실행기 스레드 (전송 비용 없음, 이벤트 루프는 막지 않음)
+    - PROCESS_POOL_MIN_ITEMS 이상: 프로세스 풀 (공유 메모리 전달, GIL과 무관하게 병렬 실행)
+    """
+    min_items = settings.PROCESS_POOL_MIN_ITEMS
+    if min_items > 0 and values.size >= min_items:
+        return await get_process_pool().run_array(kernel, values, **kwargs)
+    return await run_blocking(kernel, values, **kwargs)
+
+
+def shutdown_process_pool() -> None:
+    """공용 프로세스 풀 종료 (애플리케이션 종료 시)"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False)
+        _process_pool = None
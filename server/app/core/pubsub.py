@@ -0,0 +1,153 @@
+"""
+In-process Pub/Sub
+
+도메인 이벤트를 구독자(SSE 연결 등)에게 전달하는 발행/구독 브로커입니다.
+- PubSubBroker: 로컬 구독자 관리 + 전달 (발행 방식은 구현체가 결정)
+- InMemoryBroker: 단일 프로세스용 (발행 즉시 로컬 구독자에게 전달)
+- sse_stream: 토픽 구독을 Server-Sent Events 응답 본문으로 변환
+
+멀티 워커 배포에서는 PubSubBroker를 상속해 publish()에서 외부 채널(Redis Pub/Sub,
+PostgreSQL LISTEN/NOTIFY 등)로 보내고, 수신한 메시지를 각 워커에서 _deliver()로
+로컬 구독자에게 전달하도록 구현한 뒤 lifespan에서 set_broker()로 교체합니다.
+"""
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# SSE 연결 유지용 주석 전송 간격 (프록시 유휴 타임아웃 방지)
+SSE_HEARTBEAT_SECONDS = 15.0
+
+
+class Subscription:
+    """
+    구독 1건 (토픽 목록 + 수신 큐)
+
+    큐가 가득 차면 가장 오래된 메시지를 버립니다.
+    느린 구독자가 발행자를 막거나 메모리를 무한히 점유하지 않도록 하기 위함입니다.
+    """
+
+    def __init__(self, topics: tuple[str, ...], maxsize: int = 100) -> None:
+        self.topics = topics
+        self.dropped = 0
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=maxsize)
+
+    def put(self, message: dict[str, Any]) -> None:
+        """메시지를 큐에 넣습니다. (가득 차면 가장 오래된 메시지 폐기)"""
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(message)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict[str, Any]]:
+        """
+        다음 메시지를 기다립니다.
+
+        Returns:
+            Optional[dict]: 메시지 (timeout 내 수신이 없으면 None)
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class PubSubBroker(ABC):
+    """
+    Pub/Sub 브로커 추상 클래스
+
+    로컬 구독자 등록/해제와 전달(_deliver)은 공통으로 제공하고,
+    발행(publish) 방식만 구현체가 정의합니다.
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: dict[str, set[Subscription]] = {}
+
+    def subscribe(self, *topics: str, maxsize: int = 100) -> Subscription:
+        """토픽들을 구독합니다. 사용 후 반드시 unsubscribe()를 호출해야 합니다."""
+        subscription = Subscription(topics, maxsize=maxsize)
+        for topic in topics:
+            self._subscriptions.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """구독을 해제합니다."""
+        for topic in subscription.topics:
+            subscribers = self._subscriptions.get(topic)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscriptions[topic]
+
+    def subscriber_count(self, topic: str) -> int:
+        """토픽의 로컬 구독자 수"""
+        return len(self._subscriptions.get(topic, ()))
+
+    def _deliver(self, topic: str, message: dict[str, Any]) -> int:
+        """메시지를 토픽의 로컬 구독자에게 전달하고 전달 건수를 반환합니다."""
+        subscribers = self._subscriptions.get(topic)
+        if not subscribers:
+            return 0
+        for subscription in list(subscribers):
+            subscription.put(message)
+        return len(subscribers)
+
+    @abstractmethod
+    async def publish(self, topic: str, message: dict[str, Any]) -> None:
+        """토픽에 메시지를 발행합니다."""
+        pass
+
+
+class InMemoryBroker(PubSubBroker):
+    """단일 프로세스 브로커 (발행 즉시 같은 프로세스의 구독자에게 전달)"""
+
+    async def publish(self, topic: str, message: dict[str, Any]) -> None:
+        self._deliver(topic, message)
+
+
+_broker: Optional[PubSubBroker] = None
+
+
+def get_broker() -> PubSubBroker:
+    """현재 브로커를 반환합니다. (설정되지 않았으면 InMemoryBroker 생성)"""
+    global _broker
+    if _broker is None:
+        _broker = InMemoryBroker()
+    return _broker
+
+
+def set_broker(broker: PubSubBroker) -> None:
+    """브로커를 교체합니다. (멀티 워커용 구현체 등록 시 lifespan에서 호출)"""
+    global _broker
+    _broker = broker
+
+
+async def sse_stream(
+    broker: PubSubBroker,
+    topics: tuple[str, ...],
+    heartbeat: float = SSE_HEARTBEAT_SECONDS,
+) -> AsyncIterator[str]:
+    """
+    토픽들을 구독하여 메시지를 SSE 형식으로 내보냅니다.
+
+    구독은 스트림이 시작될 때(첫 순회) 등록하고, 종료/취소 시 해제합니다.
+    (엔드포인트에서 미리 구독하면 응답 전송 전에 연결이 끊겼을 때 구독이 해제되지 않음)
+    메시지의 "type" 값을 SSE event 이름으로 사용하며, 수신이 없으면 heartbeat 간격으로
+    주석 행을 보냅니다.
+    """
+    subscription = broker.subscribe(*topics)
+    try:
+        while True:
+            message = await subscription.get(timeout=heartbeat)
+            if message is None:
+                yield ": ping\n\n"
+                continue
+            data = json.dumps(message, ensure_ascii=False)
+            yield f"event: {message.get('type', 'message')}\ndata: {data}\n\n"
+    finally:
+        broker.unsubscribe(subscription)
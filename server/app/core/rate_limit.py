@@ -0,0 +1,333 @@
+"""
+Rate Limiting
+
+토큰 버킷 기반 요청 속도 제한 ASGI 미들웨어입니다.
+- RateLimitPolicy: 경로/메서드별 버킷 크기와 충전 속도
+- RateLimitBackend: 버킷 저장소 (구현체 교체 가능)
+    - InMemoryRateLimitBackend: 프로세스 메모리, 최대 키 수 제한 + 유휴 버킷 제거
+- RateLimitMiddleware: 요청마다 IP 버킷(+ 인증 사용자 버킷)을 차감하고, 초과 시 429 응답
+- enforce_login_rate_limit: 로그인 라우트 의존성, (IP + 입력한 loginId) 버킷을 차감
+
+멀티 워커 배포에서 워커 간 한도를 공유하려면 RateLimitBackend를 상속해
+consume()을 공유 저장소(Redis 등)에 원자적으로 구현하고 미들웨어에 전달합니다.
+"""
+
+import base64
+import json
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from fastapi import HTTPException, Request, status
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from server.app.core.config import settings
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# ====================
+# Policy
+# ====================
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """
+    속도 제한 정책
+
+    Attributes:
+        name: 정책 이름 (버킷 키에 포함)
+        capacity: 버킷 크기 (연속 허용 요청 수)
+        refill_per_second: 초당 충전 토큰 수 (지속 허용 속도)
+        path_prefix: 적용 경로 접두어 (None이면 전체)
+        methods: 적용 HTTP 메서드 (None이면 전체)
+    """
+
+    name: str
+    capacity: float
+    refill_per_second: float
+    path_prefix: Optional[str] = None
+    methods: Optional[frozenset[str]] = None
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods is not None and method not in self.methods:
+            return False
+        return self.path_prefix is None or path.startswith(self.path_prefix)
+
+
+# 로그인: 비밀번호 대조 + DB 조회가 있으므로 엄격하게 (IP + loginId당 분당 10회, 연속 5회)
+# loginId는 요청 본문에 있으므로 미들웨어가 아니라 로그인 라우트 의존성(enforce_login_rate_limit)에서 차감합니다.
+# (같은 IP(NAT/사내망)의 다른 사용자는 서로 막지 않고, IP 전체는 미들웨어의 쓰기 정책으로 제한)
+LOGIN_POLICY = RateLimitPolicy(
+    name="login",
+    capacity=5,
+    refill_per_second=10 / 60,
+    path_prefix=f"{settings.API_V1_PREFIX}/auth/login",
+    methods=frozenset({"POST"}),
+)
+
+# 미들웨어는 위에서부터 처음 일치하는 정책 1개를 적용합니다.
+DEFAULT_POLICIES: tuple[RateLimitPolicy, ...] = (
+    # 쓰기: 초당 2회, 연속 20회
+    RateLimitPolicy(
+        name="write",
+        capacity=20,
+        refill_per_second=2,
+        methods=frozenset({"POST", "PUT", "PATCH", "DELETE"}),
+    ),
+    # 조회: 초당 10회, 연속 100회
+    RateLimitPolicy(name="read", capacity=100, refill_per_second=10),
+)
+
+
+# ====================
+# Backends
+# ====================
+
+
+class RateLimitBackend(ABC):
+    """토큰 버킷 저장소"""
+
+    @abstractmethod
+    async def consume(self, key: str, policy: RateLimitPolicy, cost: float = 1) -> float:
+        """
+        버킷에서 토큰을 차감합니다.
+
+        Returns:
+            float: 0이면 허용, 양수이면 거부 (다시 시도 가능할 때까지 남은 초)
+        """
+        pass
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    프로세스 메모리 토큰 버킷 저장소
+
+    OrderedDict를 최근 사용 순서로 유지하여 조회/갱신/제거가 모두 O(1)입니다.
+        - 접근한 버킷은 맨 뒤로 이동
+        - 맨 앞(가장 오래 미사용)부터 idle_seconds 이상 미사용 버킷을 제거
+        - max_keys를 넘으면 가장 오래 미사용 버킷부터 제거 (메모리 상한)
+    유휴 버킷은 어차피 가득 찬 상태로 복원되므로 제거해도 동작이 달라지지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_keys: int = 100_000,
+        idle_seconds: float = 600,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_keys = max_keys
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        # key -> [tokens, last_seen]
+        self._buckets: "OrderedDict[str, list[float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def consume(self, key: str, policy: RateLimitPolicy, cost: float = 1) -> float:
+        now = self._clock()
+        self._evict(now)
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = [policy.capacity, now]
+            self._buckets[key] = bucket
+        else:
+            elapsed = now - bucket[1]
+            bucket[0] = min(policy.capacity, bucket[0] + elapsed * policy.refill_per_second)
+            bucket[1] = now
+            self._buckets.move_to_end(key)
+
+        if bucket[0] >= cost:
+            bucket[0] -= cost
+            return 0.0
+        return (cost - bucket[0]) / policy.refill_per_second
+
+    def _evict(self, now: float) -> None:
+        while self._buckets:
+            oldest_key, (_, last_seen) = next(iter(self._buckets.items()))
+            if now - last_seen < self.idle_seconds and len(self._buckets) < self.max_keys:
+                return
+            del self._buckets[oldest_key]
+
+
+_backend: Optional[InMemoryRateLimitBackend] = None
+
+
+def get_rate_limit_backend() -> InMemoryRateLimitBackend:
+    """미들웨어와 로그인 의존성이 함께 쓰는 버킷 저장소 (첫 사용 시 설정값으로 생성)"""
+    global _backend
+    if _backend is None:
+        _backend = InMemoryRateLimitBackend(
+            max_keys=settings.RATE_LIMIT_MAX_KEYS,
+            idle_seconds=settings.RATE_LIMIT_IDLE_SECONDS,
+        )
+    return _backend
+
+
+# ====================
+# Client identity
+# ====================
+
+
+def client_ip(scope: Scope, headers: dict[bytes, bytes], trust_forwarded: bool) -> str:
+    """클라이언트 IP (trust_forwarded이면 X-Forwarded-For 첫 번째 값)"""
+    if trust_forwarded:
+        forwarded = headers.get(b"x-forwarded-for")
+        if forwarded:
+            return forwarded.decode("latin-1").split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def unverified_subject(token: str) -> Optional[str]:
+    """
+    JWT payload의 sub를 서명 검증 없이 읽습니다. (버킷 키 용도로만 사용)
+
+    요청마다 서명 검증까지 하면 인증 의존성과 같은 비용을 두 번 치르므로 payload만 디코딩합니다.
+    sub를 위조한 토큰도 IP 버킷은 항상 함께 차감되고, 요청 자체는 인증 의존성에서 401로 거절됩니다.
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return None
+    subject = claims.get("sub") if isinstance(claims, dict) else None
+    return str(subject) if subject else None
+
+
+# ====================
+# Login dependency
+# ====================
+
+
+async def enforce_login_rate_limit(request: Request) -> None:
+    """
+    로그인 라우트 의존성: (IP + 입력한 loginId) 버킷을 차감합니다.
+
+    본문은 Starlette Request에 캐시되므로 라우트의 LoginRequest 파싱과 중복 수신하지 않습니다.
+    본문이 올바르지 않으면 loginId 없이 IP 버킷으로 차감합니다. (검증 오류는 라우트에서 422)
+
+    Raises:
+        HTTPException: 429 (Retry-After 헤더 포함)
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    try:
+        body = await request.json()
+    except ValueError:
+        body = None
+    login_id = body.get("loginId") if isinstance(body, dict) else None
+    login_id = login_id.strip().lower() if isinstance(login_id, str) else ""
+
+    headers = dict(request.scope.get("headers", []))
+    ip = client_ip(request.scope, headers, settings.RATE_LIMIT_TRUST_FORWARDED)
+    retry_after = await get_rate_limit_backend().consume(
+        f"{LOGIN_POLICY.name}:{ip}:{login_id}", LOGIN_POLICY
+    )
+    if retry_after > 0:
+        logger.warning(
+            f"Rate limit exceeded: policy={LOGIN_POLICY.name}, path={request.url.path}",
+            extra={"path": request.url.path, "policy": LOGIN_POLICY.name},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="요청이 너무 많습니다. 잠시 후 다시 시도하세요.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+# ====================
+# Middleware
+# ====================
+
+
+class RateLimitMiddleware:
+    """
+    토큰 버킷 속도 제한 ASGI 미들웨어
+
+    요청마다 첫 번째로 일치하는 정책의 버킷을 차감합니다.
+        - IP 버킷: 항상
+        - 사용자 버킷: Bearer 토큰에 sub가 있을 때 (같은 IP를 공유하는 사용자 구분, 서명 검증은 인증 의존성에서)
+    둘 중 하나라도 부족하면 429와 Retry-After 헤더를 응답합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        backend: Optional[RateLimitBackend] = None,
+        policies: tuple[RateLimitPolicy, ...] = DEFAULT_POLICIES,
+        trust_forwarded: bool = False,
+    ) -> None:
+        self.app = app
+        # 빈 InMemoryRateLimitBackend는 __len__이 0이므로 `or`로 기본값을 고르면 안 됨
+        self.backend = backend if backend is not None else get_rate_limit_backend()
+        self.policies = policies
+        self.trust_forwarded = trust_forwarded
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        policy = self._policy_for(scope["method"], scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = 0.0
+        for key in self._keys(scope, policy):
+            retry_after = max(retry_after, await self.backend.consume(key, policy))
+
+        if retry_after > 0:
+            logger.warning(
+                f"Rate limit exceeded: policy={policy.name}, path={scope['path']}",
+                extra={"path": scope["path"], "policy": policy.name},
+            )
+            await self._reject(send, retry_after)
+            return
+
+        await self.app(scope, receive, send)
+
+    def _policy_for(self, method: str, path: str) -> Optional[RateLimitPolicy]:
+        for policy in self.policies:
+            if policy.matches(method, path):
+                return policy
+        return None
+
+    def _keys(self, scope: Scope, policy: RateLimitPolicy) -> list[str]:
+        headers = dict(scope.get("headers", []))
+        keys = [f"{policy.name}:ip:{client_ip(scope, headers, self.trust_forwarded)}"]
+
+        authorization = headers.get(b"authorization", b"").decode("latin-1")
+        parts = authorization.split()
+        if len(parts) == 2 and parts[0].lower() == "bearer":
+            user_id = unverified_subject(parts[1])
+            if user_id:
+                keys.append(f"{policy.name}:user:{user_id}")
+        return keys
+
+    @staticmethod
+    async def _reject(send: Send, retry_after: float) -> None:
+        body = json.dumps(
+            {"detail": "요청이 너무 많습니다. 잠시 후 다시 시도하세요."}, ensure_ascii=False
+        ).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(math.ceil(retry_after)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,49 @@
+"""
+JSON Responses
+
+API 기본 응답 클래스와 모델 직렬화 응답입니다.
+- FastJSONResponse: 애플리케이션 기본 응답 클래스 (orjson 인코딩, 미설치 시 표준 json)
+- ModelResponse: 이미 검증된 Pydantic 모델을 그대로 직렬화하는 응답
+
+FastAPI는 엔드포인트가 모델을 반환하면 response_model 기준으로 dict 변환 → 재검증 →
+직렬화를 거칩니다. Service가 만든 응답 모델은 이미 검증된 값이므로, 큰 응답은
+ModelResponse로 감싸 model_dump_json(by_alias=True) 한 번으로 본문을 만듭니다.
+Response 객체를 반환하면 FastAPI는 재검증 없이 그대로 응답하며,
+response_model은 OpenAPI 문서용으로만 사용됩니다.
+
+사용법:
+    @router.get("/{doc_no}", response_model=LogisticsDetailSchema)
+    async def get_detail(...) -> Response:
+        return ModelResponse(await service.get_detail(doc_no))
+
+Service가 응답 모델 대신 camelCase dict를 만드는 경우(반출입 목록 등)는
+FastJSONResponse(content)를 직접 반환하여 같은 방식으로 재검증을 생략합니다.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (orjson 미설치 시 JSONResponse와 동일)"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ModelResponse(Response):
+    """검증된 Pydantic 모델을 camelCase JSON으로 직렬화하는 응답 (response_model 재검증 생략)"""
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json(by_alias=True).encode("utf-8")
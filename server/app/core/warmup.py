@@ -0,0 +1,168 @@
+"""
+Startup Warm-up
+
+워커가 요청을 받기 전에(lifespan 시작 단계) 첫 요청이 치르던 준비 비용을 미리 처리합니다.
+- open_pool_connections(): DB 연결을 미리 열어 풀에 반납 (TCP/TLS/ODBC 연결 수립)
+- precompile(): 자주 쓰는 조회 쿼리를 엔진 컴파일 캐시에 적재 (SQL 컴파일)
+- warm_up(): 위 단계 + 공통 코드/팝업 공지 캐시 적재를 순서대로 실행
+
+각 단계는 실패해도 기동을 막지 않고 경고만 남기며(첫 요청에서 다시 시도됨),
+전체 시간이 WARMUP_TIMEOUT_SECONDS를 넘으면 남은 단계를 건너뜁니다.
+
+사용법 (main.py lifespan):
+    if settings.WARMUP_ENABLED:
+        await warm_up()
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Iterable
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.sql import compiler
+from sqlalchemy.sql.base import Executable
+
+from server.app.core.config import settings
+from server.app.core.database import get_engine, get_session_factory
+from server.app.core.logging import get_logger
+from server.app.domain.auth.repositories.user_repository import UserRepository
+from server.app.domain.board.service import BoardService
+from server.app.domain.common.service import CommonService
+from server.app.domain.logistics.repositories.logistics_repository import LogisticsRepository
+
+logger = get_logger(__name__)
+
+WarmupStep = tuple[str, Callable[[], Awaitable[Any]]]
+
+
+async def open_pool_connections(engine: AsyncEngine, count: int) -> int:
+    """
+    count개 연결을 동시에 열었다가 풀에 반납합니다.
+
+    Returns:
+        int: 연결에 성공한 수
+
+    Raises:
+        Exception: 연결 실패 시 첫 번째 오류 (성공한 연결은 반납 후)
+    """
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(count)), return_exceptions=True
+    )
+    connections = [result for result in results if isinstance(result, AsyncConnection)]
+    for connection in connections:
+        await connection.close()
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        raise errors[0]
+    return len(connections)
+
+
+def precompile(
+    engine: AsyncEngine, statements: Iterable[Executable | tuple[Executable, Iterable[str]]]
+) -> int:
+    """
+    쿼리를 엔진의 컴파일 캐시에 적재합니다. (실행하지 않음)
+
+    캐시 키는 쿼리 구조로 만들어지고 바인드 값은 포함되지 않으므로,
+    이후 같은 구조의 쿼리는 조건 값이 달라도 컴파일 없이 실행됩니다.
+    실행 시 값을 dict로 넘기는 쿼리는 (쿼리, 파라미터명 목록)으로 전달하세요.
+    (파라미터명 목록도 캐시 키에 포함됨)
+    인자는 SQLAlchemy 2.0 Connection._execute_clauseelement가 사용하는 값과 같습니다.
+
+    Returns:
+        int: 적재한 쿼리 수 (query_cache_size=0으로 캐시를 끈 경우 0)
+    """
+    sync_engine = engine.sync_engine
+    compiled_cache = sync_engine._compiled_cache
+    if compiled_cache is None:
+        return 0
+
+    dialect = sync_engine.dialect
+    count = 0
+    for item in statements:
+        statement, names = item if isinstance(item, tuple) else (item, ())
+        statement._compile_w_cache(
+            dialect,
+            compiled_cache=compiled_cache,
+            column_keys=sorted(names),
+            for_executemany=False,
+            linting=dialect.compiler_linting | compiler.WARN_LINTING,
+        )
+        count += 1
+    return count
+
+
+async def run_warmup(steps: list[WarmupStep], timeout: float) -> dict[str, float]:
+    """
+    워밍업 단계를 순서대로 실행합니다.
+
+    Returns:
+        dict: 완료한 단계별 소요 시간(ms)
+    """
+    timings: dict[str, float] = {}
+
+    async def run_steps() -> None:
+        for name, step in steps:
+            started = time.perf_counter()
+            try:
+                result = await step()
+            except Exception as e:
+                logger.warning(f"⚠️  Warm-up '{name}' failed: {e}")
+                continue
+            timings[name] = round((time.perf_counter() - started) * 1000, 1)
+            logger.info(f"🔥 Warm-up '{name}': {result} ({timings[name]}ms)")
+
+    try:
+        await asyncio.wait_for(run_steps(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"⚠️  Warm-up timed out after {timeout}s, skipping remaining steps")
+    return timings
+
+
+async def _precompile_hot_statements(
+    engine: AsyncEngine, session_factory: async_sessionmaker[AsyncSession]
+) -> int:
+    # 세션은 쿼리 생성에만 사용 (연결을 얻지 않음)
+    async with session_factory() as db:
+        statements = [
+            *UserRepository.warmup_statements(),
+            *LogisticsRepository(db).warmup_statements(),
+        ]
+    return precompile(engine, statements)
+
+
+async def _preload_common_codes(session_factory: async_sessionmaker[AsyncSession]) -> str:
+    async with session_factory() as db:
+        await CommonService(db).warm_up()
+    return "loaded"
+
+
+async def _preload_popup_notices(session_factory: async_sessionmaker[AsyncSession]) -> str:
+    async with session_factory() as db:
+        payload = await BoardService(db).get_popup_notices_json()
+    return f"{len(payload.identity)} bytes"
+
+
+async def warm_up() -> dict[str, float]:
+    """
+    애플리케이션 워밍업
+
+    단계:
+        1. connections: DB_POOL_SIZE개 연결을 미리 열어 풀에 보관
+        2. statements: 로그인/반출입 목록·상세·통계 쿼리 사전 컴파일
+        3. common_codes: 사업장/부서/단위/운송유형 캐시 적재
+        4. popup_notices: 오늘의 팝업 공지 캐시 적재
+    """
+    engine = get_engine()
+    session_factory = get_session_factory()
+    steps: list[WarmupStep] = [
+        ("connections", lambda: open_pool_connections(engine, settings.DB_POOL_SIZE)),
+        ("statements", lambda: _precompile_hot_statements(engine, session_factory)),
+        ("common_codes", lambda: _preload_common_codes(session_factory)),
+        ("popup_notices", lambda: _preload_popup_notices(session_factory)),
+    ]
+    started = time.perf_counter()
+    timings = await run_warmup(steps, settings.WARMUP_TIMEOUT_SECONDS)
+    elapsed = (time.perf_counter() - started) * 1000
+    logger.info(f"🔥 Warm-up complete: {len(timings)}/{len(steps)} steps in {elapsed:.0f}ms")
+    return timings
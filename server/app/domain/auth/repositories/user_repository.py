@@ -5,13 +5,13 @@ St00400 사용자 조회 및 관련 데이터 접근
 
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from server.app.domain.auth.models.role import TbRole
 from server.app.domain.auth.models.user import St00400
 from server.app.domain.auth.models.user_role import TbUserRole
-from server.app.domain.auth.models.role import TbRole
 
 
 class UserRepository:
@@ -20,25 +20,38 @@ class UserRepository:
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
-    async def get_user_by_id(self, user_id: str) -> Optional[St00400]:
-        """USER_ID로 사용자를 조회합니다 (roles 포함)."""
-        stmt = (
+    @staticmethod
+    def user_statement(user_id: str) -> Select:
+        """USER_ID 사용자 조회 쿼리 (roles 포함)"""
+        return (
             select(St00400)
             .where(St00400.user_id == user_id)
             .options(
                 selectinload(St00400.user_roles).selectinload(TbUserRole.role)
             )
         )
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
 
-    async def get_role_codes_by_user_id(self, user_id: str) -> list[str]:
-        """사용자의 권한 코드 목록을 조회합니다."""
-        stmt = (
+    @staticmethod
+    def role_codes_statement(user_id: str) -> Select:
+        """사용자의 사용 중인 권한 코드 조회 쿼리"""
+        return (
             select(TbRole.role_cd)
             .join(TbUserRole, TbUserRole.role_id == TbRole.role_id)
             .where(TbUserRole.user_id == user_id)
             .where(TbRole.use_yn == "Y")
         )
-        result = await self.db.execute(stmt)
+
+    async def get_user_by_id(self, user_id: str) -> Optional[St00400]:
+        """USER_ID로 사용자를 조회합니다 (roles 포함)."""
+        result = await self.db.execute(self.user_statement(user_id))
+        return result.scalar_one_or_none()
+
+    async def get_role_codes_by_user_id(self, user_id: str) -> list[str]:
+        """사용자의 권한 코드 목록을 조회합니다."""
+        result = await self.db.execute(self.role_codes_statement(user_id))
         return list(result.scalars().all())
+
+    @classmethod
+    def warmup_statements(cls) -> list[Select]:
+        """기동 시 미리 컴파일할 로그인 경로 쿼리"""
+        return [cls.user_statement("-"), cls.role_codes_statement("-")]
@@ -35,8 +35,9 @@ class WbBoardInfo(Base):
     board_title: Mapped[Optional[str]] = mapped_column(
         "BOARD_TITLE", Unicode(250), nullable=True, comment="제목"
     )
+    # 본문은 목록 조회에서 읽지 않도록 지연 로딩 (필요 시 undefer 옵션 사용)
     board_txt: Mapped[Optional[str]] = mapped_column(
-        "BOARD_TXT", UnicodeText, nullable=True, comment="내용"
+        "BOARD_TXT", UnicodeText, nullable=True, deferred=True, comment="내용"
     )
     import_yn: Mapped[Optional[str]] = mapped_column(
         "IMPORT_YN", String(1), nullable=True, comment="중요여부"
@@ -0,0 +1,112 @@
+"""
+Board 도메인 팝업 공지 캐시
+오늘 날짜 기준 팝업 공지 응답(JSON 인코딩 + 사전 압축 완료)을 날짜 단위로 캐시
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Awaitable, Callable, Optional
+
+from server.app.core.compression import PrecompressedBody
+from server.app.core.config import settings
+from server.app.core.invalidation import get_invalidation_bus
+
+logger = logging.getLogger(__name__)
+
+# 캐시 무효화 버스 채널 (공지 등록/수정/삭제 시 발행)
+NOTICE_CHANNEL = "notice"
+
+PopupNoticeLoader = Callable[[date], Awaitable[bytes]]
+
+
+class PopupNoticeCache:
+    """
+    팝업 공지 날짜 버킷 캐시
+
+    팝업 대상은 공지가 바뀌거나 날짜가 바뀔 때만 달라지므로
+    오늘 날짜의 응답 본문을 1건만 보관합니다.
+    적재 시 gzip/brotli 본문도 함께 만들어 두어 요청마다 다시 압축하지 않습니다.
+
+    만료 시점:
+        - 다음 날 자정 (날짜 버킷 교체)
+        - max_age_seconds 경과 (외부 시스템이 WB_BOARD_INFO를 직접 수정하는 경우 대비, 0이면 미사용)
+        - invalidate() 호출 (무효화 버스 "notice" 채널 수신 포함)
+
+    동시에 여러 요청이 캐시 미스를 만나도 로더는 1회만 실행합니다. (로그인 직후 몰림 대비)
+    로더 실행 중 invalidate()가 호출되면 그 결과는 저장하지 않습니다. (변경 전 데이터 재적재 방지)
+    """
+
+    def __init__(
+        self,
+        max_age_seconds: int = 0,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._day: Optional[date] = None
+        self._expires_at: Optional[datetime] = None
+        self._payload: Optional[PrecompressedBody] = None
+        self._lock = asyncio.Lock()
+        self._generation = 0
+
+    def expires_at(self, now: datetime) -> datetime:
+        """now 시점에 적재한 항목의 만료 시각"""
+        midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
+        if self.max_age_seconds > 0:
+            return min(midnight, now + timedelta(seconds=self.max_age_seconds))
+        return midnight
+
+    def _cached(self, now: datetime) -> Optional[PrecompressedBody]:
+        if self._payload is None or self._expires_at is None:
+            return None
+        if self._day != now.date() or now >= self._expires_at:
+            return None
+        return self._payload
+
+    async def get_or_load(self, loader: PopupNoticeLoader) -> PrecompressedBody:
+        """
+        오늘 날짜의 캐시된 응답을 반환하고, 없으면 loader(오늘 날짜)로 적재합니다.
+
+        Args:
+            loader: 날짜를 받아 인코딩된 응답 본문을 반환하는 코루틴 함수
+        """
+        payload = self._cached(self._clock())
+        if payload is not None:
+            return payload
+
+        async with self._lock:
+            now = self._clock()
+            payload = self._cached(now)
+            if payload is not None:
+                return payload
+
+            generation = self._generation
+            payload = PrecompressedBody.build(await loader(now.date()))
+            if generation == self._generation:
+                self._day = now.date()
+                self._expires_at = self.expires_at(now)
+                self._payload = payload
+                logger.debug(
+                    "팝업 공지 캐시 적재: day=%s, expires_at=%s", self._day, self._expires_at
+                )
+            return payload
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """캐시를 비웁니다. (무효화 버스 핸들러 시그니처와 호환)"""
+        self._generation += 1
+        self._day = None
+        self._expires_at = None
+        self._payload = None
+
+
+_popup_notice_cache: Optional[PopupNoticeCache] = None
+
+
+def get_popup_notice_cache() -> PopupNoticeCache:
+    """팝업 공지 캐시를 반환합니다. (최초 호출 시 무효화 버스에 등록)"""
+    global _popup_notice_cache
+    if _popup_notice_cache is None:
+        _popup_notice_cache = PopupNoticeCache(settings.NOTICE_CACHE_MAX_AGE_SECONDS)
+        get_invalidation_bus().subscribe(NOTICE_CHANNEL, _popup_notice_cache.invalidate)
+    return _popup_notice_cache
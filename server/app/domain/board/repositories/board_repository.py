@@ -4,32 +4,36 @@ WB_BOARD_INFO 팝업 공지사항 조회
 """
 
 from datetime import date
+from typing import Optional
 
-from sqlalchemy import and_, select
+from sqlalchemy import Row, and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from server.app.domain.board.models.notice import WbBoardInfo
+from server.app.shared.base.repository import ReadOnlyQueryMixin
 
 
-class BoardRepository:
+class BoardRepository(ReadOnlyQueryMixin):
     """게시판 Repository - WB_BOARD_INFO 데이터 접근"""
 
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
-    async def get_popup_notices(self) -> list[WbBoardInfo]:
+    async def get_popup_notices(self, day: Optional[date] = None) -> list[WbBoardInfo]:
         """
-        오늘 날짜 기준 팝업 표시 대상 공지사항을 조회합니다.
+        기준일(기본: 오늘) 팝업 표시 대상 공지사항을 조회합니다.
 
         조건:
           - BOARD_CATEGORY = '02'
           - POPUP_YN = 'Y'
-          - 오늘 날짜(YYYYMMDD)가 POPUP_START_DT ~ POPUP_END_DT 범위 안
+          - 기준일(YYYYMMDD)이 POPUP_START_DT ~ POPUP_END_DT 범위 안
         정렬: REG_DT ASC
         """
-        today = date.today().strftime("%Y%m%d")
+        today = (day or date.today()).strftime("%Y%m%d")
         stmt = (
             select(WbBoardInfo)
+            .options(undefer(WbBoardInfo.board_txt))
             .where(
                 and_(
                     WbBoardInfo.board_category == "02",
@@ -43,12 +47,59 @@ class BoardRepository:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
-    async def get_notices(self) -> list[WbBoardInfo]:
+    async def get_notices(
+        self, offset: int, limit: int, category: Optional[str] = None
+    ) -> tuple[list[Row], int]:
         """
-        공지사항 전체 목록을 조회합니다.
+        공지사항 목록을 페이지 단위로 조회합니다. (본문 BOARD_TXT 제외)
 
-        정렬: REG_DT DESC (최신순)
+        목록 표시에 필요한 컬럼만 조회하므로 본문 크기나 전체 게시물 수와 무관하게
+        페이지 크기만큼만 읽습니다.
+
+        정렬: REG_DT DESC, BOARD_SEQ DESC (최신순)
+
+        Returns:
+            tuple[list[Row], int]: (페이지 행 목록, 전체 건수)
         """
-        stmt = select(WbBoardInfo).order_by(WbBoardInfo.reg_dt.desc())
+        conditions = []
+        if category:
+            conditions.append(WbBoardInfo.board_category == category)
+
+        stmt = (
+            select(
+                WbBoardInfo.project_cd,
+                WbBoardInfo.menu_cd,
+                WbBoardInfo.board_seq,
+                WbBoardInfo.board_title,
+                WbBoardInfo.import_yn,
+                WbBoardInfo.popup_yn,
+                WbBoardInfo.board_category,
+                WbBoardInfo.reg_dt,
+                WbBoardInfo.mod_dt,
+            )
+            .where(*conditions)
+            .order_by(WbBoardInfo.reg_dt.desc(), WbBoardInfo.board_seq.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        rows = await self.fetch_rows(stmt)
+
+        count_stmt = select(func.count()).select_from(WbBoardInfo).where(*conditions)
+        total = (await self.db.execute(count_stmt)).scalar() or 0
+        return rows, total
+
+    async def get_notice(
+        self, project_cd: str, menu_cd: str, board_seq: str
+    ) -> Optional[WbBoardInfo]:
+        """공지사항 단건을 본문 포함하여 조회합니다."""
+        stmt = (
+            select(WbBoardInfo)
+            .options(undefer(WbBoardInfo.board_txt))
+            .where(
+                WbBoardInfo.project_cd == project_cd,
+                WbBoardInfo.menu_cd == menu_cd,
+                WbBoardInfo.board_seq == board_seq,
+            )
+        )
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalar_one_or_none()
@@ -29,19 +29,34 @@ class PopupNoticeListResponse(BaseModel):
     notices: list[PopupNoticeSchema]
 
 
-class NoticeSchema(BaseModel):
-    """공지사항 목록 항목 응답 스키마"""
+class NoticeSummarySchema(BaseModel):
+    """공지사항 목록 항목 응답 스키마 (본문 제외)"""
 
+    project_cd: str = Field(alias="projectCd", serialization_alias="projectCd")
+    menu_cd: str = Field(alias="menuCd", serialization_alias="menuCd")
     board_seq: Optional[str] = Field(None, alias="boardSeq", serialization_alias="boardSeq")
     board_title: Optional[str] = Field(None, alias="boardTitle", serialization_alias="boardTitle")
-    board_txt: Optional[str] = Field(None, alias="boardTxt", serialization_alias="boardTxt")
     import_yn: Optional[str] = Field(None, alias="importYn", serialization_alias="importYn")
+    popup_yn: Optional[str] = Field(None, alias="popupYn", serialization_alias="popupYn")
+    board_category: Optional[str] = Field(
+        None, alias="boardCategory", serialization_alias="boardCategory"
+    )
     reg_dt: Optional[datetime] = Field(None, alias="regDt", serialization_alias="regDt")
+    mod_dt: Optional[datetime] = Field(None, alias="modDt", serialization_alias="modDt")
 
     model_config = {"populate_by_name": True, "from_attributes": True}
 
 
 class NoticeListResponse(BaseModel):
-    """공지사항 목록 응답"""
+    """공지사항 목록 응답 (페이지 단위)"""
+
+    notices: list[NoticeSummarySchema]
+    total: int = Field(0, description="전체 건수")
+    page: int = Field(1, description="페이지 번호 (1부터)")
+    size: int = Field(20, description="페이지 크기")
 
-    notices: list[NoticeSchema]
+
+class NoticeSchema(NoticeSummarySchema):
+    """공지사항 상세 응답 스키마 (본문 포함)"""
+
+    board_txt: Optional[str] = Field(None, alias="boardTxt", serialization_alias="boardTxt")
@@ -4,13 +4,19 @@ Board 도메인 Service
 """
 
 import logging
+from datetime import date
+from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from server.app.core.compression import PrecompressedBody
+from server.app.core.invalidation import get_invalidation_bus
+from server.app.domain.board.notice_cache import NOTICE_CHANNEL, get_popup_notice_cache
 from server.app.domain.board.repositories.board_repository import BoardRepository
 from server.app.domain.board.schemas import (
     NoticeListResponse,
     NoticeSchema,
+    NoticeSummarySchema,
     PopupNoticeListResponse,
     PopupNoticeSchema,
 )
@@ -25,14 +31,14 @@ class BoardService:
         self.db = db
         self.board_repo = BoardRepository(db)
 
-    async def get_popup_notices(self) -> PopupNoticeListResponse:
+    async def get_popup_notices(self, day: Optional[date] = None) -> PopupNoticeListResponse:
         """
-        오늘 날짜 기준 팝업 공지사항 목록을 반환합니다.
+        기준일(기본: 오늘) 팝업 공지사항 목록을 반환합니다.
 
         Returns:
             PopupNoticeListResponse: 팝업 공지사항 목록
         """
-        notices = await self.board_repo.get_popup_notices()
+        notices = await self.board_repo.get_popup_notices(day)
         logger.info(f"Popup notices fetched: {len(notices)} items")
 
         return PopupNoticeListResponse(
@@ -42,19 +48,55 @@ class BoardService:
             ]
         )
 
-    async def get_notices(self) -> NoticeListResponse:
+    async def get_popup_notices_json(self) -> PrecompressedBody:
         """
-        공지사항 목록을 반환합니다 (최신순).
+        오늘 날짜 팝업 공지사항 응답을 JSON 인코딩(+ 사전 압축)된 본문으로 반환합니다.
+
+        날짜 단위 캐시(PopupNoticeCache)에서 제공하므로 캐시 적중 시 DB 조회와
+        응답 검증/직렬화/압축을 모두 생략합니다.
+        """
+        return await get_popup_notice_cache().get_or_load(self._load_popup_notices_json)
+
+    async def _load_popup_notices_json(self, day: date) -> bytes:
+        response = await self.get_popup_notices(day)
+        return response.model_dump_json(by_alias=True).encode("utf-8")
+
+    async def invalidate_notice_cache(self) -> None:
+        """공지사항 변경 시 모든 워커의 공지 캐시를 무효화합니다."""
+        await get_invalidation_bus().publish(NOTICE_CHANNEL)
+        logger.info("Notice cache invalidated")
+
+    async def get_notices(
+        self, page: int = 1, size: int = 20, category: Optional[str] = None
+    ) -> NoticeListResponse:
+        """
+        공지사항 목록을 페이지 단위로 반환합니다 (최신순, 본문 제외).
 
         Returns:
             NoticeListResponse: 공지사항 목록
         """
-        notices = await self.board_repo.get_notices()
-        logger.info(f"Notices fetched: {len(notices)} items")
+        rows, total = await self.board_repo.get_notices((page - 1) * size, size, category)
+        logger.info(f"Notices fetched: {len(rows)}/{total} items (page={page})")
 
         return NoticeListResponse(
             notices=[
-                NoticeSchema.model_validate(notice, from_attributes=True)
-                for notice in notices
-            ]
+                NoticeSummarySchema.model_validate(row, from_attributes=True) for row in rows
+            ],
+            total=total,
+            page=page,
+            size=size,
         )
+
+    async def get_notice(
+        self, project_cd: str, menu_cd: str, board_seq: str
+    ) -> Optional[NoticeSchema]:
+        """
+        공지사항 상세(본문 포함)를 반환합니다.
+
+        Returns:
+            Optional[NoticeSchema]: 공지사항 상세 (없으면 None)
+        """
+        notice = await self.board_repo.get_notice(project_cd, menu_cd, board_seq)
+        if notice is None:
+            return None
+        return NoticeSchema.model_validate(notice, from_attributes=True)
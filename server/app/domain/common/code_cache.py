@@ -0,0 +1,88 @@
+"""
+Common 도메인 마스터 데이터 캐시
+사업장/부서/단위/운송유형 응답을 키 단위로 일정 시간 캐시
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from server.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CommonCodeCache:
+    """
+    공통 마스터 데이터 응답 캐시
+
+    사업장/부서/코드 상세는 거의 바뀌지 않지만 화면 진입마다 조회되므로
+    ttl_seconds 동안 응답 객체를 재사용합니다. (0이면 캐시하지 않음)
+
+    같은 키의 캐시 미스가 동시에 몰려도 로더는 1회만 실행합니다.
+    적재 중 invalidate()가 호출되면(세대 변경) 적재 결과는 반환만 하고 보관하지 않습니다.
+    """
+
+    def __init__(
+        self, ttl_seconds: float = 600, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: dict[str, tuple[Any, float]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._generation = 0
+
+    def _cached(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or self._clock() >= entry[1]:
+            return None
+        return entry[0]
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        """
+        key의 캐시된 응답을 반환하고, 없거나 만료되었으면 loader()로 적재합니다.
+
+        Args:
+            key: 캐시 키 (예: "sites_depts")
+            loader: 응답을 만드는 코루틴 함수
+        """
+        if self.ttl_seconds <= 0:
+            return await loader()
+
+        value = self._cached(key)
+        if value is not None:
+            return value
+
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            value = self._cached(key)
+            if value is not None:
+                return value
+
+            generation = self._generation
+            value = await loader()
+            if generation == self._generation:
+                self._entries[key] = (value, self._clock() + self.ttl_seconds)
+                logger.debug("공통 코드 캐시 적재: key=%s", key)
+            return value
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """key(없으면 전체)의 캐시를 비웁니다."""
+        self._generation += 1
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+_common_code_cache: Optional[CommonCodeCache] = None
+
+
+def get_common_code_cache() -> CommonCodeCache:
+    """공통 마스터 데이터 캐시를 반환합니다."""
+    global _common_code_cache
+    if _common_code_cache is None:
+        _common_code_cache = CommonCodeCache(settings.COMMON_CODE_CACHE_TTL_SECONDS)
+    return _common_code_cache
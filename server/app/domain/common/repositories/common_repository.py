@@ -2,53 +2,53 @@
 Common Repository
 사업장(CM_BusiPlace), 부서(CM_CodeDetail MT20), 단위(CM_CodeDetail MT35),
 운송유형(CM_CodeDetail MT16) 조회
+
+모든 조회는 응답에 필요한 컬럼만 Row로 반환합니다. (ORM 엔티티 생성 없음)
 """
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.app.domain.auth.models.cm_busi_place import CmBusiPlace
 from server.app.domain.auth.models.cm_code import CmCodeDetail
+from server.app.shared.base.repository import ReadOnlyQueryMixin
 
 
-class CommonRepository:
+class CommonRepository(ReadOnlyQueryMixin):
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
-    async def get_sites(self) -> list[CmBusiPlace]:
-        """전체 사업장 목록 조회 (사업장코드 순)"""
-        stmt = select(CmBusiPlace).order_by(CmBusiPlace.busi_place)
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+    async def get_sites(self) -> list[Row]:
+        """전체 사업장 목록 조회 (사업장코드 순) - busi_place, busi_place_name"""
+        stmt = select(CmBusiPlace.busi_place, CmBusiPlace.busi_place_name).order_by(
+            CmBusiPlace.busi_place
+        )
+        return await self.fetch_rows(stmt)
 
-    async def get_depts(self) -> list[CmCodeDetail]:
+    async def get_depts(self) -> list[Row]:
         """부서 목록 조회 - CM_CodeDetail.CODE_TYPE = 'MT20', USE_YN = 'Y'
         MGT_CHAR1 = 소속 사업장코드 (CM_BusiPlace.BUSI_PLACE 와 연결)
+        Row: code, code_name, mgt_char1
         """
         stmt = (
-            select(CmCodeDetail)
+            select(CmCodeDetail.code, CmCodeDetail.code_name, CmCodeDetail.mgt_char1)
             .where(CmCodeDetail.code_type == "MT20", CmCodeDetail.use_yn == "Y")
             .order_by(CmCodeDetail.mgt_char1, CmCodeDetail.sort_seq)
         )
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return await self.fetch_rows(stmt)
 
-    async def get_units(self) -> list[CmCodeDetail]:
-        """단위 목록 조회 - CM_CodeDetail.CODE_TYPE = 'MT35', USE_YN = 'Y'"""
-        stmt = (
-            select(CmCodeDetail)
-            .where(CmCodeDetail.code_type == "MT35", CmCodeDetail.use_yn == "Y")
-            .order_by(CmCodeDetail.sort_seq)
-        )
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+    async def get_units(self) -> list[Row]:
+        """단위 목록 조회 - CM_CodeDetail.CODE_TYPE = 'MT35', USE_YN = 'Y' (code, code_name)"""
+        return await self.fetch_rows(self._codes_statement("MT35"))
 
-    async def get_transport_types(self) -> list[CmCodeDetail]:
-        """운송 유형 목록 조회 - CM_CodeDetail.CODE_TYPE = 'MT16', USE_YN = 'Y'"""
-        stmt = (
-            select(CmCodeDetail)
-            .where(CmCodeDetail.code_type == "MT16", CmCodeDetail.use_yn == "Y")
+    async def get_transport_types(self) -> list[Row]:
+        """운송 유형 목록 조회 - CM_CodeDetail.CODE_TYPE = 'MT16', USE_YN = 'Y' (code, code_name)"""
+        return await self.fetch_rows(self._codes_statement("MT16"))
+
+    @staticmethod
+    def _codes_statement(code_type: str) -> Select:
+        return (
+            select(CmCodeDetail.code, CmCodeDetail.code_name)
+            .where(CmCodeDetail.code_type == code_type, CmCodeDetail.use_yn == "Y")
             .order_by(CmCodeDetail.sort_seq)
         )
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
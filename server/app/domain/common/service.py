@@ -1,12 +1,15 @@
 """
 Common Service
 사업장 + 부서 + 단위 + 운송유형 데이터 제공
+
+응답은 CommonCodeCache에 COMMON_CODE_CACHE_TTL_SECONDS 동안 보관됩니다.
 """
 
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from server.app.domain.common.code_cache import get_common_code_cache
 from server.app.domain.common.repositories.common_repository import CommonRepository
 from server.app.domain.common.schemas import (
     DeptSchema,
@@ -17,6 +20,7 @@ from server.app.domain.common.schemas import (
     UnitSchema,
     UnitsResponse,
 )
+from server.app.shared.base.service import FetchPlan
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +35,17 @@ class CommonService:
         사업장 + 부서 목록을 함께 반환합니다.
         사업장-부서 연결: CM_BusiPlace.BUSI_PLACE = CM_CodeDetail.MGT_CHAR1
         """
-        sites_rows = await self.common_repo.get_sites()
-        depts_rows = await self.common_repo.get_depts()
+        return await get_common_code_cache().get_or_load("sites_depts", self._load_sites_and_depts)
+
+    async def _load_sites_and_depts(self) -> SitesDeptResponse:
+        # 사업장/부서 조회는 서로 독립이므로 각각 별도 세션(연결)에서 동시에 실행
+        results = await (
+            FetchPlan(self.db)
+            .add("sites", lambda db, _: CommonRepository(db).get_sites())
+            .add("depts", lambda db, _: CommonRepository(db).get_depts())
+            .run()
+        )
+        sites_rows, depts_rows = results["sites"], results["depts"]
 
         sites = [
             SiteSchema(
@@ -58,6 +71,9 @@ class CommonService:
         단위 목록을 반환합니다.
         CM_CodeDetail.CODE_TYPE = 'MT35'
         """
+        return await get_common_code_cache().get_or_load("units", self._load_units)
+
+    async def _load_units(self) -> UnitsResponse:
         units_rows = await self.common_repo.get_units()
 
         units = [
@@ -75,6 +91,11 @@ class CommonService:
         운송 유형 목록을 반환합니다.
         CM_CodeDetail.CODE_TYPE = 'MT16', USE_YN = 'Y'
         """
+        return await get_common_code_cache().get_or_load(
+            "transport_types", self._load_transport_types
+        )
+
+    async def _load_transport_types(self) -> TransportTypesResponse:
         rows = await self.common_repo.get_transport_types()
 
         transport_types = [
@@ -86,3 +107,9 @@ class CommonService:
         ]
 
         return TransportTypesResponse(transport_types=transport_types)
+
+    async def warm_up(self) -> None:
+        """공통 마스터 데이터 캐시를 미리 적재합니다. (기동 시 워밍업)"""
+        await self.get_sites_and_depts()
+        await self.get_units()
+        await self.get_transport_types()
@@ -0,0 +1,5 @@
+"""Logistics 도메인 Calculator 패키지"""
+
+from .ngram_calculator import NgramCalculator
+
+__all__ = ["NgramCalculator"]
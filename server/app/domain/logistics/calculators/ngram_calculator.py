@@ -0,0 +1,60 @@
+"""
+Logistics 도메인 Calculator
+검색 색인용 n-gram(bigram) 생성
+"""
+
+from typing import Iterable, Optional
+
+
+class NgramCalculator:
+    """
+    n-gram 생성 Calculator
+
+    한글 부분 문자열 검색(LIKE '%x%')을 색인으로 대체하기 위해
+    문자열을 길이 N의 연속 부분 문자열 집합으로 분해합니다.
+
+    - 대소문자 구분 없이 비교하도록 소문자로 정규화
+    - 검색어의 모든 n-gram을 포함하는 문서만 후보가 되며,
+      최종 일치 여부는 원문 비교로 확인합니다 (후보 필터 용도)
+
+    순수 함수 기반, 외부 의존성/부수효과 없음.
+    """
+
+    N = 2
+
+    @staticmethod
+    def normalize(value: Optional[str]) -> str:
+        """색인/검색 공통 정규화 (앞뒤 공백 제거, 소문자 변환)"""
+        return (value or "").strip().lower()
+
+    @staticmethod
+    def grams(value: Optional[str]) -> set[str]:
+        """
+        문자열의 n-gram 집합을 반환합니다.
+
+        Args:
+            value: 원본 문자열
+
+        Returns:
+            set[str]: n-gram 집합 (N보다 짧은 문자열은 문자열 자체)
+        """
+        text = NgramCalculator.normalize(value)
+        if not text:
+            return set()
+        n = NgramCalculator.N
+        if len(text) < n:
+            return {text}
+        return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+    @staticmethod
+    def grams_of(values: Iterable[Optional[str]]) -> set[str]:
+        """여러 문자열의 n-gram 합집합을 반환합니다."""
+        result: set[str] = set()
+        for value in values:
+            result |= NgramCalculator.grams(value)
+        return result
+
+    @staticmethod
+    def is_indexable_term(term: Optional[str]) -> bool:
+        """검색어가 n-gram 색인을 사용할 수 있는 길이인지 여부"""
+        return len(NgramCalculator.normalize(term)) >= NgramCalculator.N
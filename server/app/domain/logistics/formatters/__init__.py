@@ -0,0 +1,6 @@
+"""Logistics 도메인 Formatter 패키지"""
+
+from .export_formatter import LogisticsExportFormatter
+from .list_formatter import LogisticsListFormatter
+
+__all__ = ["LogisticsExportFormatter", "LogisticsListFormatter"]
@@ -0,0 +1,135 @@
+"""
+Logistics Export Formatter
+반출입 이력 행 스트림 → CSV/XLSX 바이트 청크 변환
+"""
+
+import csv
+import io
+import tempfile
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator
+
+from starlette.concurrency import run_in_threadpool
+
+
+class LogisticsExportFormatter:
+    """
+    반출입 내보내기 포맷터
+
+    LogisticsRepository.stream_export_rows()가 내보내는 평탄화된 행(헤더 + 물품)을
+    한 번의 순회로 파일 청크로 변환합니다. 전체 행을 메모리에 모으지 않습니다.
+
+    - CSV: chunk_rows 행마다 UTF-8(BOM 포함, Excel 한글 호환) 청크를 내보냄
+    - XLSX: openpyxl write-only 모드로 임시 파일에 기록 후 청크 단위로 읽어 내보냄
+            (openpyxl 미설치 시 xlsx_available()이 False)
+    """
+
+    # (행 키, 열 제목)
+    COLUMNS: list[tuple[str, str]] = [
+        ("doc_no", "반출입번호"),
+        ("busi_place", "반출 사업장"),
+        ("export_date", "반출 일자"),
+        ("author_name", "작성자"),
+        ("author_dept", "작성 부서"),
+        ("partner_company", "협력업체"),
+        ("transport_type", "운송 유형"),
+        ("status", "상태"),
+        ("security_check_yn", "경비실 확인"),
+        ("receiver_check_yn", "인수자 확인"),
+        ("in_date", "등록 일시"),
+        ("item_seq", "순번"),
+        ("item_name", "자재명"),
+        ("item_spec", "규격"),
+        ("unit_code", "단위"),
+        ("maker", "메이커"),
+        ("quantity", "수량"),
+        ("reason", "반출 사유"),
+        ("note", "비고"),
+    ]
+
+    # 스프레드시트가 수식으로 해석하는 시작 문자 (CSV/수식 인젝션 방지용)
+    FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+    CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+    XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    def __init__(self, chunk_rows: int = 500, chunk_bytes: int = 64 * 1024) -> None:
+        self.chunk_rows = chunk_rows
+        self.chunk_bytes = chunk_bytes
+
+    @staticmethod
+    def xlsx_available() -> bool:
+        """XLSX 내보내기 가능 여부 (openpyxl 설치 여부)"""
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def titles(self) -> list[str]:
+        """열 제목 목록"""
+        return [title for _, title in self.COLUMNS]
+
+    def to_values(self, row: Any) -> list[Any]:
+        """행 → 셀 값 목록 (일시 문자열화, Decimal → float, 수식 시작 문자열은 ' 접두)"""
+        mapping = row._mapping
+        values: list[Any] = []
+        for key, _ in self.COLUMNS:
+            value = mapping[key]
+            if isinstance(value, datetime):
+                value = (
+                    value.strftime("%Y-%m-%d")
+                    if key == "export_date"
+                    else value.strftime("%Y-%m-%d %H:%M:%S")
+                )
+            elif isinstance(value, Decimal):
+                value = float(value)
+            elif isinstance(value, str) and value.startswith(self.FORMULA_PREFIXES):
+                # 사용자 입력(협력업체, 자재명, 비고 등)이 Excel에서 수식으로 실행되지 않도록 텍스트로 고정
+                value = "'" + value
+            values.append(value)
+        return values
+
+    async def csv_chunks(self, rows: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+        """행 스트림을 CSV 바이트 청크로 변환합니다."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.titles())
+        yield ("\ufeff" + buffer.getvalue()).encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+        pending = 0
+        async for row in rows:
+            writer.writerow(self.to_values(row))
+            pending += 1
+            if pending >= self.chunk_rows:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+
+        if pending:
+            yield buffer.getvalue().encode("utf-8")
+
+    async def xlsx_chunks(self, rows: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+        """
+        행 스트림을 XLSX 바이트 청크로 변환합니다.
+
+        XLSX는 ZIP 컨테이너라 모든 행을 기록한 뒤에야 파일이 완성되므로,
+        write-only 시트(행을 디스크에 바로 기록)와 임시 파일을 사용해 메모리를 일정하게 유지합니다.
+        """
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("반출입이력")
+        sheet.append(self.titles())
+        async for row in rows:
+            sheet.append(self.to_values(row))
+
+        with tempfile.TemporaryFile() as file:
+            await run_in_threadpool(workbook.save, file)
+            file.seek(0)
+            while chunk := await run_in_threadpool(file.read, self.chunk_bytes):
+                yield chunk
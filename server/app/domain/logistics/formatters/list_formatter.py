@@ -0,0 +1,47 @@
+"""
+Logistics List Formatter
+반출입 목록 Row → 목록 카드 응답 행(camelCase dict) 변환
+"""
+
+from typing import Any, Iterable
+
+
+class LogisticsListFormatter:
+    """
+    반출입 목록 포맷터
+
+    목록 응답은 수천 행이 될 수 있으므로 행마다 Pydantic 모델을 만들고 검증하지 않고,
+    LogisticsListItemSchema의 alias(camelCase)를 키로 하는 dict를 바로 만듭니다.
+    값은 DB에서 읽은 값이므로 검증은 요청 스키마(입력 경계)에서만 수행하고,
+    여기서는 JSON 타입 변환(Decimal → float, datetime → str)만 직접 맞춥니다.
+    키 구성은 LogisticsListItemSchema와 일치해야 합니다. (단위 테스트로 검증)
+    """
+
+    @staticmethod
+    def to_row(row) -> dict[str, Any]:
+        """
+        목록 Row → 목록 아이템 (LogisticsListItemSchema alias 키)
+
+        Args:
+            row: LogisticsRepository.LIST_COLUMNS Row (헤더 + 대표 물품 컬럼)
+        """
+        return {
+            "docNo": row.doc_no,
+            "outSite": row.busi_place,
+            "outSiteName": row.busi_place,  # 사업장명은 프론트에서 매핑
+            "department": row.author_dept,
+            "manager": row.author_name,
+            "company": row.partner_company,
+            "material": row.item_name,
+            "quantity": float(row.quantity) if row.quantity else None,
+            "unit": row.unit_code,
+            "securityCheck": row.security_check_yn,
+            "receiverCheck": row.receiver_check_yn,
+            "status": row.status,
+            "regDt": row.in_date.isoformat() if row.in_date else None,
+        }
+
+    def format(self, rows: Iterable) -> dict[str, Any]:
+        """목록 Row 목록 → 목록 응답 (LogisticsListResponse 형태)"""
+        items = [self.to_row(row) for row in rows]
+        return {"items": items, "total": len(items)}
@@ -1,6 +1,16 @@
 """Logistics 도메인 ORM 모델 패키지"""
 
 from .aw01010 import Aw01010
+from .aw01010_daily_stat import Aw01010DailyStat
+from .aw01010_del_log import Aw01010DelLog
+from .aw01010_search import Aw01010Ngram, Aw01010Search
 from .aw01011 import Aw01011
 
-__all__ = ["Aw01010", "Aw01011"]
+__all__ = [
+    "Aw01010",
+    "Aw01011",
+    "Aw01010Search",
+    "Aw01010Ngram",
+    "Aw01010DailyStat",
+    "Aw01010DelLog",
+]
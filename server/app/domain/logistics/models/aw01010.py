@@ -6,7 +6,7 @@ AW01010 - 반출입 기본정보
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Numeric, String, Unicode
+from sqlalchemy import DateTime, Index, Numeric, String, Unicode
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from server.app.core.database import Base
@@ -109,3 +109,24 @@ class Aw01010(Base):
 
     def __repr__(self) -> str:
         return f"<Aw01010(doc_no='{self.doc_no}', busi_place='{self.busi_place}', status='{self.status}')>"
+
+
+# ── 인덱스 ────────────────────────────────────────────────────────────────────
+# 목록 조회(get_list) 조건/정렬 형태에 맞춘 인덱스
+#   - 사업장 + 상태 + 반출일자 범위 (INCLUDE: 부서/등록일자 → 필터·정렬을 인덱스만으로 처리)
+#   - 부서 + 반출일자 범위
+#   - 등록일자 역순 정렬 (조건 없는 최신순 목록)
+#   - 수정일자 (증분 동기화: COALESCE(UP_DATE, IN_DATE) >= 기준시각을 OR 조건으로 분해하여 사용)
+Index(
+    "ix_AW01010_place_status_export",
+    Aw01010.busi_place,
+    Aw01010.status,
+    Aw01010.export_date,
+    mssql_include=["AUTHOR_DEPT", "IN_DATE"],
+    postgresql_include=["AUTHOR_DEPT", "IN_DATE"],
+)
+Index("ix_AW01010_dept_export", Aw01010.author_dept, Aw01010.export_date)
+Index("ix_AW01010_in_date_desc", Aw01010.in_date.desc())
+Index("ix_AW01010_status", Aw01010.status)
+Index("ix_AW01010_export_date", Aw01010.export_date)
+Index("ix_AW01010_up_date", Aw01010.up_date)
@@ -0,0 +1,56 @@
+"""
+Logistics 도메인 ORM 모델
+AW01010_DAILY_STAT - 반출입 일별 집계
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, Unicode
+from sqlalchemy.orm import Mapped, mapped_column
+
+from server.app.core.database import Base
+
+
+class Aw01010DailyStat(Base):
+    """반출입 일별 집계 (AW01010_DAILY_STAT)
+
+    반출 일자 + 사업장 + 부서 + 상태 + 운송 유형별 문서 수 및 확인 대기 건수.
+    AW01010 등록/수정/삭제 시 증감 방식으로 함께 갱신됩니다.
+    부서/운송 유형이 없는 문서는 빈 문자열('')로 집계합니다.
+    """
+
+    __tablename__ = "AW01010_DAILY_STAT"
+
+    # ── 복합 Primary Key ──────────────────────────────────────────────────────
+    stat_date: Mapped[datetime] = mapped_column(
+        "STAT_DATE", DateTime, primary_key=True, comment="반출 일자"
+    )
+    busi_place: Mapped[str] = mapped_column(
+        "BUSI_PLACE", Unicode(1), primary_key=True, comment="반출 사업장코드"
+    )
+    author_dept: Mapped[str] = mapped_column(
+        "AUTHOR_DEPT", Unicode(20), primary_key=True, comment="작성 담당자 부서코드"
+    )
+    status: Mapped[str] = mapped_column(
+        "STATUS", Unicode(2), primary_key=True, comment="상태(반출/반입)"
+    )
+    transport_type: Mapped[str] = mapped_column(
+        "TRANSPORT_TYPE", Unicode(2), primary_key=True, comment="운송 유형 코드"
+    )
+
+    # ── 집계 값 ───────────────────────────────────────────────────────────────
+    doc_cnt: Mapped[int] = mapped_column(
+        "DOC_CNT", Integer, nullable=False, default=0, comment="문서 수"
+    )
+    security_pending_cnt: Mapped[int] = mapped_column(
+        "SECURITY_PENDING_CNT", Integer, nullable=False, default=0, comment="경비실 확인 대기 건수"
+    )
+    receiver_pending_cnt: Mapped[int] = mapped_column(
+        "RECEIVER_PENDING_CNT", Integer, nullable=False, default=0, comment="인수자 확인 대기 건수"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<Aw01010DailyStat(stat_date='{self.stat_date}', busi_place='{self.busi_place}', "
+            f"status='{self.status}', doc_cnt={self.doc_cnt})>"
+        )
@@ -0,0 +1,41 @@
+"""
+Logistics 도메인 ORM 모델
+AW01010_DEL_LOG - 반출입 삭제 이력 (증분 동기화 tombstone)
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Integer, Unicode
+from sqlalchemy.orm import Mapped, mapped_column
+
+from server.app.core.database import Base
+
+
+class Aw01010DelLog(Base):
+    """반출입 삭제 이력 (AW01010_DEL_LOG)
+
+    AW01010 문서 삭제 시 1행씩 기록합니다.
+    모바일 증분 동기화(/logistics/sync)에서 삭제된 문서를 알려주는 데 사용합니다.
+    """
+
+    __tablename__ = "AW01010_DEL_LOG"
+
+    log_seq: Mapped[int] = mapped_column(
+        "LOG_SEQ", Integer, primary_key=True, autoincrement=True, comment="이력 순번"
+    )
+    doc_no: Mapped[str] = mapped_column(
+        "DOC_NO", Unicode(13), nullable=False, comment="반출입번호"
+    )
+    busi_place: Mapped[str] = mapped_column(
+        "BUSI_PLACE", Unicode(1), nullable=False, comment="반출 사업장코드"
+    )
+    del_date: Mapped[datetime] = mapped_column(
+        "DEL_DATE", DateTime, nullable=False, index=True, comment="삭제 일시"
+    )
+    del_user: Mapped[Optional[str]] = mapped_column(
+        "DEL_USER", Unicode(50), nullable=True, comment="삭제자"
+    )
+
+    def __repr__(self) -> str:
+        return f"<Aw01010DelLog(doc_no='{self.doc_no}', del_date='{self.del_date}')>"
@@ -0,0 +1,67 @@
+"""
+Logistics 도메인 ORM 모델
+AW01010_SEARCH - 반출입 검색 문서 (MSSQL 전문 검색 대상)
+AW01010_NGRAM  - 반출입 n-gram 검색 색인 (전문 검색 미지원 환경용)
+"""
+
+from sqlalchemy import String, Unicode, UnicodeText
+from sqlalchemy.orm import Mapped, mapped_column
+
+from server.app.core.database import Base
+
+
+class Aw01010Search(Base):
+    """반출입 검색 문서 (AW01010_SEARCH)
+
+    문서별 검색 대상 텍스트를 한 행으로 모은 테이블.
+    MSSQL에서는 DOC_NO(PK)를 키 인덱스로 하는 전문 검색(Full-Text) 인덱스를 생성합니다.
+    AW01010 등록/수정/삭제 시 함께 갱신됩니다.
+    """
+
+    __tablename__ = "AW01010_SEARCH"
+
+    doc_no: Mapped[str] = mapped_column(
+        "DOC_NO", Unicode(13), primary_key=True, comment="반출입번호"
+    )
+    company_text: Mapped[str] = mapped_column(
+        "COMPANY_TEXT", Unicode(100), nullable=False, default="", comment="협력업체 검색 텍스트"
+    )
+    material_text: Mapped[str] = mapped_column(
+        "MATERIAL_TEXT",
+        UnicodeText,
+        nullable=False,
+        default="",
+        comment="자재명/규격/메이커 검색 텍스트",
+    )
+
+    def __repr__(self) -> str:
+        return f"<Aw01010Search(doc_no='{self.doc_no}')>"
+
+
+class Aw01010Ngram(Base):
+    """반출입 n-gram 검색 색인 (AW01010_NGRAM)
+
+    (FIELD_CD, GRAM, DOC_NO) 복합 PK.
+    FIELD_CD: C = 협력업체, M = 자재명/규격/메이커
+    """
+
+    __tablename__ = "AW01010_NGRAM"
+
+    FIELD_COMPANY = "C"
+    FIELD_MATERIAL = "M"
+
+    field_cd: Mapped[str] = mapped_column(
+        "FIELD_CD", String(1), primary_key=True, comment="검색 필드 구분"
+    )
+    gram: Mapped[str] = mapped_column(
+        "GRAM", Unicode(2), primary_key=True, comment="n-gram"
+    )
+    doc_no: Mapped[str] = mapped_column(
+        "DOC_NO", Unicode(13), primary_key=True, index=True, comment="반출입번호"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<Aw01010Ngram(field_cd='{self.field_cd}', gram='{self.gram}', "
+            f"doc_no='{self.doc_no}')>"
+        )
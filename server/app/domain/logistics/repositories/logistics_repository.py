@@ -3,29 +3,41 @@ Logistics Repository
 AW01010(반출입 기본정보) + AW01011(물품목록) DB 접근
 """
 
+import itertools
 import json
 import logging
+import operator
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, Row, Select, String, and_, bindparam, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from server.app.domain.logistics.models.aw01010 import Aw01010
+from server.app.domain.logistics.models.aw01010_del_log import Aw01010DelLog
 from server.app.domain.logistics.models.aw01011 import Aw01011
+from server.app.domain.logistics.repositories.search_repository import (
+    LogisticsSearchRepository,
+)
+from server.app.domain.logistics.repositories.stats_repository import (
+    LogisticsStatsRepository,
+)
 from server.app.domain.logistics.schemas import (
     LogisticsCreateRequest,
     LogisticsSearchParams,
     LogisticsUpdateRequest,
 )
+from server.app.shared.base.repository import ReadOnlyQueryMixin
 
 logger = logging.getLogger(__name__)
 
 
-class LogisticsRepository:
+class LogisticsRepository(ReadOnlyQueryMixin):
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
+        self.search = LogisticsSearchRepository(db)
+        self.stats = LogisticsStatsRepository(db)
 
     # ── 채번 ──────────────────────────────────────────────────────────────────
 
@@ -51,46 +63,287 @@ class LogisticsRepository:
 
     # ── 조회 ──────────────────────────────────────────────────────────────────
 
-    async def get_list(self, params: LogisticsSearchParams) -> list[Aw01010]:
-        """반출입 목록 조회 (물품목록 포함)"""
-        stmt = (
-            select(Aw01010)
-            .options(selectinload(Aw01010.items))
-            .order_by(Aw01010.in_date.desc())
-        )
+    # 기간 조건의 한쪽만 지정된 경우 나머지 경계값 (DATETIME 표현 범위 안의 값)
+    MIN_EXPORT_DATE = "1900-01-01"
+    MAX_EXPORT_DATE = "9999-12-31"
 
+    # 값 비교 조건 조합별로 한 번만 만든 쿼리 (키: (쿼리 종류, 사용한 바인드 파라미터명))
+    _shapes: dict[tuple[str, frozenset[str]], Select] = {}
+
+    @classmethod
+    def _filter_values(cls, params: LogisticsSearchParams) -> dict[str, Any]:
+        """
+        값 비교 검색 조건(사업장/부서/상태/기간)의 바인드 값
+
+        기간은 한쪽만 지정해도 항상 시작/종료 쌍으로 바인딩하여 쿼리 형태를 줄입니다.
+        (한쪽 조건만으로도 EXPORT_DATE가 NULL인 행은 제외되므로 결과는 같음)
+        """
+        values: dict[str, Any] = {}
         if params.out_site:
-            stmt = stmt.where(Aw01010.busi_place == params.out_site)
+            values["out_site"] = params.out_site
         if params.out_dept:
-            stmt = stmt.where(Aw01010.author_dept == params.out_dept)
+            values["out_dept"] = params.out_dept
+        if params.status:
+            values["status"] = params.status
+        if params.start_date or params.end_date:
+            values["start_date"] = params.start_date or cls.MIN_EXPORT_DATE
+            values["end_date"] = params.end_date or cls.MAX_EXPORT_DATE
+        return values
+
+    @staticmethod
+    def _value_conditions(names: frozenset[str]) -> list[ColumnElement[bool]]:
+        """바인드 파라미터명 집합에 해당하는 WHERE 조건 (값은 실행 시 전달)"""
+        conditions = []
+        if "out_site" in names:
+            conditions.append(Aw01010.busi_place == bindparam("out_site"))
+        if "out_dept" in names:
+            conditions.append(Aw01010.author_dept == bindparam("out_dept"))
+        if "status" in names:
+            conditions.append(Aw01010.status == bindparam("status"))
+        if "start_date" in names:
+            # 'YYYY-MM-DD' 문자열로 바인딩 (DB에서 일시로 변환하여 비교)
+            conditions.append(Aw01010.export_date >= bindparam("start_date", type_=String()))
+            conditions.append(Aw01010.export_date <= bindparam("end_date", type_=String()))
+        return conditions
+
+    def _filtered_query(
+        self, kind: str, build: Callable[[], Select], params: LogisticsSearchParams
+    ) -> tuple[Select, dict[str, Any]]:
+        """
+        검색 조건을 적용한 쿼리와 바인드 값 (목록/내보내기 공용)
+
+        값 비교 조건은 값 대신 이름 있는 바인드 파라미터로 넣고, 사용한 조건 조합별로
+        만든 쿼리 객체를 재사용합니다. 같은 쿼리 객체는 캐시 키도 한 번만 계산되므로
+        요청마다 select() 생성/캐시 키 계산/컴파일 비용이 없습니다. (조합은 최대 16가지,
+        기동 시 warmup_statements()로 미리 컴파일)
+
+        (:p IS NULL OR 컬럼 = :p) 형태의 고정 조건은 쿼리를 1개로 줄이지만
+        복합 인덱스(사업장+상태+반출일자, 부서+반출일자) 탐색을 막으므로 사용하지 않습니다.
+
+        협력업체/자재 검색어 조건은 검색 방식에 따라 서브쿼리 형태가 달라지므로
+        값이 있을 때만 매 요청 추가합니다.
+        """
+        values = self._filter_values(params)
+        key = (kind, frozenset(values))
+        stmt = self._shapes.get(key)
+        if stmt is None:
+            stmt = build().where(*self._value_conditions(key[1]))
+            self._shapes[key] = stmt
+
         if params.company:
-            stmt = stmt.where(Aw01010.partner_company.contains(params.company))
+            stmt = stmt.where(self.search.company_condition(params.company))
         if params.material:
-            # 물품명으로 검색 (서브쿼리)
-            item_subq = select(Aw01011.doc_no).where(
-                Aw01011.item_name.contains(params.material)
+            # 자재명/규격/메이커로 검색 (검색 색인 사용)
+            stmt = stmt.where(self.search.material_condition(params.material))
+        return stmt, values
+
+    # 목록 카드에 필요한 컬럼 (헤더 + 첫 번째 물품)
+    LIST_COLUMNS = (
+        Aw01010.doc_no,
+        Aw01010.busi_place,
+        Aw01010.author_dept,
+        Aw01010.author_name,
+        Aw01010.partner_company,
+        Aw01010.security_check_yn,
+        Aw01010.receiver_check_yn,
+        Aw01010.status,
+        Aw01010.in_date,
+        Aw01010.up_date,
+        Aw01011.item_name,
+        Aw01011.quantity,
+        Aw01011.unit_code,
+    )
+
+    def _list_select(self) -> Select:
+        """
+        목록 카드 컬럼 조회 쿼리 (ORM 엔티티/물품 전체 로딩 없음)
+
+        대표 물품은 순번이 가장 작은 물품 1건만 OUTER JOIN합니다.
+        (AW01011 PK(DOC_NO, ITEM_SEQ) 탐색으로 문서당 1행)
+        """
+        first_seq = (
+            select(func.min(Aw01011.item_seq))
+            .where(Aw01011.doc_no == Aw01010.doc_no)
+            .correlate(Aw01010)
+            .scalar_subquery()
+        )
+        return (
+            select(*self.LIST_COLUMNS)
+            .select_from(Aw01010)
+            .outerjoin(
+                Aw01011,
+                and_(Aw01011.doc_no == Aw01010.doc_no, Aw01011.item_seq == first_seq),
             )
-            stmt = stmt.where(Aw01010.doc_no.in_(item_subq))
-        if params.status:
-            stmt = stmt.where(Aw01010.status == params.status)
-        if params.start_date:
-            stmt = stmt.where(Aw01010.export_date >= params.start_date)
-        if params.end_date:
-            stmt = stmt.where(Aw01010.export_date <= params.end_date)
+        )
 
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+    def list_query(self, params: LogisticsSearchParams) -> tuple[Select, dict[str, Any]]:
+        """반출입 목록 조회 쿼리와 바인드 값 (검색 조건 적용)"""
+        return self._filtered_query(
+            "list", lambda: self._list_select().order_by(Aw01010.in_date.desc()), params
+        )
 
-    async def get_by_doc_no(self, doc_no: str) -> Optional[Aw01010]:
-        """반출입번호로 단건 조회"""
+    def list_statement(self, params: LogisticsSearchParams) -> Select:
+        """반출입 목록 조회 쿼리 (바인드 값 포함, 실행 계획 확인 등 단독 사용용)"""
+        stmt, values = self.list_query(params)
+        return stmt.params(values)
+
+    def list_shapes(self) -> list[tuple[Select, list[str]]]:
+        """검색어 조건이 없는 목록 쿼리 형태 전체와 바인드 파라미터명 (사업장/부서/상태/기간 조합)"""
+        shapes = []
+        for site, dept, status, date in itertools.product((None, "-"), repeat=4):
+            stmt, values = self.list_query(
+                LogisticsSearchParams(out_site=site, out_dept=dept, status=status, start_date=date)
+            )
+            shapes.append((stmt, list(values)))
+        return shapes
+
+    async def get_list(self, params: LogisticsSearchParams) -> list[Row]:
+        """반출입 목록 조회 (목록 카드 컬럼 Row, LIST_COLUMNS 참고)"""
+        stmt, values = self.list_query(params)
+        return await self.fetch_rows(stmt, values)
+
+    @staticmethod
+    def _export_select() -> Select:
+        """
+        반출입 내보내기 컬럼 조회 쿼리
+
+        헤더(AW01010)와 물품(AW01011)을 OUTER JOIN하여 물품 1건당 1행으로 평탄화합니다.
+        ORM 객체를 만들지 않도록 컬럼 단위로 조회하며, 사진 데이터(PHOTO_DATA)는 제외합니다.
+        """
+        return (
+            select(
+                Aw01010.doc_no,
+                Aw01010.busi_place,
+                Aw01010.export_date,
+                Aw01010.author_name,
+                Aw01010.author_dept,
+                Aw01010.partner_company,
+                Aw01010.transport_type,
+                Aw01010.status,
+                Aw01010.security_check_yn,
+                Aw01010.receiver_check_yn,
+                Aw01010.in_date,
+                Aw01011.item_seq,
+                Aw01011.item_name,
+                Aw01011.item_spec,
+                Aw01011.unit_code,
+                Aw01011.maker,
+                Aw01011.quantity,
+                Aw01011.reason,
+                Aw01011.note,
+            )
+            .outerjoin(Aw01011, Aw01011.doc_no == Aw01010.doc_no)
+            .order_by(Aw01010.in_date.desc(), Aw01010.doc_no, Aw01011.item_seq)
+        )
+
+    def export_query(self, params: LogisticsSearchParams) -> tuple[Select, dict[str, Any]]:
+        """반출입 내보내기 쿼리와 바인드 값 (검색 조건 적용)"""
+        return self._filtered_query("export", self._export_select, params)
+
+    async def stream_export_rows(
+        self, params: LogisticsSearchParams, batch_size: int = 500
+    ) -> AsyncIterator[Row]:
+        """
+        반출입 내보내기 행을 서버 측 커서로 스트리밍합니다.
+
+        yield_per로 batch_size 행씩만 가져오므로 전체 이력 규모와 무관하게
+        메모리 사용량이 일정합니다.
+        """
+        stmt, values = self.export_query(params)
+        result = await self.db.stream(stmt.execution_options(yield_per=batch_size), values)
+        try:
+            async for row in result:
+                yield row
+        finally:
+            await result.close()
+
+    # ── 증분 동기화 ───────────────────────────────────────────────────────────
+
+    @staticmethod
+    def sync_timestamp():
+        """문서 변경 시각 COALESCE(UP_DATE, IN_DATE)"""
+        return func.coalesce(Aw01010.up_date, Aw01010.in_date)
+
+    async def get_changed_since(
+        self,
+        since: Optional[datetime],
+        out_site: Optional[str],
+        limit: int,
+        after_doc_no: Optional[str] = None,
+    ) -> list[Row]:
+        """
+        since 이후 등록/수정된 문서를 (변경 시각, 반출입번호) 순으로 조회합니다. (목록 카드 컬럼 Row)
+
+        COALESCE(UP_DATE, IN_DATE) >= since 조건은 인덱스를 사용할 수 있도록
+        (UP_DATE >= since) OR (UP_DATE IS NULL AND IN_DATE >= since)로 분해합니다.
+
+        after_doc_no가 있으면 (변경 시각, 반출입번호) > (since, after_doc_no)인 문서만 조회합니다.
+        (같은 시각에 limit보다 많은 문서가 변경되어도 다음 페이지로 넘어갈 수 있도록)
+        """
         stmt = (
+            self._list_select()
+            .order_by(self.sync_timestamp(), Aw01010.doc_no)
+            .limit(limit)
+        )
+        if since is not None and after_doc_no is not None:
+            stmt = stmt.where(
+                or_(
+                    self._changed_at(operator.gt, since),
+                    and_(self._changed_at(operator.eq, since), Aw01010.doc_no > after_doc_no),
+                )
+            )
+        elif since is not None:
+            stmt = stmt.where(self._changed_at(operator.ge, since))
+        if out_site:
+            stmt = stmt.where(Aw01010.busi_place == out_site)
+        return await self.fetch_rows(stmt)
+
+    @staticmethod
+    def _changed_at(op: Callable[[Any, Any], Any], since: datetime) -> ColumnElement[bool]:
+        """op(COALESCE(UP_DATE, IN_DATE), since)를 인덱스를 쓸 수 있는 형태로 분해"""
+        return or_(
+            op(Aw01010.up_date, since),
+            and_(Aw01010.up_date.is_(None), op(Aw01010.in_date, since)),
+        )
+
+    async def get_deleted_since(self, since: datetime, out_site: Optional[str]) -> list[str]:
+        """since 이후 삭제된 반출입번호 목록 (삭제 이력 기준)"""
+        stmt = (
+            select(Aw01010DelLog.doc_no)
+            .where(Aw01010DelLog.del_date >= since)
+            .order_by(Aw01010DelLog.del_date)
+        )
+        if out_site:
+            stmt = stmt.where(Aw01010DelLog.busi_place == out_site)
+        result = await self.db.execute(stmt)
+        return list(dict.fromkeys(result.scalars().all()))
+
+    @staticmethod
+    def detail_statement(doc_no: str) -> Select:
+        """반출입번호 단건 조회 쿼리 (물품 포함)"""
+        return (
             select(Aw01010)
             .options(selectinload(Aw01010.items))
             .where(Aw01010.doc_no == doc_no)
         )
-        result = await self.db.execute(stmt)
+
+    async def get_by_doc_no(self, doc_no: str) -> Optional[Aw01010]:
+        """반출입번호로 단건 조회"""
+        result = await self.db.execute(self.detail_statement(doc_no))
         return result.scalar_one_or_none()
 
+    def warmup_statements(self) -> list[Select | tuple[Select, list[str]]]:
+        """
+        기동 시 미리 컴파일할 자주 쓰는 조회 쿼리 (목록/상세/통계)
+
+        목록은 검색어 조건이 없는 값 비교 조건 조합(16가지)을 모두 포함합니다.
+        """
+        return [
+            *self.list_shapes(),
+            self.detail_statement("-"),
+            self.stats.stats_statement(LogisticsSearchParams()),
+        ]
+
     # ── 생성 ──────────────────────────────────────────────────────────────────
 
     async def create(self, req: LogisticsCreateRequest, login_id: str) -> Aw01010:
@@ -140,6 +393,8 @@ class LogisticsRepository:
             self.db.add(item)
 
         await self.db.flush()
+        await self.search.index_document(doc_no, req.partner_company, req.items)
+        await self.stats.apply_change(None, self.stats.snapshot(header))
         logger.info("반출 등록 완료: doc_no=%s, user=%s", doc_no, login_id)
         return header
 
@@ -153,6 +408,7 @@ class LogisticsRepository:
         if header is None:
             return None
 
+        stat_before = self.stats.snapshot(header)
         now = datetime.now()
 
         if req.export_date is not None:
@@ -215,18 +471,40 @@ class LogisticsRepository:
                 self.db.add(item)
 
         await self.db.flush()
+        if req.partner_company is not None or req.items is not None:
+            await self.search.index_document(
+                doc_no,
+                header.partner_company,
+                req.items if req.items is not None else header.items,
+            )
+        await self.stats.apply_change(stat_before, self.stats.snapshot(header))
         logger.info("반출입 수정 완료: doc_no=%s, user=%s", doc_no, login_id)
         return header
 
     # ── 삭제 ──────────────────────────────────────────────────────────────────
 
-    async def delete(self, doc_no: str) -> bool:
-        """반출입 삭제 (물품목록 cascade 삭제)"""
+    async def delete(self, doc_no: str, login_id: Optional[str] = None) -> Optional[str]:
+        """
+        반출입 삭제 (물품목록 cascade 삭제, 삭제 이력 기록)
+
+        Returns:
+            Optional[str]: 삭제한 문서의 사업장코드 (문서가 없으면 None)
+        """
         header = await self.get_by_doc_no(doc_no)
         if header is None:
-            return False
+            return None
 
         await self.db.delete(header)
+        self.db.add(
+            Aw01010DelLog(
+                doc_no=doc_no,
+                busi_place=header.busi_place,
+                del_date=datetime.now(),
+                del_user=login_id,
+            )
+        )
+        await self.search.remove_document(doc_no)
+        await self.stats.apply_change(self.stats.snapshot(header), None)
         await self.db.flush()
-        logger.info("반출입 삭제 완료: doc_no=%s", doc_no)
-        return True
+        logger.info("반출입 삭제 완료: doc_no=%s, user=%s", doc_no, login_id)
+        return header.busi_place
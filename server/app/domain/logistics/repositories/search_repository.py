@@ -0,0 +1,171 @@
+"""
+Logistics Search Repository
+AW01010_SEARCH(검색 문서) + AW01010_NGRAM(n-gram 색인) 유지 및 검색 조건 생성
+"""
+
+import logging
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import ColumnElement, and_, delete, distinct, func, insert, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from server.app.core.config import settings
+from server.app.domain.logistics.calculators.ngram_calculator import NgramCalculator
+from server.app.domain.logistics.models.aw01010 import Aw01010
+from server.app.domain.logistics.models.aw01010_search import Aw01010Ngram, Aw01010Search
+from server.app.domain.logistics.models.aw01011 import Aw01011
+
+logger = logging.getLogger(__name__)
+
+
+class LogisticsSearchRepository:
+    """
+    반출입 검색 색인 Repository
+
+    검색 방식 (settings.LOGISTICS_SEARCH_MODE):
+        - like:     기존 LIKE '%x%' 검색 (색인 미사용)
+        - ngram:    AW01010_NGRAM에서 검색어의 모든 bigram을 포함하는 문서를 후보로 좁힌 뒤
+                    후보 문서에 대해서만 원문 LIKE 비교 (결과는 like 모드와 동일)
+        - fulltext: AW01010_SEARCH의 MSSQL 전문 검색 인덱스에 CONTAINS 접두어 검색
+                    (단어 단위 검색이므로 단어 중간 문자열은 일치하지 않음)
+
+    색인(AW01010_SEARCH, AW01010_NGRAM)은 검색 방식과 무관하게 등록/수정/삭제 시 항상 갱신되므로
+    rebuild() 1회 실행 후 언제든 검색 방식을 전환할 수 있습니다.
+    """
+
+    def __init__(self, db: AsyncSession, mode: Optional[str] = None) -> None:
+        self.db = db
+        self.mode = mode or settings.LOGISTICS_SEARCH_MODE
+
+    # ── 색인 갱신 ─────────────────────────────────────────────────────────────
+
+    async def index_document(
+        self, doc_no: str, partner_company: Optional[str], items: Iterable[Any]
+    ) -> None:
+        """
+        문서의 검색 색인을 (재)생성합니다.
+
+        Args:
+            doc_no: 반출입번호
+            partner_company: 협력업체명
+            items: item_name / item_spec / maker 속성을 가진 물품 목록
+                   (AW01011 ORM 객체 또는 ItemCreateSchema)
+        """
+        material_values: list[Optional[str]] = []
+        for item in items:
+            material_values.extend([item.item_name, item.item_spec, item.maker])
+
+        await self.remove_document(doc_no)
+
+        await self.db.execute(
+            insert(Aw01010Search).values(
+                doc_no=doc_no,
+                company_text=NgramCalculator.normalize(partner_company),
+                material_text="\n".join(
+                    NgramCalculator.normalize(v) for v in material_values if v
+                ),
+            )
+        )
+
+        rows = [
+            {"field_cd": Aw01010Ngram.FIELD_COMPANY, "gram": gram, "doc_no": doc_no}
+            for gram in NgramCalculator.grams(partner_company)
+        ] + [
+            {"field_cd": Aw01010Ngram.FIELD_MATERIAL, "gram": gram, "doc_no": doc_no}
+            for gram in NgramCalculator.grams_of(material_values)
+        ]
+        if rows:
+            await self.db.execute(insert(Aw01010Ngram), rows)
+
+    async def remove_document(self, doc_no: str) -> None:
+        """문서의 검색 색인을 삭제합니다."""
+        await self.db.execute(delete(Aw01010Ngram).where(Aw01010Ngram.doc_no == doc_no))
+        await self.db.execute(delete(Aw01010Search).where(Aw01010Search.doc_no == doc_no))
+
+    async def rebuild(self, batch_size: int = 500) -> int:
+        """
+        전체 반출입 문서의 검색 색인을 재생성합니다.
+
+        색인 도입 전 등록된 문서를 색인하거나 색인 불일치를 복구할 때 사용합니다.
+        배치 단위로 flush하며, 커밋은 호출자가 수행합니다.
+
+        Returns:
+            int: 색인한 문서 수
+        """
+        count = 0
+        last_doc_no = ""
+        while True:
+            stmt = (
+                select(Aw01010)
+                .options(selectinload(Aw01010.items))
+                .where(Aw01010.doc_no > last_doc_no)
+                .order_by(Aw01010.doc_no)
+                .limit(batch_size)
+            )
+            headers = list((await self.db.execute(stmt)).scalars().all())
+            if not headers:
+                break
+            for header in headers:
+                await self.index_document(header.doc_no, header.partner_company, header.items)
+            await self.db.flush()
+            self.db.expunge_all()
+            count += len(headers)
+            last_doc_no = headers[-1].doc_no
+
+        logger.info("반출입 검색 색인 재생성 완료: %d건", count)
+        return count
+
+    # ── 검색 조건 ─────────────────────────────────────────────────────────────
+
+    def company_condition(self, term: str) -> ColumnElement[bool]:
+        """협력업체 검색 조건 (AW01010 기준 WHERE 절)"""
+        if self.mode == "fulltext":
+            return Aw01010.doc_no.in_(
+                self._fulltext_candidates("COMPANY_TEXT", "ft_company", term)
+            )
+
+        condition = Aw01010.partner_company.contains(term)
+        if self.mode == "ngram" and NgramCalculator.is_indexable_term(term):
+            candidates = self._ngram_candidates(Aw01010Ngram.FIELD_COMPANY, term)
+            return and_(Aw01010.doc_no.in_(candidates), condition)
+        return condition
+
+    def material_condition(self, term: str) -> ColumnElement[bool]:
+        """자재(자재명/규격/메이커) 검색 조건 (AW01010 기준 WHERE 절)"""
+        if self.mode == "fulltext":
+            return Aw01010.doc_no.in_(
+                self._fulltext_candidates("MATERIAL_TEXT", "ft_material", term)
+            )
+
+        item_stmt = select(Aw01011.doc_no).where(
+            or_(
+                Aw01011.item_name.contains(term),
+                Aw01011.item_spec.contains(term),
+                Aw01011.maker.contains(term),
+            )
+        )
+        if self.mode == "ngram" and NgramCalculator.is_indexable_term(term):
+            candidates = self._ngram_candidates(Aw01010Ngram.FIELD_MATERIAL, term)
+            item_stmt = item_stmt.where(Aw01011.doc_no.in_(candidates))
+        return Aw01010.doc_no.in_(item_stmt)
+
+    def _ngram_candidates(self, field_cd: str, term: str):
+        """검색어의 모든 n-gram을 포함하는 문서번호 서브쿼리"""
+        grams = NgramCalculator.grams(term)
+        return (
+            select(Aw01010Ngram.doc_no)
+            .where(Aw01010Ngram.field_cd == field_cd, Aw01010Ngram.gram.in_(grams))
+            .group_by(Aw01010Ngram.doc_no)
+            .having(func.count(distinct(Aw01010Ngram.gram)) == len(grams))
+        )
+
+    @staticmethod
+    def _fulltext_candidates(column: str, param: str, term: str):
+        """MSSQL CONTAINS 접두어 검색 문서번호 서브쿼리"""
+        keyword = NgramCalculator.normalize(term).replace('"', "")
+        return select(Aw01010Search.doc_no).where(
+            text(f"CONTAINS([AW01010_SEARCH].[{column}], :{param})").bindparams(
+                **{param: f'"{keyword}*"'}
+            )
+        )
@@ -0,0 +1,325 @@
+"""
+Logistics Stats Repository
+반출입 통계 집계 (AW01010 GROUP BY / AW01010_DAILY_STAT 일별 집계 유지)
+"""
+
+import logging
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from sqlalchemy import (
+    Insert,
+    Row,
+    Select,
+    Update,
+    case,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.app.core.config import settings
+from server.app.domain.logistics.models.aw01010 import Aw01010
+from server.app.domain.logistics.models.aw01010_daily_stat import Aw01010DailyStat
+from server.app.domain.logistics.schemas import LogisticsSearchParams
+
+logger = logging.getLogger(__name__)
+
+# MSSQL 집계 행 증가 (없으면 추가)
+# HOLDLOCK(SERIALIZABLE) 없이는 두 MERGE가 모두 "없음"으로 판단해 같은 키를 추가할 수 있음
+MERGE_INCREMENT = text(
+    """
+    MERGE AW01010_DAILY_STAT WITH (HOLDLOCK) AS target
+    USING (
+        SELECT :stat_date AS STAT_DATE, :busi_place AS BUSI_PLACE, :author_dept AS AUTHOR_DEPT,
+               :status AS STATUS, :transport_type AS TRANSPORT_TYPE
+    ) AS source
+    ON target.STAT_DATE = source.STAT_DATE
+       AND target.BUSI_PLACE = source.BUSI_PLACE
+       AND target.AUTHOR_DEPT = source.AUTHOR_DEPT
+       AND target.STATUS = source.STATUS
+       AND target.TRANSPORT_TYPE = source.TRANSPORT_TYPE
+    WHEN MATCHED THEN UPDATE SET
+        DOC_CNT = target.DOC_CNT + 1,
+        SECURITY_PENDING_CNT = target.SECURITY_PENDING_CNT + :security_pending,
+        RECEIVER_PENDING_CNT = target.RECEIVER_PENDING_CNT + :receiver_pending
+    WHEN NOT MATCHED THEN INSERT (
+        STAT_DATE, BUSI_PLACE, AUTHOR_DEPT, STATUS, TRANSPORT_TYPE,
+        DOC_CNT, SECURITY_PENDING_CNT, RECEIVER_PENDING_CNT
+    ) VALUES (
+        source.STAT_DATE, source.BUSI_PLACE, source.AUTHOR_DEPT, source.STATUS,
+        source.TRANSPORT_TYPE, 1, :security_pending, :receiver_pending
+    );
+    """
+)
+
+
+class StatEntry(NamedTuple):
+    """문서 1건이 일별 집계에 기여하는 값"""
+
+    stat_date: datetime
+    busi_place: str
+    author_dept: str
+    status: str
+    transport_type: str
+    security_pending: int
+    receiver_pending: int
+
+
+class LogisticsStatsRepository:
+    """
+    반출입 통계 Repository
+
+    집계 원본 (settings.LOGISTICS_STATS_SOURCE):
+        - live:    AW01010을 (반출 일자, 사업장, 부서, 상태, 운송 유형)으로 GROUP BY
+        - summary: AW01010_DAILY_STAT에서 같은 형태의 행을 조회 (문서 수와 무관하게 일정한 비용)
+
+    두 원본 모두 같은 컬럼 형태의 행을 반환하므로 서비스에서 동일하게 합산합니다.
+    일별 집계는 원본과 무관하게 등록/수정/삭제 시 항상 증감 갱신되므로
+    rebuild() 1회 실행 후 언제든 원본을 전환할 수 있습니다.
+
+    반출 일자(EXPORT_DATE)는 등록/수정 시 항상 자정(일자 단위)으로 저장되므로 그대로 일자 키로 사용합니다.
+    """
+
+    def __init__(self, db: AsyncSession, source: Optional[str] = None) -> None:
+        self.db = db
+        self.source = source or settings.LOGISTICS_STATS_SOURCE
+
+    # ── 집계 조회 ─────────────────────────────────────────────────────────────
+
+    def live_statement(self) -> Select:
+        """AW01010 GROUP BY 집계 쿼리 (AW01010_DAILY_STAT과 같은 컬럼 형태)"""
+        # MSSQL은 SELECT/GROUP BY 식의 바인드 파라미터를 서로 다른 식으로 보므로 리터럴 사용
+        author_dept = func.coalesce(Aw01010.author_dept, literal_column("''"))
+        transport_type = func.coalesce(Aw01010.transport_type, literal_column("''"))
+        return (
+            select(
+                Aw01010.export_date.label("stat_date"),
+                Aw01010.busi_place.label("busi_place"),
+                author_dept.label("author_dept"),
+                Aw01010.status.label("status"),
+                transport_type.label("transport_type"),
+                func.count().label("doc_cnt"),
+                func.sum(case((Aw01010.security_check_yn == "N", 1), else_=0)).label(
+                    "security_pending_cnt"
+                ),
+                func.sum(case((Aw01010.receiver_check_yn == "N", 1), else_=0)).label(
+                    "receiver_pending_cnt"
+                ),
+            )
+            .where(Aw01010.export_date.is_not(None))
+            .group_by(
+                Aw01010.export_date,
+                Aw01010.busi_place,
+                author_dept,
+                Aw01010.status,
+                transport_type,
+            )
+        )
+
+    def stats_statement(self, params: LogisticsSearchParams) -> Select:
+        """검색 조건(기간/사업장/부서)을 적용한 집계 쿼리"""
+        if self.source == "summary":
+            model = Aw01010DailyStat
+            stmt = select(
+                model.stat_date,
+                model.busi_place,
+                model.author_dept,
+                model.status,
+                model.transport_type,
+                model.doc_cnt,
+                model.security_pending_cnt,
+                model.receiver_pending_cnt,
+            ).where(model.doc_cnt > 0)
+            date_column, site_column, dept_column = (
+                model.stat_date,
+                model.busi_place,
+                model.author_dept,
+            )
+        else:
+            stmt = self.live_statement()
+            date_column, site_column, dept_column = (
+                Aw01010.export_date,
+                Aw01010.busi_place,
+                Aw01010.author_dept,
+            )
+
+        if params.out_site:
+            stmt = stmt.where(site_column == params.out_site)
+        if params.out_dept:
+            stmt = stmt.where(dept_column == params.out_dept)
+        if params.start_date:
+            stmt = stmt.where(date_column >= params.start_date)
+        if params.end_date:
+            stmt = stmt.where(date_column <= params.end_date)
+        return stmt
+
+    async def get_stats_rows(self, params: LogisticsSearchParams) -> list[Row]:
+        """(일자, 사업장, 부서, 상태, 운송 유형)별 집계 행 조회"""
+        result = await self.db.execute(self.stats_statement(params))
+        return list(result.all())
+
+    # ── 일별 집계 갱신 ────────────────────────────────────────────────────────
+
+    @staticmethod
+    def snapshot(header: Aw01010) -> Optional[StatEntry]:
+        """헤더의 현재 값으로 집계 기여분을 계산합니다. (반출 일자가 없으면 집계 제외)"""
+        if header.export_date is None:
+            return None
+        return StatEntry(
+            stat_date=header.export_date,
+            busi_place=header.busi_place,
+            author_dept=header.author_dept or "",
+            status=header.status,
+            transport_type=header.transport_type or "",
+            security_pending=1 if header.security_check_yn == "N" else 0,
+            receiver_pending=1 if header.receiver_check_yn == "N" else 0,
+        )
+
+    async def apply_change(
+        self, before: Optional[StatEntry], after: Optional[StatEntry]
+    ) -> None:
+        """
+        문서 변경 전/후 기여분 차이만큼 일별 집계를 증감합니다.
+
+        Args:
+            before: 변경 전 기여분 (등록 시 None)
+            after: 변경 후 기여분 (삭제 시 None)
+        """
+        if before == after:
+            return
+        if before is not None:
+            await self._increment(before, -1)
+        if after is not None:
+            await self._increment(after, 1)
+
+    async def _increment(self, entry: StatEntry, sign: int) -> None:
+        """
+        집계 행 1개를 증감합니다.
+
+        증가는 행이 없으면 추가해야 하므로, 동시에 같은 키의 첫 문서가 등록되어도
+        중복 키 오류나 증가 누락이 없도록 DB별 원자적 upsert를 사용합니다.
+            - MSSQL: MERGE WITH (HOLDLOCK) (키 범위 잠금으로 UPDATE/INSERT 판단과 실행을 직렬화)
+            - PostgreSQL/SQLite: INSERT ... ON CONFLICT DO UPDATE
+            - 그 외: UPDATE → 없으면 SAVEPOINT 안에서 INSERT → 중복 키면 UPDATE 재시도
+        감소는 증가로 만들어진 행에만 적용되므로 UPDATE만 실행합니다.
+        """
+        if sign < 0:
+            await self.db.execute(self._update_statement(entry, sign))
+            return
+
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "mssql":
+            await self.db.execute(MERGE_INCREMENT, self._merge_params(entry))
+        elif dialect in ("postgresql", "sqlite"):
+            await self.db.execute(self._on_conflict_statement(dialect, entry))
+        else:
+            await self._update_or_insert(entry)
+
+    @staticmethod
+    def _key_values(entry: StatEntry) -> dict:
+        return {
+            "stat_date": entry.stat_date,
+            "busi_place": entry.busi_place,
+            "author_dept": entry.author_dept,
+            "status": entry.status,
+            "transport_type": entry.transport_type,
+        }
+
+    def _update_statement(self, entry: StatEntry, sign: int) -> Update:
+        model = Aw01010DailyStat
+        return (
+            update(model)
+            .where(
+                model.stat_date == entry.stat_date,
+                model.busi_place == entry.busi_place,
+                model.author_dept == entry.author_dept,
+                model.status == entry.status,
+                model.transport_type == entry.transport_type,
+            )
+            .values(
+                doc_cnt=model.doc_cnt + sign,
+                security_pending_cnt=model.security_pending_cnt + sign * entry.security_pending,
+                receiver_pending_cnt=model.receiver_pending_cnt + sign * entry.receiver_pending,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def _insert_values(self, entry: StatEntry) -> dict:
+        return {
+            **self._key_values(entry),
+            "doc_cnt": 1,
+            "security_pending_cnt": entry.security_pending,
+            "receiver_pending_cnt": entry.receiver_pending,
+        }
+
+    def _merge_params(self, entry: StatEntry) -> dict:
+        return {
+            **self._key_values(entry),
+            "security_pending": entry.security_pending,
+            "receiver_pending": entry.receiver_pending,
+        }
+
+    def _on_conflict_statement(self, dialect: str, entry: StatEntry) -> Insert:
+        model = Aw01010DailyStat
+        insert_for = postgresql_insert if dialect == "postgresql" else sqlite_insert
+        stmt = insert_for(model).values(**self._insert_values(entry))
+        return stmt.on_conflict_do_update(
+            index_elements=[column.name for column in model.__table__.primary_key],
+            set_={
+                "DOC_CNT": model.doc_cnt + 1,
+                "SECURITY_PENDING_CNT": model.security_pending_cnt
+                + stmt.excluded.SECURITY_PENDING_CNT,
+                "RECEIVER_PENDING_CNT": model.receiver_pending_cnt
+                + stmt.excluded.RECEIVER_PENDING_CNT,
+            },
+        )
+
+    async def _update_or_insert(self, entry: StatEntry) -> None:
+        if (await self.db.execute(self._update_statement(entry, 1))).rowcount:
+            return
+        try:
+            async with self.db.begin_nested():
+                await self.db.execute(insert(Aw01010DailyStat).values(**self._insert_values(entry)))
+        except IntegrityError:
+            # UPDATE와 INSERT 사이에 다른 트랜잭션이 같은 키를 추가함 → 추가된 행을 증가
+            await self.db.execute(self._update_statement(entry, 1))
+
+    async def rebuild(self) -> int:
+        """
+        AW01010 전체를 다시 집계하여 일별 집계를 재생성합니다.
+
+        집계 테이블 도입 전 문서를 반영하거나 불일치를 복구할 때 사용합니다.
+        커밋은 호출자가 수행합니다.
+
+        Returns:
+            int: 생성한 집계 행 수
+        """
+        model = Aw01010DailyStat
+        await self.db.execute(delete(model))
+        await self.db.execute(
+            insert(model).from_select(
+                [
+                    model.stat_date,
+                    model.busi_place,
+                    model.author_dept,
+                    model.status,
+                    model.transport_type,
+                    model.doc_cnt,
+                    model.security_pending_cnt,
+                    model.receiver_pending_cnt,
+                ],
+                self.live_statement(),
+            )
+        )
+        count = (await self.db.execute(select(func.count()).select_from(model))).scalar() or 0
+        logger.info("반출입 일별 집계 재생성 완료: %d행", count)
+        return count
@@ -5,7 +5,7 @@ Logistics 도메인 스키마
 
 import json
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -72,6 +72,25 @@ class LogisticsListResponse(BaseModel):
     total: int
 
 
+class LogisticsSyncResponse(BaseModel):
+    """반출입 증분 동기화 응답
+
+    클라이언트는 deleted를 먼저 제거한 뒤 changed를 반출입번호 기준으로 덮어씁니다.
+    다음 요청에는 watermark를 since로 전달합니다. (경계 구간은 중복 수신될 수 있음)
+    has_more이면 afterDocNo도 함께 전달하여 같은 시각의 남은 문서부터 이어서 받습니다.
+    """
+
+    changed: list[LogisticsListItemSchema] = Field(default_factory=list, description="등록/수정된 문서")
+    deleted: list[str] = Field(default_factory=list, description="삭제된 반출입번호")
+    watermark: str = Field(description="다음 동기화 기준 시각 (ISO 8601)")
+    after_doc_no: Optional[str] = Field(
+        None, alias="afterDocNo", description="다음 요청의 afterDocNo (hasMore일 때만, 마지막 반출입번호)"
+    )
+    has_more: bool = Field(False, alias="hasMore", description="추가 변경분 존재 여부")
+
+    model_config = {"populate_by_name": True}
+
+
 # ── 반출입 상세 스키마 ────────────────────────────────────────────────────────
 
 class LogisticsDetailSchema(BaseModel):
@@ -165,6 +184,43 @@ class LogisticsSearchParams(BaseModel):
     status: Optional[str] = None
 
 
+# ── 통계 응답 스키마 ──────────────────────────────────────────────────────────
+
+class LogisticsStatsResponse(BaseModel):
+    """반출입 통계 (홈 화면 대시보드용)"""
+
+    start_date: Optional[str] = Field(None, alias="startDate", description="집계 시작일")
+    end_date: Optional[str] = Field(None, alias="endDate", description="집계 종료일")
+    total: int = Field(0, description="문서 수")
+    security_pending: int = Field(0, alias="securityPending", description="경비실 확인 대기 건수")
+    receiver_pending: int = Field(0, alias="receiverPending", description="인수자 확인 대기 건수")
+    by_status: dict[str, int] = Field(default_factory=dict, alias="byStatus", description="상태별 건수")
+    by_site: dict[str, int] = Field(default_factory=dict, alias="bySite", description="사업장별 건수")
+    by_dept: dict[str, int] = Field(default_factory=dict, alias="byDept", description="부서별 건수")
+    by_day: dict[str, int] = Field(default_factory=dict, alias="byDay", description="반출 일자별 건수")
+    by_transport_type: dict[str, int] = Field(
+        default_factory=dict, alias="byTransportType", description="운송 유형별 건수"
+    )
+
+    model_config = {"populate_by_name": True}
+
+
+# ── 실시간 이벤트 스키마 ──────────────────────────────────────────────────────
+
+class LogisticsChangeEvent(BaseModel):
+    """반출입 변경 이벤트 (/logistics/events SSE 메시지)"""
+
+    type: Literal["created", "updated", "deleted"] = Field(description="변경 유형")
+    doc_no: str = Field(alias="docNo", description="반출입번호")
+    busi_place: str = Field(alias="busiPlace", description="반출 사업장코드")
+    status: Optional[str] = Field(None, description="상태(반출/반입)")
+    security_check_yn: Optional[str] = Field(None, alias="securityCheckYn", description="경비실 확인 여부")
+    receiver_check_yn: Optional[str] = Field(None, alias="receiverCheckYn", description="인수자 확인 여부")
+    occurred_at: str = Field(alias="occurredAt", description="발생 일시")
+
+    model_config = {"populate_by_name": True}
+
+
 # ── 단순 응답 스키마 ──────────────────────────────────────────────────────────
 
 class DocNoResponse(BaseModel):
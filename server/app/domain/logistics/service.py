@@ -5,19 +5,31 @@ Logistics Service
 
 import json
 import logging
-from typing import Optional
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Literal, Optional
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from server.app.core.database import LazyAsyncSession
+from server.app.core.pubsub import get_broker
+from server.app.domain.logistics.formatters import (
+    LogisticsExportFormatter,
+    LogisticsListFormatter,
+)
+from server.app.domain.logistics.models.aw01010 import Aw01010
 from server.app.domain.logistics.repositories.logistics_repository import LogisticsRepository
 from server.app.domain.logistics.schemas import (
     DocNoResponse,
     ItemSchema,
+    LogisticsChangeEvent,
     LogisticsCreateRequest,
     LogisticsDetailSchema,
     LogisticsListItemSchema,
-    LogisticsListResponse,
     LogisticsSearchParams,
+    LogisticsStatsResponse,
+    LogisticsSyncResponse,
     LogisticsUpdateRequest,
 )
 
@@ -25,28 +37,58 @@ logger = logging.getLogger(__name__)
 
 
 class LogisticsService:
+    # 증분 동기화 watermark 여유 시간
+    # 변경 시각(IN_DATE/UP_DATE)은 커밋 전에 기록되므로, 조회 시점에 아직 커밋되지 않은
+    # 변경분을 놓치지 않도록 다음 기준 시각을 조금 앞당깁니다.
+    SYNC_OVERLAP = timedelta(seconds=30)
+
+    # 실시간 이벤트 토픽 (전체 / 사업장별)
+    EVENT_TOPIC = "logistics"
+
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
         self.repo = LogisticsRepository(db)
+        self.list_formatter = LogisticsListFormatter()
 
-    def _to_list_item(self, header) -> LogisticsListItemSchema:
-        """ORM 헤더 → 목록 아이템 스키마 변환"""
-        first_item = header.items[0] if header.items else None
-        return LogisticsListItemSchema(
-            doc_no=header.doc_no,
-            out_site=header.busi_place,
-            out_site_name=header.busi_place,  # 사업장명은 프론트에서 매핑
-            department=header.author_dept,
-            manager=header.author_name,
-            company=header.partner_company,
-            material=first_item.item_name if first_item else None,
-            quantity=float(first_item.quantity) if first_item and first_item.quantity else None,
-            unit=first_item.unit_code if first_item else None,
-            security_check=header.security_check_yn,
-            receiver_check=header.receiver_check_yn,
-            status=header.status,
-            reg_dt=header.in_date.isoformat() if header.in_date else None,
+    @classmethod
+    def event_topics(cls, busi_place: Optional[str] = None) -> tuple[str, ...]:
+        """구독 토픽 (사업장 지정 시 해당 사업장만)"""
+        if busi_place:
+            return (f"{cls.EVENT_TOPIC}:{busi_place}",)
+        return (cls.EVENT_TOPIC,)
+
+    async def _publish(
+        self,
+        event_type: str,
+        doc_no: str,
+        busi_place: str,
+        header: Optional[Aw01010] = None,
+    ) -> None:
+        """
+        변경 이벤트를 전체/사업장 토픽에 발행합니다. (commit 이후 호출)
+
+        발행 실패는 이미 커밋된 요청을 실패시키지 않도록 로그만 남깁니다.
+        """
+        event = LogisticsChangeEvent(
+            type=event_type,
+            doc_no=doc_no,
+            busi_place=busi_place,
+            status=header.status if header is not None else None,
+            security_check_yn=header.security_check_yn if header is not None else None,
+            receiver_check_yn=header.receiver_check_yn if header is not None else None,
+            occurred_at=datetime.now().isoformat(),
         )
+        message = event.model_dump(by_alias=True)
+        broker = get_broker()
+        try:
+            await broker.publish(self.EVENT_TOPIC, message)
+            await broker.publish(f"{self.EVENT_TOPIC}:{busi_place}", message)
+        except Exception:
+            logger.exception("반출입 이벤트 발행 실패: doc_no=%s, type=%s", doc_no, event_type)
+
+    def _to_list_item(self, row) -> LogisticsListItemSchema:
+        """목록 Row → 목록 아이템 스키마 변환"""
+        return LogisticsListItemSchema(**self.list_formatter.to_row(row))
 
     def _to_detail(self, header) -> LogisticsDetailSchema:
         """ORM 헤더 → 상세 스키마 변환"""
@@ -97,11 +139,131 @@ class LogisticsService:
             items=items,
         )
 
-    async def get_list(self, params: LogisticsSearchParams) -> LogisticsListResponse:
-        """반출입 목록 조회"""
+    def _to_stats(
+        self, rows: list[Row], params: LogisticsSearchParams
+    ) -> LogisticsStatsResponse:
+        """(일자, 사업장, 부서, 상태, 운송 유형)별 집계 행 → 차원별 합계"""
+        by_status: Counter[str] = Counter()
+        by_site: Counter[str] = Counter()
+        by_dept: Counter[str] = Counter()
+        by_day: Counter[str] = Counter()
+        by_transport_type: Counter[str] = Counter()
+        security_pending = receiver_pending = 0
+
+        for row in rows:
+            count = int(row.doc_cnt)
+            by_status[row.status] += count
+            by_site[row.busi_place] += count
+            by_dept[row.author_dept] += count
+            by_day[row.stat_date.strftime("%Y-%m-%d")] += count
+            by_transport_type[row.transport_type] += count
+            security_pending += int(row.security_pending_cnt)
+            receiver_pending += int(row.receiver_pending_cnt)
+
+        return LogisticsStatsResponse(
+            start_date=params.start_date,
+            end_date=params.end_date,
+            total=sum(by_status.values()),
+            security_pending=security_pending,
+            receiver_pending=receiver_pending,
+            by_status=dict(by_status),
+            by_site=dict(by_site),
+            by_dept=dict(by_dept),
+            by_day=dict(sorted(by_day.items())),
+            by_transport_type=dict(by_transport_type),
+        )
+
+    async def get_list(self, params: LogisticsSearchParams) -> dict[str, Any]:
+        """
+        반출입 목록 조회
+
+        Returns:
+            dict: LogisticsListResponse 형태의 camelCase dict (행마다 모델을 만들지 않음)
+        """
         rows = await self.repo.get_list(params)
-        items = [self._to_list_item(row) for row in rows]
-        return LogisticsListResponse(items=items, total=len(items))
+        return self.list_formatter.format(rows)
+
+    async def export(
+        self, params: LogisticsSearchParams, file_format: Literal["csv", "xlsx"] = "csv"
+    ) -> AsyncIterator[bytes]:
+        """
+        반출입 이력 내보내기 (StreamingResponse 본문용 청크 스트림)
+
+        서버 측 커서로 읽은 행을 곧바로 파일 청크로 변환하므로 전체 이력을 메모리에 올리지 않습니다.
+        응답 본문은 엔드포인트 반환(세션 반환) 이후에 전송되므로, 스트리밍 중 사용한 세션은
+        스트림 종료 시 여기서 반환합니다.
+        """
+        formatter = LogisticsExportFormatter()
+        rows = self.repo.stream_export_rows(params)
+        chunks = formatter.xlsx_chunks(rows) if file_format == "xlsx" else formatter.csv_chunks(rows)
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+            await rows.aclose()
+            if isinstance(self.db, LazyAsyncSession):
+                await self.db.release()
+
+    async def get_stats(self, params: LogisticsSearchParams) -> LogisticsStatsResponse:
+        """반출입 통계 조회 (SQL 집계 후 차원별 합산)"""
+        rows = await self.repo.stats.get_stats_rows(params)
+        return self._to_stats(rows, params)
+
+    async def sync(
+        self,
+        since: Optional[datetime],
+        out_site: Optional[str],
+        limit: int,
+        after_doc_no: Optional[str] = None,
+    ) -> LogisticsSyncResponse:
+        """
+        반출입 증분 동기화
+
+        since 이후 변경된 문서(목록 카드 형태)와 삭제된 반출입번호만 반환합니다.
+        since가 없으면 전체 문서를 반환합니다. (최초 동기화)
+
+        has_more이면 watermark(마지막 문서의 변경 시각)와 after_doc_no(마지막 반출입번호)를
+        다음 요청에 함께 전달하여 (변경 시각, 반출입번호) 순서로 이어서 조회합니다.
+        시간대가 포함된 since는 DB 기준인 서버 로컬 시각으로 변환합니다.
+        """
+        if since is not None and since.tzinfo is not None:
+            since = since.astimezone().replace(tzinfo=None)
+        if since is None:
+            after_doc_no = None
+
+        started_at = datetime.now()
+        rows = await self.repo.get_changed_since(since, out_site, limit + 1, after_doc_no)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        changed = [self._to_list_item(row) for row in rows]
+        deleted: list[str] = []
+        if since is not None:
+            changed_doc_nos = {item.doc_no for item in changed}
+            deleted = [
+                doc_no
+                for doc_no in await self.repo.get_deleted_since(since, out_site)
+                if doc_no not in changed_doc_nos  # 삭제 후 같은 번호로 재등록된 문서
+            ]
+
+        next_after: Optional[str] = None
+        if has_more:
+            last = rows[-1]
+            watermark = last.up_date or last.in_date or started_at
+            next_after = last.doc_no
+        else:
+            watermark = started_at - self.SYNC_OVERLAP
+            if since is not None and watermark < since:
+                watermark = since
+
+        return LogisticsSyncResponse(
+            changed=changed,
+            deleted=deleted,
+            watermark=watermark.isoformat(),
+            after_doc_no=next_after,
+            has_more=has_more,
+        )
 
     async def get_detail(self, doc_no: str) -> Optional[LogisticsDetailSchema]:
         """반출입 상세 조회"""
@@ -114,6 +276,7 @@ class LogisticsService:
         """반출 등록"""
         header = await self.repo.create(req, login_id)
         await self.db.commit()
+        await self._publish("created", header.doc_no, header.busi_place, header)
         return DocNoResponse(doc_no=header.doc_no)
 
     async def update(
@@ -124,13 +287,16 @@ class LogisticsService:
         if header is None:
             return None
         await self.db.commit()
+        await self._publish("updated", doc_no, header.busi_place, header)
         # commit 후 재조회
         updated = await self.repo.get_by_doc_no(doc_no)
         return self._to_detail(updated)  # type: ignore[arg-type]
 
-    async def delete(self, doc_no: str) -> bool:
+    async def delete(self, doc_no: str, login_id: Optional[str] = None) -> bool:
         """반출입 삭제"""
-        result = await self.repo.delete(doc_no)
-        if result:
-            await self.db.commit()
-        return result
+        busi_place = await self.repo.delete(doc_no, login_id)
+        if busi_place is None:
+            return False
+        await self.db.commit()
+        await self._publish("deleted", doc_no, busi_place)
+        return True
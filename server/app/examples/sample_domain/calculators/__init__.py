@@ -7,6 +7,8 @@ BaseCalculator를 상속받아 순수한 계산 로직을 구현합니다.
 
 from typing import Optional
 
+from server.app.core.executor import ExecutorSaturatedException
+from server.app.core.process_pool import run_array_kernel
 from server.app.shared.base import BaseCalculator
 from server.app.shared.exceptions import CalculatorException
 from server.app.examples.sample_domain.schemas import (
@@ -31,7 +33,7 @@ class SampleAnalysisCalculator(BaseCalculator[SampleCalculatorInput, SampleCalcu
 
     원칙:
         - 순수 함수 (동일 입력 → 동일 출력)
-        - 외부 의존성 없음
+        - 외부 의존성 없음 (계산은 kernels 모듈의 NumPy 커널, 실행 위치만 입력 크기로 결정)
         - 부수 효과 없음
 
     사용 예시:
@@ -56,8 +58,7 @@ class SampleAnalysisCalculator(BaseCalculator[SampleCalculatorInput, SampleCalcu
 
         Raises:
             CalculatorException: 계산 중 오류 발생 시
-
-        TODO: 실제 분석 로직 구현
+            ExecutorSaturatedException: 계산 실행기가 가득 찬 경우 (503)
         """
         try:
             # 1. 입력 데이터 검증
@@ -83,12 +84,29 @@ class SampleAnalysisCalculator(BaseCalculator[SampleCalculatorInput, SampleCalcu
 
             return output
 
+        except ExecutorSaturatedException:
+            raise
         except Exception as e:
             raise CalculatorException(
                 f"Analysis calculation failed: {str(e)}",
                 details={"analysis_type": input_data.analysis_type}
             )
 
+    async def _run_kernel(self, name: str, input_data: SampleCalculatorInput) -> dict[str, float]:
+        """
+        분석 커널을 실행합니다.
+
+        입력 배열(values, 없으면 value 1건)을 float64 배열로 만들어
+        크기에 따라 블로킹 실행기 스레드 또는 프로세스 풀에서 계산합니다. (이벤트 루프를 막지 않음)
+        """
+        # numpy는 분석 요청이 처음 들어올 때 import (기동 시간에 포함되지 않도록)
+        import numpy as np
+
+        from server.app.examples.sample_domain.calculators.kernels import KERNELS
+
+        values = np.asarray(input_data.values or [input_data.value], dtype=np.float64)
+        return await run_array_kernel(KERNELS[name], values)
+
     async def _statistical_analysis(
         self,
         input_data: SampleCalculatorInput
@@ -102,23 +120,21 @@ class SampleAnalysisCalculator(BaseCalculator[SampleCalculatorInput, SampleCalcu
         Returns:
             tuple[dict, list]: (지표, 인사이트)
 
-        TODO: 실제 통계 분석 로직 구현
-            - 평균, 중앙값, 표준편차 계산
-            - 분포 분석
-            - 상관관계 분석
+        지표: count, mean, median, std_dev, variance, min, max, q1, q3, skewness
         """
-        # 스텁: 더미 통계 지표
-        metrics = {
-            "mean": input_data.value,
-            "median": input_data.value * 0.95,
-            "std_dev": input_data.value * 0.1,
-            "variance": (input_data.value * 0.1) ** 2,
-        }
+        metrics = await self._run_kernel("statistical", input_data)
+
+        skewness = metrics["skewness"]
+        if abs(skewness) < 0.5:
+            distribution = "데이터가 대칭에 가까운 분포입니다"
+        elif skewness > 0:
+            distribution = f"데이터가 큰 값 쪽으로 꼬리가 긴 분포입니다 (왜도 {skewness:.2f})"
+        else:
+            distribution = f"데이터가 작은 값 쪽으로 꼬리가 긴 분포입니다 (왜도 {skewness:.2f})"
 
-        # 스텁: 더미 인사이트
         insights = [
-            "데이터가 정규 분포를 따릅니다",
-            f"평균값은 {metrics['mean']:.2f}입니다",
+            distribution,
+            f"평균값은 {metrics['mean']:.2f}, 중앙값은 {metrics['median']:.2f}입니다",
         ]
 
         # 임계값 기반 인사이트 추가
@@ -137,23 +153,22 @@ class SampleAnalysisCalculator(BaseCalculator[SampleCalculatorInput, SampleCalcu
         """
         트렌드 분석을 수행합니다.
 
-        TODO: 실제 트렌드 분석 로직 구현
-            - 시계열 분석
-            - 추세선 계산
-            - 계절성 분석
-            - 예측
+        values를 시간 순서로 보고 최소제곱 추세선을 계산합니다.
+        지표: trend_direction(1 상승, -1 하락, 0 보합), trend_strength(R²), slope, change_rate, forecast_next
         """
-        # 스텁
-        metrics = {
-            "trend_direction": 1.0,  # 1: 상승, -1: 하락, 0: 보합
-            "trend_strength": 0.7,
-            "change_rate": 0.05,
-        }
+        metrics = await self._run_kernel("trend", input_data)
 
-        insights = [
-            "상승 트렌드가 관찰됩니다",
-            "트렌드 강도는 중간 수준입니다",
-        ]
+        direction = {1.0: "상승", -1.0: "하락"}.get(metrics["trend_direction"])
+        strength = metrics["trend_strength"]
+        if direction is None:
+            insights = ["뚜렷한 트렌드가 없습니다 (보합)"]
+        else:
+            level = "강한" if strength >= 0.7 else "중간" if strength >= 0.3 else "약한"
+            insights = [
+                f"{direction} 트렌드가 관찰됩니다",
+                f"트렌드 강도는 {level} 수준입니다 (R² {strength:.2f})",
+            ]
+        insights.append(f"다음 값 예측: {metrics['forecast_next']:.2f}")
 
         return metrics, insights
 
@@ -164,26 +179,19 @@ class SampleAnalysisCalculator(BaseCalculator[SampleCalculatorInput, SampleCalcu
         """
         이상치 탐지를 수행합니다.
 
-        TODO: 실제 이상치 탐지 로직 구현
-            - Z-score 계산
-            - IQR 방법
-            - Isolation Forest
-            - DBSCAN
+        Z-score, IQR, Isolation Forest 세 방법 중 2개 이상이 이상으로 판정한 값을 이상치로 봅니다.
+        지표: z_outliers, iqr_outliers, forest_outliers, anomaly_count, anomaly_ratio,
+              anomaly_score, is_anomaly, confidence
         """
-        # 스텁
-        is_anomaly = False
-        if input_data.score and input_data.score < 0.3:
-            is_anomaly = True
-
-        metrics = {
-            "anomaly_score": 0.2 if is_anomaly else 0.8,
-            "is_anomaly": 1.0 if is_anomaly else 0.0,
-            "confidence": 0.85,
-        }
+        metrics = await self._run_kernel("anomaly", input_data)
 
         insights = []
-        if is_anomaly:
-            insights.append("이상치가 감지되었습니다")
+        if metrics["is_anomaly"]:
+            insights.append(
+                f"이상치 {metrics['anomaly_count']:.0f}건이 감지되었습니다 "
+                f"(Z-score {metrics['z_outliers']:.0f}건, IQR {metrics['iqr_outliers']:.0f}건, "
+                f"Isolation Forest {metrics['forest_outliers']:.0f}건)"
+            )
             insights.append("추가 검토가 필요합니다")
         else:
             insights.append("정상 범위 내의 데이터입니다")
@@ -0,0 +1,199 @@
+"""
+Sample Analysis Kernels
+
+SampleAnalysisCalculator가 사용하는 NumPy 벡터 연산 커널입니다.
+- statistical_kernel: 평균/중앙값/표준편차/사분위/왜도
+- trend_kernel: 최소제곱 추세선 기울기/결정계수/변화율/다음 값 예측
+- anomaly_kernel: Z-score, IQR, Isolation Forest 이상치 점수
+
+모든 커널은 1차원 float64 배열을 받아 dict[str, float]을 반환하는 최상위 순수 함수입니다.
+(프로세스 풀에서 실행되도록 pickle 가능하며, 입력 배열을 수정하지 않고 참조도 남기지 않음)
+"""
+
+import math
+
+import numpy as np
+
+EULER_GAMMA = 0.5772156649015329
+
+
+def statistical_kernel(values: np.ndarray) -> dict[str, float]:
+    """기술 통계 (표본 표준편차, ddof=1)"""
+    mean = float(values.mean())
+    std = float(values.std(ddof=1)) if values.size > 1 else 0.0
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    skewness = float(np.mean(((values - mean) / std) ** 3)) if std > 0 else 0.0
+    return {
+        "count": float(values.size),
+        "mean": mean,
+        "median": float(median),
+        "std_dev": std,
+        "variance": std**2,
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "q1": float(q1),
+        "q3": float(q3),
+        "skewness": skewness,
+    }
+
+
+def trend_kernel(values: np.ndarray) -> dict[str, float]:
+    """
+    순번(0..n-1)을 x로 한 최소제곱 추세선
+
+    trend_strength는 결정계수(R²), trend_direction은 기울기 부호입니다.
+    (변화가 추세선으로 거의 설명되지 않으면(R² < 0.1) 보합 0)
+    """
+    n = values.size
+    if n < 2:
+        return {
+            "trend_direction": 0.0,
+            "trend_strength": 0.0,
+            "slope": 0.0,
+            "change_rate": 0.0,
+            "forecast_next": float(values[0]) if n else 0.0,
+        }
+
+    x = np.arange(n, dtype=np.float64)
+    x_centered = x - x.mean()
+    y_centered = values - values.mean()
+    slope = float(np.dot(x_centered, y_centered) / np.dot(x_centered, x_centered))
+    intercept = float(values.mean() - slope * x.mean())
+    total = float(np.dot(y_centered, y_centered))
+    residual = values - (intercept + slope * x)
+    r_squared = 1.0 - float(np.dot(residual, residual)) / total if total > 0 else 0.0
+
+    first = float(values[0])
+    change_rate = (float(values[-1]) - first) / abs(first) if first != 0 else 0.0
+    direction = float(np.sign(slope)) if r_squared >= 0.1 else 0.0
+    return {
+        "trend_direction": direction,
+        "trend_strength": r_squared,
+        "slope": slope,
+        "change_rate": change_rate,
+        "forecast_next": intercept + slope * n,
+    }
+
+
+def _average_path_length(size: np.ndarray | int) -> np.ndarray:
+    """크기 size인 이진 탐색 트리의 평균 실패 탐색 경로 길이 c(n) (n <= 1이면 0)"""
+    size = np.asarray(size, dtype=np.float64)
+    result = np.zeros_like(size)
+    many = size > 2
+    result[size == 2] = 1.0
+    n = size[many]
+    result[many] = 2.0 * (np.log(n - 1.0) + EULER_GAMMA) - 2.0 * (n - 1.0) / n
+    return result
+
+
+def _isolation_tree(
+    sample: np.ndarray, height_limit: int, rng: np.random.Generator
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    1차원 isolation tree 1개를 만들고 잎 노드 구간을 반환합니다.
+
+    트리를 깊이(level) 단위로 만들면서 같은 깊이의 모든 노드를 한 번에 분할합니다.
+    노드는 정렬된 표본의 연속 구간 [start, end)이며, 분할값은 노드 표본의 최솟값~최댓값 사이 균등 난수입니다.
+    1차원이므로 잎 노드들은 수직선을 [lower, 다음 잎의 lower) 구간으로 나눕니다.
+
+    Returns:
+        (잎 구간 하한 오름차순, 잎의 경로 길이 = 깊이 + c(잎 표본 수))
+    """
+    ordered = np.sort(sample)
+    start = np.array([0])
+    end = np.array([ordered.size])
+    lower = np.array([-np.inf])
+    leaf_lower: list[np.ndarray] = []
+    leaf_length: list[np.ndarray] = []
+
+    for depth in range(height_limit + 1):
+        size = end - start
+        low = ordered[np.minimum(start, ordered.size - 1)]
+        high = ordered[np.maximum(end - 1, 0)]
+        leaf = (size <= 1) | (low == high) | (depth == height_limit)
+        leaf_lower.append(lower[leaf])
+        leaf_length.append(depth + _average_path_length(size[leaf]))
+
+        split_nodes = np.flatnonzero(~leaf)
+        if split_nodes.size == 0:
+            break
+        # 분할값 미만은 왼쪽, 이상은 오른쪽 (표본/조회 값 모두 같은 기준)
+        split = rng.uniform(low[split_nodes], high[split_nodes])
+        middle = np.searchsorted(ordered, split, side="left")
+        start = np.concatenate([start[split_nodes], middle])
+        end = np.concatenate([middle, end[split_nodes]])
+        lower = np.concatenate([lower[split_nodes], split])
+
+    bounds = np.concatenate(leaf_lower)
+    order = np.argsort(bounds, kind="stable")
+    return bounds[order], np.concatenate(leaf_length)[order]
+
+
+def isolation_forest_scores(
+    values: np.ndarray, n_trees: int = 100, sample_size: int = 256, seed: int = 0
+) -> np.ndarray:
+    """
+    Isolation Forest 이상 점수 (0~1, 0.5보다 클수록 이상)
+
+    score = 2^(-E[h(x)] / c(ψ)),  ψ = 트리별 표본 크기
+    트리는 표본(ψ개)으로만 만들고, 값의 경로 길이는 잎 구간 이진 탐색으로 구하므로
+    비용은 트리 수 × n log(잎 수)입니다. seed를 고정하여 같은 입력은 항상 같은 점수를 반환합니다.
+    """
+    psi = min(sample_size, values.size)
+    if psi < 2:
+        return np.zeros(values.size)
+
+    rng = np.random.default_rng(seed)
+    height_limit = math.ceil(math.log2(psi))
+    total = np.zeros(values.size)
+    for _ in range(n_trees):
+        sample = rng.choice(values, size=psi, replace=False)
+        bounds, lengths = _isolation_tree(sample, height_limit, rng)
+        total += lengths[np.searchsorted(bounds, values, side="right") - 1]
+    return np.power(2.0, -(total / n_trees) / float(_average_path_length(psi)))
+
+
+def anomaly_kernel(
+    values: np.ndarray, z_threshold: float = 3.0, forest_threshold: float = 0.65
+) -> dict[str, float]:
+    """
+    이상치 지표
+
+    값마다 세 방법으로 이상 여부를 판정하고, 2개 이상이 이상으로 판정한 값을 이상치로 봅니다.
+    - z_outliers: |Z-score| > z_threshold 개수
+    - iqr_outliers: [Q1 - 1.5·IQR, Q3 + 1.5·IQR] 밖의 개수
+    - forest_outliers: Isolation Forest 점수 > forest_threshold 개수
+    - anomaly_count / anomaly_ratio: 이상치 개수 / 비율, is_anomaly: 이상치가 있는지
+    - anomaly_score: Isolation Forest 최대 점수, confidence: 이상치들의 평균 득표율 (없으면 0)
+    """
+    mean = values.mean()
+    std = values.std()
+    z_flags = np.abs(values - mean) > z_threshold * std if std > 0 else np.zeros(values.size, bool)
+
+    q1, q3 = np.percentile(values, [25, 75])
+    iqr = q3 - q1
+    iqr_flags = (values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)
+
+    scores = isolation_forest_scores(values)
+    forest_flags = scores > forest_threshold
+
+    votes = z_flags.astype(np.int8) + iqr_flags + forest_flags
+    anomalies = votes >= 2
+    anomaly_count = int(np.count_nonzero(anomalies))
+    return {
+        "z_outliers": float(np.count_nonzero(z_flags)),
+        "iqr_outliers": float(np.count_nonzero(iqr_flags)),
+        "forest_outliers": float(np.count_nonzero(forest_flags)),
+        "anomaly_count": float(anomaly_count),
+        "anomaly_ratio": anomaly_count / values.size,
+        "anomaly_score": float(scores.max()),
+        "is_anomaly": 1.0 if anomaly_count else 0.0,
+        "confidence": float(votes[anomalies].mean()) / 3 if anomaly_count else 0.0,
+    }
+
+
+KERNELS = {
+    "statistical": statistical_kernel,
+    "trend": trend_kernel,
+    "anomaly": anomaly_kernel,
+}
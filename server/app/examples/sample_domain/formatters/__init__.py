@@ -6,7 +6,9 @@ BaseFormatter를 상속받아 API 응답 형식으로 데이터를 변환합니
 """
 
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Sequence
+
+from pydantic import TypeAdapter
 
 from server.app.shared.base import BaseFormatter
 from server.app.shared.exceptions import FormatterException
@@ -244,6 +246,9 @@ class SampleExportFormatter(BaseFormatter[dict, dict]):
 # Simple Mock Formatter (교과서 예제)
 # ====================
 
+# format_many 일괄 변환용 (처리되지 않은 항목 키(display_name 등)는 SampleItem에서 무시됨)
+_SAMPLE_LIST_RESPONSES = TypeAdapter(list[SampleListResponse])
+
 
 class SimpleMockFormatter(BaseFormatter[SimpleFormatterInput, SampleListResponse]):
     """
@@ -282,6 +287,42 @@ class SimpleMockFormatter(BaseFormatter[SimpleFormatterInput, SampleListResponse
               - 외부 의존성 없음
               - 순수 함수
         """
+        return self._build_response(input_data)
+
+    def format_many(self, items: Sequence[SimpleFormatterInput]) -> list[SampleListResponse]:
+        """
+        여러 입력을 한 번에 변환합니다. (await가 없는 순수 변환이므로 format_list의 일괄 경로)
+
+        응답 모델을 1건씩 생성하지 않고 배치 전체를 pydantic-core에서 한 번에 검증/생성합니다.
+
+        Args:
+            items: Calculator에서 받은 가공된 데이터 리스트
+
+        Returns:
+            list[SampleListResponse]: API 응답 스키마 리스트
+
+        Raises:
+            FormatterException: 포맷팅 중 오류 발생 시
+        """
+        try:
+            return _SAMPLE_LIST_RESPONSES.validate_python(
+                [
+                    {
+                        "items": input_data.processed_items,
+                        "total_count": input_data.total_count,
+                        "message": self._generate_message(input_data.total_count),
+                    }
+                    for input_data in items
+                ]
+            )
+        except Exception as e:
+            raise FormatterException(
+                f"Failed to format responses: {str(e)}",
+                details={"count": len(items)}
+            )
+
+    def _build_response(self, input_data: SimpleFormatterInput) -> SampleListResponse:
+        """입력 1건을 응답 스키마로 변환합니다."""
         try:
             # 1. dict를 Pydantic 모델로 변환
             items = [
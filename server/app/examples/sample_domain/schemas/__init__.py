@@ -6,7 +6,7 @@ Pydantic v2 모델을 사용합니다.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -63,6 +63,12 @@ class SampleAnalysisRequest(BaseModel):
         description="상세 정보 포함 여부",
     )
 
+    values: Optional[list[Annotated[float, Field(allow_inf_nan=False)]]] = Field(
+        default=None,
+        description="분석할 수치 배열 (시간 순서, 없으면 data_id 데이터의 값 1건)",
+        max_length=1_000_000,
+    )
+
 
 class SampleDataCreateRequest(BaseModel):
     """
@@ -201,6 +207,7 @@ class SampleCalculatorInput(BaseModel):
     score: Optional[float] = None
     analysis_type: str
     threshold: Optional[float] = None
+    values: list[float] = Field(default_factory=list)
 
 
 class SampleCalculatorOutput(BaseModel):
@@ -144,7 +144,7 @@ class SampleDomainService(BaseService[SampleAnalysisRequest, SampleAnalysisRespo
         TODO: 실제 구현 시
             - 여러 Provider 조합 가능
             - 캐시 확인
-            - 병렬 데이터 조회
+            - 병렬 데이터 조회 (self.fetch_plan()으로 독립 조회를 동시에 실행)
         """
         # Provider 입력 생성
         provider_input = SampleProviderInput(
@@ -188,6 +188,7 @@ class SampleDomainService(BaseService[SampleAnalysisRequest, SampleAnalysisRespo
             score=data.get("score"),
             analysis_type=request.analysis_type,
             threshold=request.threshold,
+            values=request.values or [data["value"]],
         )
 
         # Calculator 호출
@@ -7,7 +7,7 @@ Base 클래스 모듈
 from server.app.shared.base.calculator import BaseCalculator
 from server.app.shared.base.formatter import BaseFormatter
 from server.app.shared.base.repository import BaseRepository
-from server.app.shared.base.service import BaseService
+from server.app.shared.base.service import BaseService, FetchPlan, FetchResults
 
 # 하위 호환성을 위한 별칭 (deprecated)
 BaseProvider = BaseRepository
@@ -17,5 +17,7 @@ __all__ = [
     "BaseRepository",
     "BaseCalculator",
     "BaseFormatter",
+    "FetchPlan",
+    "FetchResults",
     "BaseProvider",  # deprecated, use BaseRepository instead
 ]
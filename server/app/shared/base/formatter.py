@@ -5,8 +5,9 @@ BaseFormatter: 데이터 포맷팅 추상 클래스
 Presentation Layer와 Business Layer 사이의 어댑터 역할을 수행합니다.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Any
+from typing import Any, Generic, Optional, Sequence, TypeVar
 
 from server.app.shared.types import FormatterInput, FormatterOutput
 
@@ -77,20 +78,73 @@ class BaseFormatter(ABC, Generic[TInput, TOutput]):
         """
         raise NotImplementedError("Subclass must implement 'format' method")
 
-    async def format_list(self, items: list[TInput]) -> list[TOutput]:
+    # format_list에서 format()을 동시에 실행할 최대 개수 (1: 순차)
+    # format()이 I/O(코드명 조회, 외부 API 등)를 await하는 포맷터에서 늘리세요.
+    format_concurrency: int = 1
+
+    def format_many(self, items: Sequence[TInput]) -> list[TOutput]:
+        """
+        여러 데이터를 동기적으로 한 번에 포맷팅합니다. (순수 포맷터용 일괄 변환 경로)
+
+        await가 필요 없는 포맷터가 구현하면 format_list가 항목마다 코루틴을 만들지 않고
+        이 메서드를 한 번 호출합니다. 배치 전체에 공통인 값(시각, 메시지 템플릿 등)은 한 번만 계산하세요.
+
+        Args:
+            items: 포맷팅할 데이터 리스트
+
+        Returns:
+            list[TOutput]: 포맷팅된 데이터 리스트 (items와 같은 순서)
+
+        구현 예시:
+            def format_many(self, items):
+                return [self._build(item) for item in items]
+        """
+        raise NotImplementedError("Subclass must implement 'format_many' method")
+
+    async def format_list(
+        self, items: Sequence[TInput], concurrency: Optional[int] = None
+    ) -> list[TOutput]:
         """
         여러 데이터를 한 번에 포맷팅합니다.
 
+        실행 방식:
+            - format_many를 구현한 포맷터: format_many(items) 1회 (동기 일괄 변환)
+            - 동시 실행 수가 1: format()을 순서대로 await
+            - 동시 실행 수가 2 이상: 작업자 concurrency개가 format()을 나눠 실행
+
+        하나라도 실패하면 나머지 작업을 취소하고 첫 번째 예외를 그대로 발생시킵니다.
+
         Args:
             items: 포맷팅할 데이터 리스트
+            concurrency: 동시 실행 수 (None이면 format_concurrency)
 
         Returns:
-            list[TOutput]: 포맷팅된 데이터 리스트
+            list[TOutput]: 포맷팅된 데이터 리스트 (items와 같은 순서)
+        """
+        if type(self).format_many is not BaseFormatter.format_many:
+            return self.format_many(items)
 
-        TODO: 구현 예시
+        limit = min(concurrency or self.format_concurrency, len(items))
+        if limit <= 1:
             return [await self.format(item) for item in items]
-        """
-        return [await self.format(item) for item in items]
+
+        results: list[Any] = [None] * len(items)
+        pending = iter(enumerate(items))
+
+        async def worker() -> None:
+            # 작업자들이 같은 이터레이터에서 다음 항목을 가져감 (단일 이벤트 루프라 경쟁 없음)
+            for index, item in pending:
+                results[index] = await self.format(item)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(limit)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        return results
 
     def mask_string(self, value: str, visible_chars: int = 3, mask_char: str = "*") -> str:
         """
@@ -6,8 +6,9 @@ Repository Pattern을 구현합니다.
 """
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Any
+from typing import Generic, Optional, TypeVar, Any
 
+from sqlalchemy import Row, Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.app.shared.types import RepositoryInput, RepositoryOutput
@@ -188,3 +189,56 @@ class APIRepository(BaseRepository[TInput, TOutput], ABC):
                 return response.json()
         """
         raise NotImplementedError("Subclass must implement 'make_request' method")
+
+
+class ReadOnlyQueryMixin:
+    """
+    읽기 전용 컬럼 조회 Mixin
+
+    목록 조회처럼 결과를 곧바로 응답 스키마로 변환하는 경우, select(Model)로 ORM 엔티티를
+    만들면 행마다 객체 생성 + 상태 추적(InstanceState) + identity map 등록 비용이 듭니다.
+    필요한 컬럼만 select하여 Row로 받으면 이 비용이 없습니다.
+    Row는 C로 구현된 튜플이며 컬럼 키(ORM 속성명)로 속성 접근이 가능하므로,
+    `row.busi_place`처럼 ORM 객체와 같은 코드로 읽을 수 있습니다. (변경/지연 로딩 불가)
+
+    사용 예시:
+        class CommonRepository(ReadOnlyQueryMixin):
+            async def get_sites(self) -> list[Row]:
+                stmt = select(CmBusiPlace.busi_place, CmBusiPlace.busi_place_name)
+                return await self.fetch_rows(stmt)
+    """
+
+    db: AsyncSession
+
+    async def fetch_rows(
+        self, stmt: Select, params: Optional[dict[str, Any]] = None
+    ) -> list[Row]:
+        """
+        컬럼 select를 실행하여 Row 목록을 반환합니다.
+
+        Args:
+            stmt: 컬럼 select
+            params: 이름 있는 바인드 파라미터 값 (bindparam("name")으로 만든 쿼리용)
+
+        Raises:
+            ValueError: ORM 엔티티 전체를 select한 경우 (컬럼을 명시해야 함)
+        """
+        self._ensure_columns(stmt)
+        result = await self.db.execute(stmt, params)
+        return list(result.all())
+
+    async def fetch_one_row(self, stmt: Select) -> Optional[Row]:
+        """컬럼 select를 실행하여 첫 번째 Row를 반환합니다. (없으면 None)"""
+        self._ensure_columns(stmt)
+        result = await self.db.execute(stmt)
+        return result.first()
+
+    @staticmethod
+    def _ensure_columns(stmt: Select) -> None:
+        for description in stmt.column_descriptions:
+            entity = description.get("entity")
+            if entity is not None and description["expr"] is entity:
+                raise ValueError(
+                    "fetch_rows는 컬럼 select만 지원합니다: "
+                    f"{description['name']} 엔티티 대신 컬럼을 지정하세요."
+                )
@@ -5,8 +5,12 @@ Facade Pattern을 통해 Provider, Calculator, Formatter를 조율합니다.
 Template Method Pattern을 사용하여 비즈니스 로직의 흐름을 정의합니다.
 """
 
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Any, Optional
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, Optional, Sequence, TypeVar
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,10 +19,167 @@ from server.app.shared.base.formatter import BaseFormatter
 from server.app.shared.base.repository import BaseRepository as BaseProvider
 from server.app.shared.types import ServiceResult
 
+logger = logging.getLogger(__name__)
+
 # 제네릭 타입 변수
 TRequest = TypeVar("TRequest")  # API 요청 데이터
 TResponse = TypeVar("TResponse")  # API 응답 데이터
 
+# 조회 함수: (세션, 선행 단계 결과) -> 결과
+FetchFn = Callable[[AsyncSession, dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class FetchStep:
+    """조회 단계 1개 (이름, 조회 함수, 선행 단계 이름)"""
+
+    name: str
+    fetch: FetchFn
+    after: tuple[str, ...] = ()
+
+
+@dataclass
+class FetchResults:
+    """
+    조회 계획 실행 결과
+
+    - values: 단계별 결과 (results["sites"]처럼 단계 이름으로 접근)
+    - timings: 단계별 (시작 시점, 소요 시간) ms, 시작 시점은 계획 실행 시작 기준
+    - elapsed_ms: 전체 소요 시간 (독립 단계는 동시에 실행되므로 가장 긴 의존 경로의 시간)
+    """
+
+    values: dict[str, Any]
+    timings: dict[str, tuple[float, float]]
+    elapsed_ms: float
+
+    def __getitem__(self, name: str) -> Any:
+        return self.values[name]
+
+
+class FetchPlan:
+    """
+    의존 관계를 선언한 Repository 조회들을 실행합니다.
+
+    선행 단계가 모두 끝난 단계는 바로 시작하므로 서로 독립인 조회는 동시에 실행되고,
+    전체 시간은 조회 시간의 합이 아니라 가장 긴 의존 경로의 시간이 됩니다.
+
+    AsyncSession 하나로는 쿼리를 동시에 실행할 수 없으므로, 동시 실행 시 단계마다
+    서비스 세션과 같은 엔진에 묶인 별도 세션(풀의 별도 연결)을 열고 단계가 끝나면 닫습니다.
+    별도 세션은 서비스 세션의 커밋되지 않은 변경을 보지 못하므로 읽기 전용 조회에만 사용하세요.
+
+    한 단계가 실패하면 실행 중인 나머지 단계를 취소하고 그 예외를 그대로 발생시킵니다.
+    timeout을 넘거나 호출한 쪽이 취소된 경우에도 모든 단계를 취소합니다.
+
+    사용 예시:
+        results = await (
+            self.fetch_plan()
+            .add("user", lambda db, _: UserRepository(db).get_user(user_id))
+            .add("sites", lambda db, _: CommonRepository(db).get_sites())
+            .add("docs", lambda db, r: DocRepository(db).by_dept(r["user"].dept), after=["user"])
+            .run(timeout=5)
+        )
+        # user와 sites는 동시에, docs는 user가 끝난 뒤 실행
+        results["docs"]
+    """
+
+    def __init__(self, db: AsyncSession, concurrent: bool = True) -> None:
+        """
+        Args:
+            db: 서비스 세션 (동시 실행 시 이 세션의 엔진으로 단계별 세션을 생성)
+            concurrent: False면 모든 단계를 서비스 세션에서 선언 순서대로 실행
+        """
+        self.db = db
+        self.concurrent = concurrent
+        self.steps: dict[str, FetchStep] = {}
+
+    def add(self, name: str, fetch: FetchFn, after: Sequence[str] = ()) -> "FetchPlan":
+        """
+        조회 단계를 추가합니다.
+
+        선행 단계는 먼저 추가되어 있어야 합니다. (선언 순서가 곧 실행 가능한 순서이므로 순환이 생기지 않음)
+
+        Args:
+            name: 단계 이름 (결과 키)
+            fetch: 조회 함수 fetch(db, 선행 단계 결과 dict)
+            after: 선행 단계 이름
+
+        Raises:
+            ValueError: 이름이 중복되거나 선행 단계가 없는 경우
+        """
+        if name in self.steps:
+            raise ValueError(f"Duplicate fetch step: {name}")
+        missing = [dependency for dependency in after if dependency not in self.steps]
+        if missing:
+            raise ValueError(f"Fetch step '{name}' depends on unknown steps: {missing}")
+        self.steps[name] = FetchStep(name, fetch, tuple(after))
+        return self
+
+    async def run(self, timeout: Optional[float] = None) -> FetchResults:
+        """
+        모든 단계를 실행하고 결과를 반환합니다.
+
+        Args:
+            timeout: 전체 제한 시간(초) (None이면 제한 없음)
+
+        Raises:
+            asyncio.TimeoutError: timeout을 넘은 경우
+            Exception: 처음 실패한 단계의 예외
+        """
+        started = time.perf_counter()
+        timings: dict[str, tuple[float, float]] = {}
+        bind = self.db.bind if self.concurrent and len(self.steps) > 1 else None
+
+        async def run_step(step: FetchStep, dependencies: dict[str, Any]) -> Any:
+            step_started = time.perf_counter()
+            if bind is None:
+                value = await step.fetch(self.db, dependencies)
+            else:
+                async with AsyncSession(bind, expire_on_commit=False, autoflush=False) as db:
+                    value = await step.fetch(db, dependencies)
+            finished = time.perf_counter()
+            timings[step.name] = (
+                round((step_started - started) * 1000, 1),
+                round((finished - step_started) * 1000, 1),
+            )
+            return value
+
+        if bind is None:
+            values = await asyncio.wait_for(self._run_serial(run_step), timeout)
+        else:
+            values = await self._run_concurrent(run_step, timeout)
+
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.debug("Fetch plan 완료: %sms %s", elapsed_ms, timings)
+        return FetchResults(values, timings, elapsed_ms)
+
+    async def _run_serial(self, run_step: Callable[..., Awaitable[Any]]) -> dict[str, Any]:
+        values: dict[str, Any] = {}
+        for step in self.steps.values():
+            values[step.name] = await run_step(
+                step, {dependency: values[dependency] for dependency in step.after}
+            )
+        return values
+
+    async def _run_concurrent(
+        self, run_step: Callable[..., Awaitable[Any]], timeout: Optional[float]
+    ) -> dict[str, Any]:
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def after_dependencies(step: FetchStep) -> Any:
+            dependencies = {dependency: await tasks[dependency] for dependency in step.after}
+            return await run_step(step, dependencies)
+
+        for step in self.steps.values():
+            tasks[step.name] = asyncio.ensure_future(after_dependencies(step))
+        try:
+            results = await asyncio.wait_for(asyncio.gather(*tasks.values()), timeout)
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        return dict(zip(tasks, results, strict=True))
+
 
 class BaseService(ABC, Generic[TRequest, TResponse]):
     """
@@ -40,7 +201,7 @@ class BaseService(ABC, Generic[TRequest, TResponse]):
     일반적인 흐름:
         1. 요청 데이터 검증 (validate_request)
         2. 권한 확인 (check_permissions)
-        3. 데이터 조회 (Provider)
+        3. 데이터 조회 (Provider, 여러 조회는 fetch_plan()으로 동시 실행)
         4. 비즈니스 로직 실행 (Calculator)
         5. 응답 포맷팅 (Formatter)
         6. 결과 반환
@@ -79,6 +240,18 @@ class BaseService(ABC, Generic[TRequest, TResponse]):
         """
         self.db = db
 
+    def fetch_plan(self, concurrent: bool = True) -> FetchPlan:
+        """
+        이 서비스 세션 기준의 조회 계획을 만듭니다.
+
+        여러 Repository를 조회하는 서비스는 _fetch_data에서 독립 조회를 동시에 실행하세요.
+        (FetchPlan 참고, 조회 시간이 합이 아니라 가장 느린 조회의 시간이 됨)
+
+        Args:
+            concurrent: False면 서비스 세션 하나로 순서대로 실행 (트랜잭션 안의 조회 등)
+        """
+        return FetchPlan(self.db, concurrent)
+
     @abstractmethod
     async def execute(self, request: TRequest, **kwargs: Any) -> ServiceResult[TResponse]:
         """
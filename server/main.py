@@ -13,18 +13,20 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from rich.logging import RichHandler
 
+from server.app.core.compression import CompressionMiddleware
 from server.app.core.config import settings
 from server.app.core.database import DatabaseManager
+from server.app.core.executor import install_slow_callback_detector, shutdown_blocking_executor
+from server.app.core.invalidation import get_invalidation_bus
+from server.app.core.process_pool import shutdown_process_pool
 from server.app.core.routers import router as core_router
+from server.app.core.warmup import warm_up
 from server.app.core.middleware import RequestIDMiddleware, ExternalLoggingMiddleware
+from server.app.core.rate_limit import RateLimitMiddleware, get_rate_limit_backend
+from server.app.core.responses import FastJSONResponse
 from server.app.api.v1.router import api_router
 from server.app.shared.exceptions import ApplicationException
 
-from rich.console import Console, Group
-from rich.panel import Panel
-from rich.text import Text
-from rich.align import Align
-
 logging.basicConfig(
     level="INFO",  # 보고 싶은 로그 레벨 (DEBUG, INFO 등)
     format="%(message)s",
@@ -65,7 +67,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     애플리케이션 생명주기 관리
 
     시작 시:
-        - 데이터베이스 연결 확인
+        - 워밍업 (DB 연결 사전 생성, 쿼리 사전 컴파일, 캐시 적재)
         - 필요한 초기화 작업 수행
 
     종료 시:
@@ -87,9 +89,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     else:
         logger.info(f"🗄️  Database: {settings.DATABASE_TYPE}")
 
+    # 워커 간 캐시 무효화 수신 시작
+    await get_invalidation_bus().start()
+    logger.info(f"🔁 Cache invalidation: {settings.CACHE_INVALIDATION_TRANSPORT}")
+
+    # 개발 환경: 이벤트 루프를 막는 블로킹 호출 감지
+    if settings.DEBUG and settings.SLOW_CALLBACK_THRESHOLD_MS > 0:
+        install_slow_callback_detector(settings.SLOW_CALLBACK_THRESHOLD_MS)
+
+    # 첫 요청이 연결 수립/쿼리 컴파일/마스터 데이터 적재 비용을 치르지 않도록 미리 준비
+    if settings.WARMUP_ENABLED:
+        await warm_up()
+
     # TODO: 필요한 초기화 작업
     # - 데이터베이스 마이그레이션 확인
-    # - 캐시 워밍업
     # - 외부 서비스 연결 확인
 
     # 개발 환경에서는 테이블 자동 생성 (운영에서는 사용 금지!)
@@ -101,7 +114,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
 
     # 종료 시 실행
     logger.info("👋 Shutting down application...")
+    await get_invalidation_bus().close()
     await DatabaseManager.close_connections()
+    shutdown_blocking_executor()
+    shutdown_process_pool()
     logger.info("✅ Application shutdown complete")
 
 
@@ -153,6 +169,8 @@ def create_application() -> FastAPI:
         """,
         debug=settings.DEBUG,
         lifespan=lifespan,
+        # 기본 JSON 응답을 orjson으로 인코딩 (미설치 시 표준 json)
+        default_response_class=FastJSONResponse,
         # docs_url="/docs" if settings.DEBUG else None,  # 운영에서는 문서 비활성화 가능
         # redoc_url="/redoc" if settings.DEBUG else None,
     )
@@ -167,6 +185,14 @@ def create_application() -> FastAPI:
     # 외부 로깅 서비스 (stub)
     app.add_middleware(ExternalLoggingMiddleware)
 
+    # 요청 속도 제한 (CORS 안쪽에 두어 429 응답에도 CORS 헤더가 붙도록 함)
+    if settings.RATE_LIMIT_ENABLED:
+        app.add_middleware(
+            RateLimitMiddleware,
+            backend=get_rate_limit_backend(),
+            trust_forwarded=settings.RATE_LIMIT_TRUST_FORWARDED,
+        )
+
     # CORS 설정
     app.add_middleware(
         CORSMiddleware,
@@ -176,6 +202,15 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # 응답 압축 (CORS 바깥에서 최종 응답 본문을 압축)
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MIN_SIZE,
+            threadpool_min_size=settings.COMPRESSION_THREADPOOL_MIN_SIZE,
+            gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        )
+
     # Trusted Host 설정 (운영 환경)
     if settings.ENVIRONMENT == "production":
         # TODO: 운영 환경에서는 실제 호스트 목록으로 변경
@@ -187,7 +222,6 @@ def create_application() -> FastAPI:
 
     # TODO: 추가 미들웨어
     # - 메트릭 수집
-    # - Rate Limiting
 
     # ====================
     # Exception Handlers
@@ -342,6 +376,11 @@ if __name__ == "__main__":
 # VIBE WEB STARTER SIGNATURE
 # ==========================================
 def print_vibe_signature():
+    # 배너 전용 rich 모듈은 기동 시점에만 import (server.main import 비용 절감)
+    from rich.align import Align
+    from rich.console import Console, Group
+    from rich.panel import Panel
+    from rich.text import Text
 
     console = Console()
 
@@ -85,6 +85,42 @@ async def test_db() -> AsyncGenerator[AsyncSession, None]:
     await _engine.dispose()
 
 
+@pytest.fixture(scope="function")
+async def logistics_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    반출입(AW01010/AW01011, 검색 색인, 일별 집계, 삭제 이력) 테이블만 생성한 테스트 세션을 제공합니다.
+
+    전체 메타데이터에는 MSSQL 전용 기본값(GETDATE() 등)이 있어
+    SQLite에서는 필요한 테이블만 선택적으로 생성합니다.
+    """
+    from server.app.domain.logistics.models import (
+        Aw01010,
+        Aw01010DailyStat,
+        Aw01010DelLog,
+        Aw01010Ngram,
+        Aw01010Search,
+        Aw01011,
+    )
+
+    _engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    tables = [
+        Aw01010.__table__,
+        Aw01011.__table__,
+        Aw01010Search.__table__,
+        Aw01010Ngram.__table__,
+        Aw01010DailyStat.__table__,
+        Aw01010DelLog.__table__,
+    ]
+    async with _engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+
+    _session_factory = async_sessionmaker(_engine, class_=AsyncSession, expire_on_commit=False)
+    async with _session_factory() as session:
+        yield session
+
+    await _engine.dispose()
+
+
 # ====================
 # FastAPI Client Fixtures
 # ====================
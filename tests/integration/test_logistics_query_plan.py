@@ -0,0 +1,85 @@
+"""
+반출입 목록 쿼리 실행 계획 회귀 테스트
+
+시드 데이터를 적재한 SQLite에서 EXPLAIN QUERY PLAN을 실행하여
+get_list의 조건/정렬 형태가 AW01010 복합 인덱스를 사용하는지 검증합니다.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.app.domain.logistics.models import Aw01010
+from server.app.domain.logistics.repositories.logistics_repository import LogisticsRepository
+from server.app.domain.logistics.schemas import LogisticsSearchParams
+
+SEED_ROWS = 3000
+
+
+async def _seed_headers(db: AsyncSession) -> None:
+    base = datetime(2026, 1, 1)
+    rows = [
+        {
+            "doc_no": f"{i % 3 + 1}{i:012d}",
+            "busi_place": str(i % 3 + 1),
+            "export_date": base + timedelta(days=i % 90),
+            "author_dept": f"D{i % 20:02d}",
+            "partner_company": f"협력업체{i % 50}",
+            "transport_type": "01",
+            "status": "반입" if i % 4 == 0 else "반출",
+            "security_check_yn": "N",
+            "receiver_check_yn": "N",
+            "in_date": base + timedelta(minutes=i),
+        }
+        for i in range(SEED_ROWS)
+    ]
+    await db.execute(insert(Aw01010), rows)
+    await db.commit()
+    await db.execute(text("ANALYZE"))
+
+
+async def _query_plan(db: AsyncSession, params: LogisticsSearchParams) -> str:
+    stmt = LogisticsRepository(db).list_statement(params)
+    compiled = stmt.compile(
+        dialect=(await db.connection()).dialect, compile_kwargs={"literal_binds": True}
+    )
+    result = await db.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+    return "\n".join(str(row[-1]) for row in result)
+
+
+@pytest.mark.integration
+class TestLogisticsListQueryPlan:
+    """get_list 쿼리 형태별 인덱스 사용 검증"""
+
+    @pytest.mark.parametrize(
+        ("params", "expected_index"),
+        [
+            (
+                LogisticsSearchParams(
+                    out_site="1",
+                    status="반입",
+                    start_date="2026-02-01",
+                    end_date="2026-02-15",
+                ),
+                "ix_AW01010_place_status_export",
+            ),
+            (
+                LogisticsSearchParams(
+                    out_dept="D07", start_date="2026-02-01", end_date="2026-02-15"
+                ),
+                "ix_AW01010_dept_export",
+            ),
+            (LogisticsSearchParams(), "ix_AW01010_in_date_desc"),
+        ],
+    )
+    async def test_list_uses_index(
+        self,
+        logistics_db: AsyncSession,
+        params: LogisticsSearchParams,
+        expected_index: str,
+    ):
+        await _seed_headers(logistics_db)
+        plan = await _query_plan(logistics_db, params)
+        assert expected_index in plan, plan
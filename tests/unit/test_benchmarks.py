@@ -0,0 +1,66 @@
+"""
+단위 테스트: 벤치마크 시드 생성기 / 결과 요약
+같은 시드로 같은 데이터가 만들어지고, 백분위수/회귀 비교가 올바른지 검증
+"""
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from benchmarks.run_benchmarks import compare, percentile, summarize
+from benchmarks.seed import SeedConfig, create_schema, doc_no, seed_database
+from server.app.domain.auth.calculators import PasswordCalculator
+from server.app.domain.auth.models import St00400
+from server.app.domain.logistics.models import Aw01010
+
+
+class TestSeed:
+    """시드 데이터 생성 검증"""
+
+    async def test_seed_is_deterministic(self, tmp_path):
+        config = SeedConfig(docs=30, users=3)
+        snapshots = []
+        for name in ("a.db", "b.db"):
+            engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}")
+            await create_schema(engine)
+            async with AsyncSession(engine) as session:
+                counts = await seed_database(session, config)
+                rows = await session.execute(
+                    select(Aw01010.doc_no, Aw01010.partner_company).order_by(Aw01010.doc_no)
+                )
+                snapshots.append(rows.all())
+                user = await session.get(St00400, "B00001")
+                assert PasswordCalculator.verify(config.password, user.password)
+                total = await session.scalar(select(func.count()).select_from(Aw01010))
+            await engine.dispose()
+
+        assert counts["docs"] == total == 30
+        assert snapshots[0] == snapshots[1]
+        assert snapshots[0][0][0] == min(doc_no(i, config) for i in range(30))
+
+
+class TestSummary:
+    """결과 요약/비교 검증"""
+
+    def test_percentile_nearest_rank(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 95) == 0.0
+
+    def test_summarize(self):
+        result = summarize([10.0, 20.0, 30.0, 40.0], elapsed=0.5, queries=8, errors=1, size=400)
+        assert result["p50_ms"] == 20.0
+        assert result["rps"] == 8.0
+        assert result["queries_per_request"] == 2.0
+        assert result["bytes_per_request"] == 100
+
+    def test_compare_flags_latency_and_query_regressions(self):
+        def report(p95: float, queries: float) -> dict:
+            return {"p95_ms": p95, "queries_per_request": queries}
+
+        baseline = {"meta": {}, "results": {"list": report(10, 1), "detail": report(10, 2)}}
+        current = {
+            "meta": {},
+            "results": {"list": report(11, 1), "detail": report(10, 3), "login": report(5, 4)},
+        }
+        assert compare(current, baseline, threshold=0.2) == ["detail"]
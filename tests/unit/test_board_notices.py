@@ -0,0 +1,78 @@
+"""
+단위 테스트: 공지사항 목록/상세
+BoardService.get_notices(페이지, 본문 제외) / get_notice(본문 포함) 검증
+"""
+
+from datetime import datetime, timedelta
+from typing import AsyncGenerator
+
+import pytest
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from server.app.core.database import Base
+from server.app.domain.board.models.notice import WbBoardInfo
+from server.app.domain.board.service import BoardService
+
+
+@pytest.fixture
+async def board_db() -> AsyncGenerator[AsyncSession, None]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[WbBoardInfo.__table__])
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with factory() as session:
+        base = datetime(2026, 3, 1)
+        session.add_all(
+            WbBoardInfo(
+                project_cd="P",
+                menu_cd="M",
+                board_seq=f"{i:04d}",
+                board_title=f"공지 {i}",
+                board_txt="본문" * 1000,
+                board_category="02" if i % 2 else "01",
+                reg_dt=base + timedelta(hours=i),
+            )
+            for i in range(25)
+        )
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+class TestBoardNotices:
+    """공지사항 목록/상세 검증"""
+
+    async def test_pages_latest_first(self, board_db: AsyncSession):
+        service = BoardService(board_db)
+
+        first = await service.get_notices(page=1, size=10)
+        last = await service.get_notices(page=3, size=10)
+
+        assert first.total == 25
+        assert [n.board_seq for n in first.notices[:2]] == ["0024", "0023"]
+        assert [n.board_seq for n in last.notices] == [f"{i:04d}" for i in range(4, -1, -1)]
+
+    async def test_list_excludes_body(self, board_db: AsyncSession):
+        response = await BoardService(board_db).get_notices(page=1, size=5)
+        payload = response.model_dump(by_alias=True)
+        assert "boardTxt" not in payload["notices"][0]
+
+    async def test_category_filter(self, board_db: AsyncSession):
+        response = await BoardService(board_db).get_notices(page=1, size=100, category="02")
+        assert response.total == 12
+        assert {n.board_category for n in response.notices} == {"02"}
+
+    async def test_detail_includes_body(self, board_db: AsyncSession):
+        board_db.expunge_all()
+        notice = await BoardService(board_db).get_notice("P", "M", "0003")
+        assert notice is not None
+        assert notice.board_txt == "본문" * 1000
+        assert await BoardService(board_db).get_notice("P", "M", "9999") is None
+
+    async def test_board_txt_is_deferred(self, board_db: AsyncSession):
+        board_db.expunge_all()
+        entity = (await board_db.execute(select(WbBoardInfo).limit(1))).scalar_one()
+        assert "board_txt" in inspect(entity).unloaded
@@ -0,0 +1,126 @@
+"""
+단위 테스트: 응답 압축
+choose_encoding / PrecompressedBody / CompressionMiddleware(크기 기준, Content-Type, 스트리밍) 검증
+"""
+
+import gzip
+
+from fastapi import FastAPI, Request
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+import server.app.core.compression as compression
+from server.app.core.compression import (
+    CompressionMiddleware,
+    PrecompressedBody,
+    choose_encoding,
+)
+
+LARGE = {"rows": [{"docNo": f"1{i:012d}", "company": "삼성전자"} for i in range(200)]}
+
+
+def _client(**kwargs) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large():
+        return LARGE
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/events")
+    async def events():
+        return StreamingResponse(iter(["data: x\n\n" * 500]), media_type="text/event-stream")
+
+    @app.get("/csv")
+    async def csv():
+        rows = (f"{i},삼성전자,육각볼트\n" for i in range(2000))
+        return StreamingResponse(rows, media_type="text/csv")
+
+    @app.get("/precompressed")
+    async def precompressed(request: Request):
+        return PrecompressedBody.build(b'{"n":"' + b"x" * 4096 + b'"}').response(request)
+
+    @app.get("/binary")
+    async def binary():
+        return Response(b"\x00" * 4096, media_type="application/octet-stream")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=1024, **kwargs)
+    return TestClient(app)
+
+
+class TestChooseEncoding:
+    """Accept-Encoding 협상 검증"""
+
+    def test_gzip_and_refusal(self):
+        assert choose_encoding("gzip, deflate") == "gzip"
+        assert choose_encoding("deflate") is None
+        assert choose_encoding("gzip;q=0") is None
+        assert choose_encoding("") is None
+
+    def test_brotli_only_when_installed(self, monkeypatch):
+        monkeypatch.setattr(compression, "brotli", None)
+        assert choose_encoding("br, gzip") == "gzip"
+
+
+class TestPrecompressedBody:
+    """사전 압축 본문 선택 검증"""
+
+    def test_select_by_accept_encoding(self):
+        body = PrecompressedBody.build(b"a" * 4096)
+        content, encoding = body.select("gzip")
+        assert encoding == "gzip"
+        assert gzip.decompress(content) == body.identity
+        assert body.select("identity") == (body.identity, None)
+
+    def test_small_body_is_not_encoded(self):
+        body = PrecompressedBody.build(b"{}")
+        assert body.select("gzip") == (b"{}", None)
+
+
+class TestCompressionMiddleware:
+    """CompressionMiddleware 압축 조건 검증"""
+
+    def test_large_json_is_gzipped(self):
+        response = _client().get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(response.content)
+        assert response.json() == LARGE
+
+    def test_skips_small_excluded_and_unaccepted(self):
+        client = _client()
+        assert "content-encoding" not in client.get("/small").headers
+        assert "content-encoding" not in client.get("/binary").headers
+        assert "content-encoding" not in client.get("/events").headers
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.json() == LARGE
+
+    def test_streaming_response_is_compressed(self):
+        response = _client().get("/csv", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text.splitlines()[1999] == "1999,삼성전자,육각볼트"
+
+    def test_precompressed_response_is_not_recompressed(self):
+        response = _client().get("/precompressed", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["n"] == "x" * 4096
+
+    def test_large_body_compressed_in_threadpool(self, monkeypatch):
+        calls: list[int] = []
+        original = compression.run_in_threadpool
+
+        async def recording(fn, *args):
+            calls.append(len(args[0]))
+            return await original(fn, *args)
+
+        monkeypatch.setattr(compression, "run_in_threadpool", recording)
+        client = _client(threadpool_min_size=4096)
+        client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert calls == []
+        assert client.get("/large", headers={"Accept-Encoding": "gzip"}).json() == LARGE
+        assert len(calls) == 1
@@ -0,0 +1,110 @@
+"""
+단위 테스트: 문서 캐시
+경로 + mtime 키 캐시, 강한 ETag / If-None-Match(304), 사전 압축 본문 검증
+"""
+
+import os
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from server.app.api.v1.endpoints import docs
+from server.app.core import document_cache
+from server.app.core.document_cache import DocumentCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDocumentCache:
+    """DocumentCache 적재/재검증 검증"""
+
+    async def test_skips_stat_within_check_window_and_reloads_on_change(
+        self, tmp_path, monkeypatch
+    ):
+        doc = tmp_path / "README.md"
+        doc.write_text("v1", encoding="utf-8")
+        clock = FakeClock()
+        cache = DocumentCache(check_seconds=2, clock=clock)
+        stats: list[str] = []
+        original_stat = document_cache._stat
+        monkeypatch.setattr(
+            document_cache, "_stat", lambda path: stats.append(path.name) or original_stat(path)
+        )
+
+        first = await cache.get(doc)
+        assert await cache.get(doc) is first
+        assert stats == ["README.md"]  # 확인 주기 안에서는 stat 생략
+
+        doc.write_text("v2 changed", encoding="utf-8")
+        os.utime(doc, ns=(first.mtime_ns + 10**9, first.mtime_ns + 10**9))
+        clock.now = 3
+        second = await cache.get(doc)
+        assert second.body.identity == b"v2 changed"
+        assert second.digest != first.digest
+
+    async def test_exists_reuses_recent_results(self, tmp_path):
+        doc = tmp_path / "A.md"
+        clock = FakeClock()
+        cache = DocumentCache(check_seconds=2, clock=clock)
+
+        assert await cache.exists([doc]) == [False]
+        doc.write_text("a", encoding="utf-8")
+        assert await cache.exists([doc]) == [False]
+        clock.now = 5
+        assert await cache.exists([doc]) == [True]
+
+
+class TestDocumentEndpoint:
+    """문서 엔드포인트 ETag / 압축 검증"""
+
+    def _client(self, tmp_path, monkeypatch, content: str) -> TestClient:
+        doc = tmp_path / "ARCHITECTURE.md"
+        doc.write_text(content, encoding="utf-8")
+        monkeypatch.setattr(docs, "ALLOWED_DOCS", {"/ARCHITECTURE.md": doc})
+        monkeypatch.setattr(document_cache, "_document_cache", DocumentCache())
+        app = FastAPI(docs_url=None)
+        app.include_router(docs.router)
+        return TestClient(app)
+
+    def test_if_none_match_returns_304(self, tmp_path, monkeypatch):
+        client = self._client(tmp_path, monkeypatch, "# 아키텍처")
+        params = {"path": "/ARCHITECTURE.md"}
+
+        first = client.get("/docs", params=params)
+        etag = first.headers["etag"]
+        assert first.text == "# 아키텍처"
+        assert first.headers["cache-control"] == "no-cache"
+
+        again = client.get("/docs", params=params, headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["etag"] == etag
+
+        stale = client.get("/docs", params=params, headers={"If-None-Match": '"other"'})
+        assert stale.status_code == 200
+
+    def test_serves_precompressed_variant_with_distinct_etag(self, tmp_path, monkeypatch):
+        content = "# 개발 가이드\n" * 500
+        client = self._client(tmp_path, monkeypatch, content)
+        params = {"path": "/ARCHITECTURE.md"}
+
+        plain = client.get("/docs", params=params, headers={"Accept-Encoding": "identity"})
+        zipped = client.get("/docs", params=params, headers={"Accept-Encoding": "gzip"})
+        assert plain.headers.get("content-encoding") is None
+        assert zipped.headers["content-encoding"] == "gzip"
+        assert zipped.headers["etag"] != plain.headers["etag"]
+        assert zipped.text == content  # httpx가 gzip 해제
+
+        # 압축 표현의 ETag로도 재검증 가능
+        revalidate = client.get(
+            "/docs",
+            params=params,
+            headers={"Accept-Encoding": "gzip", "If-None-Match": zipped.headers["etag"]},
+        )
+        assert revalidate.status_code == 304
@@ -0,0 +1,94 @@
+"""
+단위 테스트: 블로킹 호출 실행기
+BlockingExecutor 실행/대기열 제한/지표, 느린 콜백 감지, 문서 엔드포인트 오프로딩 검증
+"""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from server.app.api.v1.endpoints import docs
+from server.app.core.executor import (
+    BlockingExecutor,
+    ExecutorSaturatedException,
+    install_slow_callback_detector,
+)
+
+
+class TestBlockingExecutor:
+    """BlockingExecutor 검증"""
+
+    async def test_runs_off_loop_thread(self):
+        executor = BlockingExecutor(max_workers=2, max_queue=4)
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+        assert thread_name != threading.current_thread().name
+        assert executor.stats()["completed"] == 1
+        executor.shutdown()
+
+    async def test_rejects_when_queue_full(self):
+        executor = BlockingExecutor(max_workers=1, max_queue=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+            return "done"
+
+        running = asyncio.ensure_future(executor.run(block))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        waiting = asyncio.ensure_future(executor.run(block))
+        await asyncio.sleep(0)
+
+        stats = executor.stats()
+        assert stats["active"] == 1
+        assert stats["queued"] == 1
+        with pytest.raises(ExecutorSaturatedException):
+            await executor.run(block)
+
+        release.set()
+        assert await asyncio.gather(running, waiting) == ["done", "done"]
+        stats = executor.stats()
+        assert (stats["queued"], stats["active"], stats["max_queued"]) == (0, 0, 1)
+        assert (stats["completed"], stats["rejected"]) == (2, 1)
+        executor.shutdown()
+
+    async def test_counts_failures(self):
+        executor = BlockingExecutor(max_workers=1, max_queue=1)
+        with pytest.raises(ZeroDivisionError):
+            await executor.run(lambda: 1 / 0)
+        assert executor.stats()["failed"] == 1
+        executor.shutdown()
+
+    async def test_slow_callback_detector_enables_debug(self):
+        loop = asyncio.get_running_loop()
+        debug, duration = loop.get_debug(), loop.slow_callback_duration
+        try:
+            install_slow_callback_detector(250)
+            assert loop.get_debug() is True
+            assert loop.slow_callback_duration == 0.25
+        finally:
+            loop.set_debug(debug)
+            loop.slow_callback_duration = duration
+
+
+class TestDocsEndpoint:
+    """문서 엔드포인트 검증"""
+
+    def test_get_document_reads_via_executor(self, tmp_path, monkeypatch):
+        doc = tmp_path / "GUIDE.md"
+        doc.write_text("# 가이드", encoding="utf-8")
+        monkeypatch.setattr(
+            docs, "ALLOWED_DOCS", {"/GUIDE.md": doc, "/MISSING.md": tmp_path / "MISSING.md"}
+        )
+        app = FastAPI(docs_url=None)
+        app.include_router(docs.router)
+        client = TestClient(app)
+
+        assert client.get("/docs", params={"path": "/GUIDE.md"}).text == "# 가이드"
+        assert client.get("/docs", params={"path": "/MISSING.md"}).status_code == 404
+        listed = client.get("/docs/list").json()["documents"]
+        assert [d["exists"] for d in listed] == [True, False]
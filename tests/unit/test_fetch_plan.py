@@ -0,0 +1,95 @@
+"""
+단위 테스트: 서비스 조회 계획 (FetchPlan)
+독립 조회 동시 실행, 의존 순서, 실패/시간 초과 시 취소, 단계별 세션 분리 검증
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from benchmarks.seed import SeedConfig, create_schema, seed_database
+from server.app.domain.common.service import CommonService
+from server.app.shared.base import FetchPlan
+
+
+def sleeper(seconds: float, value: str):
+    async def fetch(db, dependencies):
+        await asyncio.sleep(seconds)
+        return value
+
+    return fetch
+
+
+class TestFetchPlan:
+    """조회 계획 실행 검증"""
+
+    @pytest.fixture
+    async def session(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'plan.db'}")
+        await create_schema(engine)
+        async with AsyncSession(engine) as session:
+            yield session
+        await engine.dispose()
+
+    async def test_independent_steps_run_concurrently(self, session):
+        results = await (
+            FetchPlan(session)
+            .add("a", sleeper(0.05, "A"))
+            .add("b", sleeper(0.05, "B"))
+            .add("c", lambda db, r: asyncio.sleep(0, f"{r['a']}+{r['b']}"), after=["a", "b"])
+            .run()
+        )
+        assert results["c"] == "A+B"
+        assert results.elapsed_ms < 90
+        assert results.timings["c"][0] >= results.timings["a"][1]
+
+    async def test_each_concurrent_step_gets_own_session(self, session):
+        seen = []
+
+        async def fetch(db, dependencies):
+            seen.append(db)
+            await asyncio.sleep(0.01)
+
+        await FetchPlan(session).add("a", fetch).add("b", fetch).run()
+        assert len({id(db) for db in seen}) == 2
+        assert session not in seen
+
+        seen.clear()
+        await FetchPlan(session, concurrent=False).add("a", fetch).add("b", fetch).run()
+        assert seen == [session, session]
+
+    async def test_failure_cancels_running_steps(self, session):
+        cancelled = []
+
+        async def slow(db, dependencies):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def fail(db, dependencies):
+            raise LookupError("missing")
+
+        plan = FetchPlan(session).add("slow", slow).add("fail", fail)
+        with pytest.raises(LookupError):
+            await plan.run()
+        assert cancelled == [True]
+
+    async def test_timeout_cancels_all_steps(self, session):
+        plan = FetchPlan(session).add("a", sleeper(5, "A")).add("b", sleeper(5, "B"))
+        with pytest.raises(asyncio.TimeoutError):
+            await plan.run(timeout=0.05)
+
+    def test_dependency_must_be_declared_first(self, session):
+        with pytest.raises(ValueError):
+            FetchPlan(session).add("b", sleeper(0, "B"), after=["a"])
+
+    async def test_common_sites_and_depts_loaded_in_parallel_sessions(self, session):
+        await seed_database(session, SeedConfig(docs=1, users=1))
+        await session.commit()
+
+        response = await CommonService(session)._load_sites_and_depts()
+        assert response.sites
+        assert response.depts
@@ -0,0 +1,76 @@
+"""
+단위 테스트: BaseFormatter.format_list 실행 경로
+format_many 일괄 변환, 동시 실행 수 제한/순서 보존, 실패 시 나머지 작업 취소 검증
+"""
+
+import asyncio
+
+import pytest
+
+from server.app.examples.sample_domain.formatters import SimpleMockFormatter
+from server.app.examples.sample_domain.schemas import SimpleFormatterInput
+from server.app.shared.base import BaseFormatter
+from server.app.shared.exceptions import FormatterException
+
+
+class TrackingFormatter(BaseFormatter[int, int]):
+    """동시에 실행 중인 format() 수를 기록하는 I/O 포맷터"""
+
+    def __init__(self, fail_on: int = -1) -> None:
+        self.fail_on = fail_on
+        self.running = 0
+        self.max_running = 0
+        self.cancelled = 0
+
+    async def format(self, input_data: int) -> int:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            # 뒤 항목이 먼저 끝나도록 해서 순서 보존을 확인
+            await asyncio.sleep(0.001 * (10 - input_data % 10))
+            if input_data == self.fail_on:
+                raise ValueError("boom")
+            return input_data * 2
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running -= 1
+
+
+class TestFormatList:
+    """format_list 실행 경로 검증"""
+
+    async def test_sequential_by_default(self):
+        formatter = TrackingFormatter()
+        assert await formatter.format_list(list(range(5))) == [0, 2, 4, 6, 8]
+        assert formatter.max_running == 1
+
+    async def test_concurrency_is_bounded_and_order_preserved(self):
+        formatter = TrackingFormatter()
+        result = await formatter.format_list(list(range(30)), concurrency=4)
+        assert result == [i * 2 for i in range(30)]
+        assert formatter.max_running == 4
+
+    async def test_failure_cancels_remaining_work(self):
+        formatter = TrackingFormatter(fail_on=3)
+        with pytest.raises(ValueError):
+            await formatter.format_list(list(range(20)), concurrency=4)
+        assert formatter.cancelled == 3
+        assert formatter.running == 0
+
+    async def test_format_many_fast_path_matches_format(self):
+        formatter = SimpleMockFormatter()
+        rows = [
+            {"id": 1, "name": "a", "description": "d", "category": "c", "status": "active"}
+        ]
+        inputs = [
+            SimpleFormatterInput(processed_items=rows * n, total_count=n) for n in range(3)
+        ]
+        expected = [await formatter.format(item) for item in inputs]
+        assert await formatter.format_list(inputs) == expected
+
+    async def test_format_many_wraps_errors(self):
+        broken = SimpleFormatterInput(processed_items=[{"id": 1}], total_count=1)
+        with pytest.raises(FormatterException):
+            await SimpleMockFormatter().format_list([broken])
@@ -0,0 +1,110 @@
+"""
+단위 테스트: Cache Invalidation Bus
+InvalidationBus / UnixSocketTransport 워커 간 전파 검증
+"""
+
+import asyncio
+from pathlib import Path
+
+from server.app.core.invalidation import InvalidationBus, UnixSocketTransport
+
+
+async def _wait_until(condition, timeout: float = 1.0) -> bool:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+class TestInvalidationBus:
+    """InvalidationBus 단위 테스트"""
+
+    async def test_local_publish_runs_sync_and_async_handlers(self):
+        """로컬 발행 시 동기/비동기 핸들러가 모두 실행되어야 합니다."""
+        bus = InvalidationBus()
+        received: list = []
+
+        async def async_handler(key):
+            received.append(("async", key))
+
+        bus.subscribe("codes", lambda key: received.append(("sync", key)))
+        bus.subscribe("codes", async_handler)
+        bus.subscribe("notice", lambda key: received.append(("notice", key)))
+
+        await bus.publish("codes", "UNIT")
+        assert received == [("sync", "UNIT"), ("async", "UNIT")]
+
+    async def test_handler_error_does_not_stop_others(self):
+        """핸들러 예외가 다른 핸들러 실행을 막지 않아야 합니다."""
+        bus = InvalidationBus()
+        received: list = []
+
+        def broken(key):
+            raise RuntimeError("boom")
+
+        bus.subscribe("codes", broken)
+        bus.subscribe("codes", received.append)
+        await bus.publish("codes")
+        assert received == [None]
+
+    async def test_received_dispatch_is_tracked_until_done(self):
+        """수신 메시지 처리 태스크는 완료될 때까지 보관되고, close() 시 마저 처리되어야 합니다."""
+        bus = InvalidationBus()
+        received: list = []
+
+        async def slow_handler(key):
+            await asyncio.sleep(0.01)
+            received.append(key)
+
+        bus.subscribe("codes", slow_handler)
+        await bus.start()
+        bus._on_message(b'{"channel": "codes", "key": "UNIT"}')
+        assert len(bus._tasks) == 1
+
+        await bus.close()
+        assert received == ["UNIT"]
+        assert bus._tasks == set()
+
+
+class TestUnixSocketTransport:
+    """UnixSocketTransport 워커 간 전파 검증"""
+
+    async def test_broadcast_between_workers(self, tmp_path: Path):
+        """다른 워커의 핸들러는 1회씩, 발행한 워커는 로컬에서만 1회 실행되어야 합니다."""
+        buses = [
+            InvalidationBus(UnixSocketTransport(tmp_path, worker_id=f"w{i}")) for i in range(3)
+        ]
+        received: dict[int, list] = {i: [] for i in range(3)}
+        for i, bus in enumerate(buses):
+            bus.subscribe("notice", received[i].append)
+            await bus.start()
+
+        try:
+            await buses[0].publish("notice", "2026-03-10")
+            assert await _wait_until(lambda: received[1] and received[2])
+            await asyncio.sleep(0.05)
+            assert received == {i: ["2026-03-10"] for i in range(3)}
+        finally:
+            for bus in buses:
+                await bus.close()
+
+        assert list(tmp_path.glob("*.sock")) == []
+
+    async def test_stale_socket_is_removed(self, tmp_path: Path):
+        """종료된 워커의 소켓 파일은 전송 시 정리되어야 합니다."""
+        stale = InvalidationBus(UnixSocketTransport(tmp_path, worker_id="stale"))
+        await stale.start()
+        # 비정상 종료 시뮬레이션 (수신 소켓만 닫히고 소켓 파일은 남음)
+        sock = stale.transport._sock
+        asyncio.get_running_loop().remove_reader(sock.fileno())
+        sock.close()
+
+        bus = InvalidationBus(UnixSocketTransport(tmp_path, worker_id="live"))
+        await bus.start()
+        try:
+            await bus.publish("codes")
+            assert not (tmp_path / "stale.sock").exists()
+        finally:
+            await bus.close()
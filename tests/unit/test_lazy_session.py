@@ -0,0 +1,132 @@
+"""
+단위 테스트: LazyAsyncSession / SessionReleasingRoute
+세션 지연 생성 및 응답 직렬화 전 세션 반환 검증
+"""
+
+import subprocess
+import sys
+
+from fastapi import APIRouter, Depends, FastAPI
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from server.app.core.database import LazyAsyncSession
+from server.app.core.dependencies import SessionReleasingRoute
+
+
+def _session_factory() -> async_sessionmaker[AsyncSession]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+class TestLazyAsyncSession:
+    """LazyAsyncSession 단위 테스트"""
+
+    async def test_not_acquired_until_first_use(self):
+        """속성 접근 전에는 세션을 생성하지 않아야 합니다."""
+        lazy = LazyAsyncSession(_session_factory())
+        assert lazy.is_acquired is False
+
+        await lazy.commit()
+        await lazy.rollback()
+        await lazy.release()
+        assert lazy.is_acquired is False
+
+    async def test_acquires_on_execute_and_releases(self):
+        """execute 시 세션을 생성하고 release 후 미사용 상태로 돌아가야 합니다."""
+        lazy = LazyAsyncSession(_session_factory())
+
+        result = await lazy.execute(text("SELECT 1"))
+        assert result.scalar() == 1
+        assert lazy.is_acquired is True
+
+        await lazy.release()
+        assert lazy.is_acquired is False
+
+    async def test_reusable_after_release(self):
+        """release 후 다시 사용하면 새 세션을 생성해야 합니다."""
+        lazy = LazyAsyncSession(_session_factory())
+        await lazy.execute(text("SELECT 1"))
+        await lazy.release()
+
+        result = await lazy.execute(text("SELECT 2"))
+        assert result.scalar() == 2
+        await lazy.close()
+
+
+class TestSessionReleasingRoute:
+    """SessionReleasingRoute 단위 테스트"""
+
+    async def test_session_released_before_serialization(self):
+        """엔드포인트 반환 직후 세션이 반환되어야 합니다."""
+        factory = _session_factory()
+        holder: dict = {}
+
+        async def provide_session():
+            session = LazyAsyncSession(factory)
+            holder["session"] = session
+            try:
+                yield session
+            finally:
+                await session.release()
+
+        router = APIRouter(route_class=SessionReleasingRoute)
+
+        @router.get("/value")
+        async def read_value(db: AsyncSession = Depends(provide_session)) -> dict:
+            value = (await db.execute(text("SELECT 42"))).scalar()
+            holder["acquired_in_handler"] = db.is_acquired
+            return {"value": value}
+
+        app = FastAPI()
+        app.include_router(router)
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get("/value")
+
+        assert response.status_code == 200
+        assert response.json() == {"value": 42}
+        assert holder["acquired_in_handler"] is True
+        assert holder["session"].is_acquired is False
+
+    async def test_unused_session_is_never_acquired(self):
+        """세션을 사용하지 않는 요청은 세션을 생성하지 않아야 합니다."""
+        factory = _session_factory()
+        holder: dict = {}
+
+        async def provide_session():
+            session = LazyAsyncSession(factory)
+            holder["session"] = session
+            yield session
+
+        router = APIRouter(route_class=SessionReleasingRoute)
+
+        @router.get("/noop")
+        async def noop(db: AsyncSession = Depends(provide_session)) -> dict:
+            return {"ok": True}
+
+        app = FastAPI()
+        app.include_router(router)
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get("/noop")
+
+        assert response.status_code == 200
+        assert holder["session"].is_acquired is False
+
+
+class TestLazyEngine:
+    """엔진 지연 생성 검증"""
+
+    def test_import_does_not_create_engine(self):
+        """server.main import만으로는 엔진/세션 팩토리를 만들지 않아야 합니다."""
+        code = (
+            "import server.main\n"
+            "from server.app.core import database\n"
+            "assert database._engine is None and database._session_factory is None\n"
+            "assert database.AsyncSessionLocal is database.get_session_factory()\n"
+            "assert database._engine is database.engine\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,74 @@
+"""
+단위 테스트: 부하 생성기
+시나리오 파일 검증, 도착 스케줄 실행, 오류율 집계 검증
+"""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks import load_test
+from benchmarks.load_test import LoadScenario, RequestSample, drive, latency_stats
+
+SCENARIO_FILE = Path(__file__).parents[2] / "benchmarks" / "scenarios" / "gate_office.toml"
+
+
+class TestLoadScenario:
+    """시나리오 파일 검증"""
+
+    def test_bundled_scenario_loads(self):
+        scenario = LoadScenario.load(SCENARIO_FILE)
+        assert [phase.name for phase in scenario.phases] == ["shift_change", "steady"]
+        assert scenario.seed.users == 200
+
+    def test_unknown_request_rejected(self):
+        data = {"phases": [{"name": "p", "duration_seconds": 1, "arrival_rate": 1, "mix": {"x": 1}}]}
+        with pytest.raises(ValueError):
+            LoadScenario.from_dict(data)
+
+
+class TestDrive:
+    """도착 스케줄 실행 및 집계 검증"""
+
+    async def test_drive_runs_mix_and_counts_errors(self, monkeypatch):
+        class FakeResponse:
+            def __init__(self, status_code: int) -> None:
+                self.status_code = status_code
+
+        async def ok(_ctx):
+            return FakeResponse(200)
+
+        async def broken(_ctx):
+            raise RuntimeError("pool timeout")
+
+        monkeypatch.setitem(load_test.REQUESTS, "list", ok)
+        monkeypatch.setitem(load_test.REQUESTS, "detail", broken)
+        scenario = LoadScenario.from_dict(
+            {
+                "phases": [
+                    {
+                        "name": "burst",
+                        "duration_seconds": 0.2,
+                        "arrival_rate": 200,
+                        "mix": {"list": 1, "detail": 1},
+                    }
+                ]
+            }
+        )
+
+        samples, _ = await drive(ctx=None, scenario=scenario)
+        stats = latency_stats(samples, elapsed=0.2)
+
+        assert stats["requests"] == len(samples) > 10
+        assert 0 < stats["error_rate"] < 1
+        assert stats["statuses"]["RuntimeError"] == stats["errors"]
+
+    def test_latency_stats_counts_http_errors(self):
+        samples = [
+            RequestSample("p", "list", 10.0, 200),
+            RequestSample("p", "list", 30.0, 503),
+        ]
+        stats = latency_stats(samples, elapsed=1.0)
+        assert stats["error_rate"] == 0.5
+        assert stats["statuses"] == {"200": 1, "503": 1}
+        assert stats["p99_ms"] == 30.0
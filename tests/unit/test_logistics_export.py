@@ -0,0 +1,112 @@
+"""
+단위 테스트: 반출입 이력 내보내기
+LogisticsRepository.stream_export_rows / LogisticsService.export 검증
+"""
+
+import csv
+import io
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from server.app.core.database import LazyAsyncSession
+from server.app.domain.logistics.formatters import LogisticsExportFormatter
+from server.app.domain.logistics.repositories.logistics_repository import LogisticsRepository
+from server.app.domain.logistics.schemas import (
+    ItemCreateSchema,
+    LogisticsCreateRequest,
+    LogisticsSearchParams,
+)
+from server.app.domain.logistics.service import LogisticsService
+
+
+def _create_request(company: str, *item_names: str) -> LogisticsCreateRequest:
+    return LogisticsCreateRequest(
+        busi_place="1",
+        export_date="2026-03-10",
+        author_name="홍길동",
+        author_dept="D01",
+        partner_company=company,
+        transport_type="01",
+        items=[ItemCreateSchema(item_name=name, quantity=2) for name in item_names],
+    )
+
+
+async def _seed(db: AsyncSession) -> None:
+    repo = LogisticsRepository(db)
+    await repo.create(_create_request("삼성전자", "육각볼트", "너트"), "u1")
+    await repo.create(_create_request("LG화학", "케이블"), "u1")
+    await repo.create(_create_request("현대제철"), "u1")
+    await db.commit()
+
+
+async def _collect(service: LogisticsService, params: LogisticsSearchParams, fmt: str) -> bytes:
+    return b"".join([chunk async for chunk in service.export(params, fmt)])
+
+
+class TestLogisticsExport:
+    """반출입 내보내기 스트림 검증"""
+
+    async def test_csv_flattens_headers_and_items(self, logistics_db: AsyncSession):
+        """물품 1건당 1행, 물품이 없는 문서는 헤더만 1행으로 내보내야 합니다."""
+        await _seed(logistics_db)
+        body = await _collect(LogisticsService(logistics_db), LogisticsSearchParams(), "csv")
+
+        assert body.startswith(b"\xef\xbb\xbf")
+        rows = list(csv.reader(io.StringIO(body.decode("utf-8-sig"))))
+        assert rows[0] == LogisticsExportFormatter().titles()
+        assert len(rows) == 1 + 4
+        assert sorted(row[12] for row in rows[1:]) == ["", "너트", "육각볼트", "케이블"]
+        assert {row[16] for row in rows[1:] if row[12]} == {"2.0"}
+
+    async def test_csv_applies_search_filters(self, logistics_db: AsyncSession):
+        """목록 조회와 동일한 검색 조건이 적용되어야 합니다."""
+        await _seed(logistics_db)
+        body = await _collect(
+            LogisticsService(logistics_db), LogisticsSearchParams(company="삼성"), "csv"
+        )
+        rows = list(csv.reader(io.StringIO(body.decode("utf-8-sig"))))[1:]
+        assert [row[5] for row in rows] == ["삼성전자", "삼성전자"]
+        assert [row[11] for row in rows] == ["1", "2"]
+
+    async def test_csv_chunks_by_row_count(self, logistics_db: AsyncSession):
+        """chunk_rows 단위로 나누어 내보내야 합니다."""
+        await _seed(logistics_db)
+        rows = LogisticsRepository(logistics_db).stream_export_rows(LogisticsSearchParams())
+        chunks = [chunk async for chunk in LogisticsExportFormatter(chunk_rows=2).csv_chunks(rows)]
+        # 제목 행 + 2행 + 2행
+        assert len(chunks) == 3
+
+    async def test_formula_cells_are_escaped(self, logistics_db: AsyncSession):
+        """수식으로 해석될 수 있는 문자열 셀은 ' 접두로 내보내야 합니다."""
+        repo = LogisticsRepository(logistics_db)
+        await repo.create(_create_request("=HYPERLINK(\"http://x\")", "-1+2", "@SUM(A1)"), "u1")
+        await repo.create(_create_request("+82 협력사", "\tTab"), "u1")
+        await logistics_db.commit()
+
+        body = await _collect(LogisticsService(logistics_db), LogisticsSearchParams(), "csv")
+        rows = list(csv.reader(io.StringIO(body.decode("utf-8-sig"))))[1:]
+        assert sorted({row[5] for row in rows}) == ["'+82 협력사", "'=HYPERLINK(\"http://x\")"]
+        assert sorted(row[12] for row in rows) == ["'\tTab", "'-1+2", "'@SUM(A1)"]
+        # 숫자/일시 셀은 그대로
+        assert {row[16] for row in rows} == {"2.0"}
+
+    async def test_stream_session_released_after_export(self, logistics_db: AsyncSession):
+        """스트리밍에 사용한 지연 세션은 스트림 종료 시 반환되어야 합니다."""
+        await _seed(logistics_db)
+        lazy = LazyAsyncSession(async_sessionmaker(logistics_db.bind, expire_on_commit=False))
+
+        body = await _collect(LogisticsService(lazy), LogisticsSearchParams(), "csv")
+        assert body.count(b"\n") == 5
+        assert lazy.is_acquired is False
+
+    async def test_xlsx_export(self, logistics_db: AsyncSession):
+        """XLSX 내보내기 결과를 openpyxl로 다시 읽을 수 있어야 합니다."""
+        openpyxl = pytest.importorskip("openpyxl")
+        await _seed(logistics_db)
+        body = await _collect(LogisticsService(logistics_db), LogisticsSearchParams(), "xlsx")
+
+        sheet = openpyxl.load_workbook(io.BytesIO(body), read_only=True).active
+        rows = list(sheet.iter_rows(values_only=True))
+        assert list(rows[0]) == LogisticsExportFormatter().titles()
+        assert len(rows) == 1 + 4
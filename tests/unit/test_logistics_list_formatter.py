@@ -0,0 +1,100 @@
+"""
+단위 테스트: 반출입 목록 포맷터
+LogisticsListFormatter(camelCase dict 직접 생성)가 LogisticsListItemSchema 응답과 일치하는지 검증
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.app.domain.logistics.formatters import LogisticsListFormatter
+from server.app.domain.logistics.models import Aw01010
+from server.app.domain.logistics.schemas import (
+    ItemCreateSchema,
+    LogisticsCreateRequest,
+    LogisticsListItemSchema,
+    LogisticsListResponse,
+    LogisticsSearchParams,
+)
+from server.app.domain.logistics.service import LogisticsService
+
+
+def _row(**overrides) -> SimpleNamespace:
+    values = {
+        "doc_no": "1000000000001",
+        "busi_place": "1",
+        "author_dept": "D01",
+        "author_name": "홍길동",
+        "partner_company": "삼성전자",
+        "security_check_yn": "N",
+        "receiver_check_yn": "Y",
+        "status": "반출",
+        "in_date": datetime(2026, 3, 10, 8, 30),
+        "up_date": None,
+        "item_name": "육각볼트",
+        "quantity": Decimal("12.5"),
+        "unit_code": "EA",
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestLogisticsListFormatter:
+    """목록 행 변환 검증"""
+
+    def test_row_matches_schema_serialization(self):
+        """dict 행은 스키마로 검증/직렬화한 결과와 같아야 합니다."""
+        no_items = _row(item_name=None, quantity=None, unit_code=None, in_date=None)
+        for list_row in (_row(), no_items):
+            row = LogisticsListFormatter.to_row(list_row)
+            validated = LogisticsListItemSchema.model_validate(row)
+            assert validated.model_dump(mode="json", by_alias=True) == row
+
+    def test_keys_cover_schema_aliases(self):
+        aliases = {f.alias or name for name, f in LogisticsListItemSchema.model_fields.items()}
+        assert set(LogisticsListFormatter.to_row(_row())) == aliases
+
+    def test_format_matches_list_response(self):
+        body = LogisticsListFormatter().format([_row(), _row(doc_no="1000000000002")])
+        assert body["total"] == 2
+        assert LogisticsListResponse.model_validate(body).items[1].doc_no == "1000000000002"
+
+
+class TestLogisticsServiceList:
+    """LogisticsService.get_list 응답 형태 및 Row 조회 검증"""
+
+    async def test_get_list_returns_camel_case_rows(self, logistics_db: AsyncSession):
+        service = LogisticsService(logistics_db)
+        await service.create(
+            LogisticsCreateRequest(
+                busi_place="1",
+                export_date="2026-03-10",
+                author_name="홍길동",
+                author_dept="D01",
+                partner_company="삼성전자",
+                transport_type="01",
+                items=[
+                    ItemCreateSchema(item_name="육각볼트", quantity=3, unit_code="EA"),
+                    ItemCreateSchema(item_name="너트", quantity=5, unit_code="EA"),
+                ],
+            ),
+            "u1",
+        )
+
+        body = await service.get_list(LogisticsSearchParams())
+        # 물품이 여러 건이어도 문서당 1행 (대표 물품 = 첫 번째 순번)
+        assert body["total"] == 1
+        row = body["items"][0]
+        assert row["company"] == "삼성전자"
+        assert row["material"] == "육각볼트"
+        assert row["quantity"] == 3.0
+
+    async def test_get_list_rejects_entity_select(self, logistics_db: AsyncSession):
+        """fetch_rows는 ORM 엔티티 select를 허용하지 않아야 합니다."""
+        repo = LogisticsService(logistics_db).repo
+        with pytest.raises(ValueError):
+            await repo.fetch_rows(select(Aw01010))
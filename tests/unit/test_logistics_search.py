@@ -0,0 +1,165 @@
+"""
+단위 테스트: 반출입 검색 색인
+NgramCalculator 및 LogisticsSearchRepository(n-gram 색인 유지/검색) 검증
+"""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.app.domain.logistics.calculators.ngram_calculator import NgramCalculator
+from server.app.domain.logistics.models import Aw01010Ngram, Aw01010Search
+from server.app.domain.logistics.repositories.logistics_repository import LogisticsRepository
+from server.app.domain.logistics.schemas import (
+    ItemCreateSchema,
+    LogisticsCreateRequest,
+    LogisticsSearchParams,
+    LogisticsUpdateRequest,
+)
+
+
+def _create_request(company: str, *items: tuple[str, str | None, str | None]):
+    return LogisticsCreateRequest(
+        busi_place="1",
+        export_date="2026-03-10",
+        author_name="홍길동",
+        author_dept="D01",
+        partner_company=company,
+        transport_type="01",
+        items=[
+            ItemCreateSchema(item_name=name, item_spec=spec, maker=maker)
+            for name, spec, maker in items
+        ],
+    )
+
+
+class TestNgramCalculator:
+    """NgramCalculator 단위 테스트"""
+
+    def test_bigrams_of_korean_text(self):
+        assert NgramCalculator.grams("삼성전자") == {"삼성", "성전", "전자"}
+
+    def test_grams_are_lowercased(self):
+        assert NgramCalculator.grams("ABc") == {"ab", "bc"}
+
+    def test_short_and_empty_values(self):
+        assert NgramCalculator.grams("가") == {"가"}
+        assert NgramCalculator.grams("  ") == set()
+        assert NgramCalculator.grams(None) == set()
+
+    def test_is_indexable_term(self):
+        assert NgramCalculator.is_indexable_term("볼트") is True
+        assert NgramCalculator.is_indexable_term("볼") is False
+
+
+class TestLogisticsSearchRepository:
+    """n-gram 색인 유지 및 검색 결과 검증"""
+
+    async def _seed(self, db: AsyncSession) -> LogisticsRepository:
+        repo = LogisticsRepository(db)
+        await repo.create(_create_request("삼성전자", ("육각볼트", "M10", "대한금속")), "u1")
+        await repo.create(_create_request("LG화학", ("케이블", "10m", "삼성케이블")), "u1")
+        await repo.create(_create_request("현대제철", ("강판", None, None)), "u1")
+        await db.commit()
+        return repo
+
+    async def _search(self, repo: LogisticsRepository, mode: str, **params) -> set[str]:
+        repo.search.mode = mode
+        rows = await repo.get_list(LogisticsSearchParams(**params))
+        return {row.partner_company for row in rows}
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"company": "삼성"},
+            {"company": "lg"},
+            {"company": "제"},
+            {"material": "볼트"},
+            {"material": "삼성"},
+            {"material": "M10"},
+            {"material": "없는자재"},
+        ],
+    )
+    async def test_ngram_matches_like(self, logistics_db: AsyncSession, params: dict):
+        """ngram 모드 검색 결과는 like 모드와 동일해야 합니다."""
+        repo = await self._seed(logistics_db)
+        assert await self._search(repo, "ngram", **params) == await self._search(
+            repo, "like", **params
+        )
+
+    async def test_material_searches_spec_and_maker(self, logistics_db: AsyncSession):
+        """자재 검색은 자재명/규격/메이커를 모두 대상으로 해야 합니다."""
+        repo = await self._seed(logistics_db)
+        assert await self._search(repo, "ngram", material="대한금속") == {"삼성전자"}
+        assert await self._search(repo, "ngram", material="10") == {"삼성전자", "LG화학"}
+
+    async def test_index_follows_update_and_delete(self, logistics_db: AsyncSession):
+        """수정/삭제 시 색인이 함께 갱신되어야 합니다."""
+        repo = await self._seed(logistics_db)
+        doc_no = (await repo.get_list(LogisticsSearchParams(company="현대")))[0].doc_no
+
+        await repo.update(
+            doc_no,
+            LogisticsUpdateRequest(
+                partner_company="포스코",
+                items=[ItemCreateSchema(item_name="철근")],
+            ),
+            "u2",
+        )
+        await logistics_db.commit()
+        assert await self._search(repo, "ngram", company="현대") == set()
+        assert await self._search(repo, "ngram", material="철근") == {"포스코"}
+
+        await repo.delete(doc_no)
+        await logistics_db.commit()
+        remaining = await logistics_db.execute(
+            select(func.count()).select_from(Aw01010Ngram).where(Aw01010Ngram.doc_no == doc_no)
+        )
+        assert remaining.scalar() == 0
+
+    async def test_rebuild_recreates_index(self, logistics_db: AsyncSession):
+        """rebuild는 모든 문서의 색인을 재생성해야 합니다."""
+        repo = await self._seed(logistics_db)
+        await logistics_db.execute(Aw01010Ngram.__table__.delete())
+        await logistics_db.execute(Aw01010Search.__table__.delete())
+
+        assert await repo.search.rebuild(batch_size=2) == 3
+        await logistics_db.commit()
+        assert await self._search(repo, "ngram", material="볼트") == {"삼성전자"}
+
+
+class TestLogisticsListQueryShapes:
+    """목록 쿼리 형태 재사용 검증"""
+
+    def test_same_filter_combination_reuses_statement(self):
+        repo = LogisticsRepository(None)
+        first, first_values = repo.list_query(LogisticsSearchParams(out_site="1", status="반출"))
+        second, second_values = repo.list_query(LogisticsSearchParams(out_site="2", status="반입"))
+
+        assert first is second
+        assert first_values == {"out_site": "1", "status": "반출"}
+        assert second_values == {"out_site": "2", "status": "반입"}
+        assert len({id(stmt) for stmt, _ in repo.list_shapes()}) == 16
+
+    def test_one_sided_date_range_uses_pair_shape(self):
+        repo = LogisticsRepository(None)
+        start_only, values = repo.list_query(LogisticsSearchParams(start_date="2026-03-01"))
+        end_only, _ = repo.list_query(LogisticsSearchParams(end_date="2026-03-31"))
+
+        assert start_only is end_only
+        assert values == {"start_date": "2026-03-01", "end_date": repo.MAX_EXPORT_DATE}
+
+    async def test_filters_and_search_terms_combine(self, logistics_db: AsyncSession):
+        repo = LogisticsRepository(logistics_db)
+        await repo.create(_create_request("삼성전자", ("육각볼트", "M10", "대한금속")), "u1")
+        await repo.create(_create_request("LG화학", ("케이블", "10m", "삼성케이블")), "u1")
+        await logistics_db.commit()
+
+        async def companies(**params) -> set[str]:
+            rows = await repo.get_list(LogisticsSearchParams(**params))
+            return {row.partner_company for row in rows}
+
+        assert await companies(out_site="1", start_date="2026-03-10") == {"삼성전자", "LG화학"}
+        assert await companies(out_site="1", end_date="2026-03-09") == set()
+        assert await companies(out_site="1", material="케이블") == {"LG화학"}
+        assert await companies(out_site="2", material="케이블") == set()
@@ -0,0 +1,186 @@
+"""
+단위 테스트: 반출입 통계
+LogisticsStatsRepository(GROUP BY 집계 / 일별 집계 증감 갱신) 및 LogisticsService.get_stats 검증
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import false, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from server.app.core.database import Base
+from server.app.domain.logistics.models import (
+    Aw01010,
+    Aw01010DailyStat,
+    Aw01010Ngram,
+    Aw01010Search,
+    Aw01011,
+)
+from server.app.domain.logistics.repositories.logistics_repository import LogisticsRepository
+from server.app.domain.logistics.repositories.stats_repository import (
+    LogisticsStatsRepository,
+    StatEntry,
+)
+from server.app.domain.logistics.schemas import (
+    ItemCreateSchema,
+    LogisticsCreateRequest,
+    LogisticsSearchParams,
+    LogisticsUpdateRequest,
+)
+from server.app.domain.logistics.service import LogisticsService
+
+
+def _create_request(busi_place: str, export_date: str, dept: str, transport_type: str):
+    return LogisticsCreateRequest(
+        busi_place=busi_place,
+        export_date=export_date,
+        author_name="홍길동",
+        author_dept=dept,
+        partner_company="협력업체",
+        transport_type=transport_type,
+        items=[ItemCreateSchema(item_name="볼트")],
+    )
+
+
+async def _seed(db: AsyncSession) -> list[str]:
+    """5건 등록 → 1건 반입 처리(경비실 확인) → 1건 삭제"""
+    repo = LogisticsRepository(db)
+    doc_nos = []
+    for busi_place, export_date, dept, transport_type in [
+        ("1", "2026-03-10", "D01", "01"),
+        ("1", "2026-03-10", "D01", "01"),
+        ("1", "2026-03-11", "D02", "02"),
+        ("2", "2026-03-11", "D01", "01"),
+        ("2", "2026-03-12", "D03", "02"),
+    ]:
+        header = await repo.create(
+            _create_request(busi_place, export_date, dept, transport_type), "u1"
+        )
+        doc_nos.append(header.doc_no)
+    await db.commit()
+
+    await repo.update(
+        doc_nos[0], LogisticsUpdateRequest(status="반입", security_check_yn="Y"), "u2"
+    )
+    await repo.delete(doc_nos[4])
+    await db.commit()
+    return doc_nos
+
+
+class TestLogisticsStats:
+    """반출입 통계 검증"""
+
+    async def test_live_stats(self, logistics_db: AsyncSession):
+        """GROUP BY 집계 결과를 차원별로 합산해야 합니다."""
+        await _seed(logistics_db)
+        service = LogisticsService(logistics_db)
+        service.repo.stats.source = "live"
+
+        stats = await service.get_stats(LogisticsSearchParams())
+
+        assert stats.total == 4
+        assert stats.by_status == {"반입": 1, "반출": 3}
+        assert stats.by_site == {"1": 3, "2": 1}
+        assert stats.by_dept == {"D01": 3, "D02": 1}
+        assert stats.by_day == {"2026-03-10": 2, "2026-03-11": 2}
+        assert stats.by_transport_type == {"01": 3, "02": 1}
+        assert stats.security_pending == 3
+        assert stats.receiver_pending == 4
+
+    async def test_date_range_filter(self, logistics_db: AsyncSession):
+        """기간 조건이 반출 일자에 적용되어야 합니다."""
+        await _seed(logistics_db)
+        service = LogisticsService(logistics_db)
+
+        stats = await service.get_stats(
+            LogisticsSearchParams(start_date="2026-03-11", end_date="2026-03-31")
+        )
+        assert stats.total == 2
+        assert stats.by_day == {"2026-03-11": 2}
+
+    async def test_summary_matches_live(self, logistics_db: AsyncSession):
+        """증감 갱신된 일별 집계는 live 집계와 같아야 합니다."""
+        await _seed(logistics_db)
+        service = LogisticsService(logistics_db)
+        params = LogisticsSearchParams(out_site="1")
+
+        service.repo.stats.source = "live"
+        live = await service.get_stats(params)
+        service.repo.stats.source = "summary"
+        summary = await service.get_stats(params)
+
+        assert summary == live
+
+    async def test_rebuild_matches_incremental(self, logistics_db: AsyncSession):
+        """rebuild로 재생성한 일별 집계는 증감 갱신 결과와 같아야 합니다."""
+        await _seed(logistics_db)
+        service = LogisticsService(logistics_db)
+        service.repo.stats.source = "summary"
+        incremental = await service.get_stats(LogisticsSearchParams())
+
+        await service.repo.stats.rebuild()
+        await logistics_db.commit()
+        assert await service.get_stats(LogisticsSearchParams()) == incremental
+
+
+class TestDailyStatUpsert:
+    """같은 집계 키의 첫 문서가 동시에 등록되는 경우 검증"""
+
+    @pytest.fixture
+    async def session_factory(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stats.db'}")
+        tables = [
+            Aw01010.__table__,
+            Aw01011.__table__,
+            Aw01010Search.__table__,
+            Aw01010Ngram.__table__,
+            Aw01010DailyStat.__table__,
+        ]
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=tables)
+        yield async_sessionmaker(engine, expire_on_commit=False)
+        await engine.dispose()
+
+    async def _doc_counts(self, session_factory) -> list[int]:
+        async with session_factory() as db:
+            return list((await db.execute(select(Aw01010DailyStat.doc_cnt))).scalars())
+
+    async def test_same_key_from_separate_sessions(self, session_factory):
+        """서로 다른 세션에서 같은 키 문서를 등록해도 집계 행 1개에 2건으로 반영되어야 합니다."""
+        async with session_factory() as first, session_factory() as second:
+            # 두 세션 모두 집계 행이 없는 상태에서 시작
+            for db in (first, second):
+                assert (await db.execute(select(Aw01010DailyStat))).first() is None
+            for db in (first, second):
+                await LogisticsRepository(db).create(
+                    _create_request("1", "2026-03-10", "D01", "01"), "u1"
+                )
+                await db.commit()
+
+        assert await self._doc_counts(session_factory) == [2]
+
+    async def test_fallback_retries_update_after_duplicate_insert(self, session_factory):
+        """UPDATE 이후 다른 트랜잭션이 행을 추가하면 INSERT 대신 UPDATE를 재시도해야 합니다."""
+        entry = StatEntry(datetime(2026, 3, 10), "1", "D01", "반출", "01", 1, 1)
+        async with session_factory() as other:
+            await LogisticsStatsRepository(other).apply_change(None, entry)
+            await other.commit()
+
+        async with session_factory() as db:
+            repo = LogisticsStatsRepository(db)
+            build_update = repo._update_statement
+            calls: list[int] = []
+
+            def first_update_misses(entry: StatEntry, sign: int):
+                # 첫 UPDATE는 다른 트랜잭션이 행을 추가하기 전에 실행된 것처럼 0행 갱신
+                calls.append(sign)
+                stmt = build_update(entry, sign)
+                return stmt.where(false()) if len(calls) == 1 else stmt
+
+            repo._update_statement = first_update_misses
+            await repo._update_or_insert(entry)
+            await db.commit()
+
+        assert len(calls) == 2
+        assert await self._doc_counts(session_factory) == [2]
@@ -0,0 +1,122 @@
+"""
+단위 테스트: 반출입 증분 동기화
+LogisticsService.sync / 삭제 이력(AW01010_DEL_LOG) 검증
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.app.domain.logistics.models import Aw01010
+from server.app.domain.logistics.repositories.logistics_repository import LogisticsRepository
+from server.app.domain.logistics.schemas import (
+    ItemCreateSchema,
+    LogisticsCreateRequest,
+    LogisticsUpdateRequest,
+)
+from server.app.domain.logistics.service import LogisticsService
+
+
+def _create_request(busi_place: str, company: str) -> LogisticsCreateRequest:
+    return LogisticsCreateRequest(
+        busi_place=busi_place,
+        export_date="2026-03-10",
+        author_name="홍길동",
+        author_dept="D01",
+        partner_company=company,
+        transport_type="01",
+        items=[ItemCreateSchema(item_name="볼트")],
+    )
+
+
+async def _seed(db: AsyncSession) -> list[str]:
+    repo = LogisticsRepository(db)
+    doc_nos = []
+    for busi_place, company in [("1", "A사"), ("1", "B사"), ("2", "C사")]:
+        doc_nos.append((await repo.create(_create_request(busi_place, company), "u1")).doc_no)
+    await db.commit()
+    return doc_nos
+
+
+class TestLogisticsSync:
+    """증분 동기화 검증"""
+
+    async def test_initial_sync_returns_all(self, logistics_db: AsyncSession):
+        """since 없이 호출하면 전체 문서를 반환해야 합니다."""
+        doc_nos = await _seed(logistics_db)
+        result = await LogisticsService(logistics_db).sync(None, None, 500)
+
+        assert {item.doc_no for item in result.changed} == set(doc_nos)
+        assert result.deleted == []
+        assert result.has_more is False
+
+    async def test_delta_contains_only_changes(self, logistics_db: AsyncSession):
+        """since 이후 수정/삭제분만 반환해야 합니다."""
+        doc_nos = await _seed(logistics_db)
+        service = LogisticsService(logistics_db)
+        since = datetime.now()
+
+        await service.update(doc_nos[0], LogisticsUpdateRequest(partner_company="A'사"), "u2")
+        await service.delete(doc_nos[1], "u2")
+
+        result = await service.sync(since, None, 500)
+        assert [item.doc_no for item in result.changed] == [doc_nos[0]]
+        assert result.changed[0].company == "A'사"
+        assert result.deleted == [doc_nos[1]]
+
+        later = await service.sync(datetime.now() + timedelta(seconds=1), None, 500)
+        assert later.changed == [] and later.deleted == []
+
+    async def test_filters_by_site(self, logistics_db: AsyncSession):
+        """사업장 조건이 변경/삭제 모두에 적용되어야 합니다."""
+        doc_nos = await _seed(logistics_db)
+        service = LogisticsService(logistics_db)
+        since = datetime.now()
+        await service.delete(doc_nos[2], "u2")
+
+        assert (await service.sync(since, "1", 500)).deleted == []
+        assert (await service.sync(since, "2", 500)).deleted == [doc_nos[2]]
+
+    async def test_paginates_with_watermark(self, logistics_db: AsyncSession):
+        """limit을 넘으면 has_more와 마지막 문서 시각을 watermark로 반환해야 합니다."""
+        await _seed(logistics_db)
+        service = LogisticsService(logistics_db)
+
+        first = await service.sync(None, None, 2)
+        assert len(first.changed) == 2
+        assert first.has_more is True
+
+        second = await service.sync(datetime.fromisoformat(first.watermark), None, 2)
+        assert second.has_more is False
+        seen = {item.doc_no for item in first.changed + second.changed}
+        assert len(seen) == 3
+
+    async def test_paginates_past_rows_sharing_one_timestamp(self, logistics_db: AsyncSession):
+        """같은 변경 시각의 문서가 limit보다 많아도 (시각, 반출입번호) 순으로 모두 받아야 합니다."""
+        doc_nos = await _seed(logistics_db)
+        service = LogisticsService(logistics_db)
+        same_time = datetime(2026, 3, 10, 9, 0, 0)
+        await logistics_db.execute(update(Aw01010).values(in_date=same_time, up_date=None))
+        await logistics_db.commit()
+
+        seen: list[str] = []
+        since, after = None, None
+        for _ in range(5):
+            page = await service.sync(since, None, 1, after)
+            seen += [item.doc_no for item in page.changed]
+            if not page.has_more:
+                break
+            since, after = datetime.fromisoformat(page.watermark), page.after_doc_no
+
+        assert seen == sorted(doc_nos)
+
+    async def test_timezone_aware_since(self, logistics_db: AsyncSession):
+        """시간대가 포함된 since는 서버 로컬 시각으로 변환하여 비교해야 합니다."""
+        doc_nos = await _seed(logistics_db)
+        service = LogisticsService(logistics_db)
+        since = datetime.now(timezone.utc) - timedelta(minutes=1)
+
+        result = await service.sync(since, None, 500)
+        assert {item.doc_no for item in result.changed} == set(doc_nos)
+        assert datetime.fromisoformat(result.watermark).tzinfo is None
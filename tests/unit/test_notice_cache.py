@@ -0,0 +1,131 @@
+"""
+단위 테스트: 팝업 공지 캐시
+PopupNoticeCache(날짜 버킷/자정 만료/무효화/단일 적재) 및 BoardService 연동 검증
+"""
+
+import asyncio
+import json
+from datetime import date, datetime
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from server.app.core.database import Base
+from server.app.core.invalidation import InvalidationBus
+from server.app.domain.board.models.notice import WbBoardInfo
+from server.app.domain.board.notice_cache import NOTICE_CHANNEL, PopupNoticeCache
+from server.app.domain.board.service import BoardService
+
+
+class FakeClock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class CountingLoader:
+    def __init__(self) -> None:
+        self.days: list[date] = []
+
+    async def __call__(self, day: date) -> bytes:
+        self.days.append(day)
+        await asyncio.sleep(0)
+        return f'{{"day":"{day}"}}'.encode()
+
+
+class TestPopupNoticeCache:
+    """PopupNoticeCache 단위 테스트"""
+
+    async def test_serves_cached_payload_within_day(self):
+        clock = FakeClock(datetime(2026, 3, 10, 8, 0))
+        cache, loader = PopupNoticeCache(clock=clock), CountingLoader()
+
+        first = await cache.get_or_load(loader)
+        clock.now = datetime(2026, 3, 10, 23, 59, 59)
+        assert await cache.get_or_load(loader) == first
+        assert loader.days == [date(2026, 3, 10)]
+
+    async def test_expires_at_midnight(self):
+        clock = FakeClock(datetime(2026, 3, 10, 23, 59))
+        cache, loader = PopupNoticeCache(clock=clock), CountingLoader()
+
+        await cache.get_or_load(loader)
+        assert cache.expires_at(clock.now) == datetime(2026, 3, 11, 0, 0)
+        clock.now = datetime(2026, 3, 11, 0, 0)
+        assert (await cache.get_or_load(loader)).identity == b'{"day":"2026-03-11"}'
+        assert loader.days == [date(2026, 3, 10), date(2026, 3, 11)]
+
+    async def test_max_age_caps_expiry(self):
+        clock = FakeClock(datetime(2026, 3, 10, 8, 0))
+        cache, loader = PopupNoticeCache(max_age_seconds=60, clock=clock), CountingLoader()
+
+        await cache.get_or_load(loader)
+        clock.now = datetime(2026, 3, 10, 8, 1)
+        await cache.get_or_load(loader)
+        assert len(loader.days) == 2
+        assert cache.expires_at(datetime(2026, 3, 10, 23, 59, 30)) == datetime(2026, 3, 11)
+
+    async def test_concurrent_misses_load_once(self):
+        cache, loader = PopupNoticeCache(), CountingLoader()
+        results = await asyncio.gather(*(cache.get_or_load(loader) for _ in range(20)))
+        assert len(set(results)) == 1
+        assert len(loader.days) == 1
+
+    async def test_invalidated_by_bus(self):
+        cache, loader = PopupNoticeCache(), CountingLoader()
+        bus = InvalidationBus()
+        bus.subscribe(NOTICE_CHANNEL, cache.invalidate)
+
+        await cache.get_or_load(loader)
+        await bus.publish(NOTICE_CHANNEL)
+        await cache.get_or_load(loader)
+        assert len(loader.days) == 2
+
+    async def test_invalidate_during_load_discards_result(self):
+        cache, loader = PopupNoticeCache(), CountingLoader()
+
+        async def stale_loader(day: date) -> bytes:
+            # 변경 전 데이터를 읽은 직후 공지가 수정되어 무효화됨
+            cache.invalidate()
+            return await loader(day)
+
+        await cache.get_or_load(stale_loader)
+        await cache.get_or_load(loader)
+        assert len(loader.days) == 2
+
+
+class TestBoardServicePopupJson:
+    """BoardService 팝업 공지 JSON 응답 검증"""
+
+    async def test_encoded_payload_matches_response_model(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[WbBoardInfo.__table__])
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        today = date.today().strftime("%Y%m%d")
+        async with factory() as session:
+            session.add(
+                WbBoardInfo(
+                    project_cd="P",
+                    menu_cd="M",
+                    board_seq="1",
+                    board_title="정기 점검",
+                    board_txt="본문",
+                    popup_yn="Y",
+                    popup_start_dt=today,
+                    popup_end_dt=today,
+                    board_category="02",
+                    reg_dt=datetime.now(),
+                )
+            )
+            await session.commit()
+
+            service = BoardService(session)
+            payload = await service._load_popup_notices_json(date.today())
+            expected = (await service.get_popup_notices()).model_dump(by_alias=True)
+
+        assert json.loads(payload) == expected
+        assert json.loads(payload)["notices"][0]["boardTitle"] == "정기 점검"
+        await engine.dispose()
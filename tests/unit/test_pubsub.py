@@ -0,0 +1,110 @@
+"""
+단위 테스트: In-process Pub/Sub
+InMemoryBroker / Subscription / sse_stream 및 반출입 변경 이벤트 발행 검증
+"""
+
+import json
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.app.core.pubsub import InMemoryBroker, set_broker, sse_stream
+from server.app.domain.logistics.schemas import (
+    ItemCreateSchema,
+    LogisticsCreateRequest,
+    LogisticsUpdateRequest,
+)
+from server.app.domain.logistics.service import LogisticsService
+
+
+class TestInMemoryBroker:
+    """InMemoryBroker 단위 테스트"""
+
+    async def test_fan_out_by_topic(self):
+        """같은 토픽의 모든 구독자에게만 전달되어야 합니다."""
+        broker = InMemoryBroker()
+        first = broker.subscribe("a")
+        second = broker.subscribe("a", "b")
+        other = broker.subscribe("c")
+
+        await broker.publish("a", {"n": 1})
+
+        assert await first.get(timeout=0.1) == {"n": 1}
+        assert await second.get(timeout=0.1) == {"n": 1}
+        assert await other.get(timeout=0.01) is None
+
+    async def test_unsubscribe(self):
+        """구독 해제 후에는 토픽 등록이 정리되어야 합니다."""
+        broker = InMemoryBroker()
+        subscription = broker.subscribe("a")
+        broker.unsubscribe(subscription)
+        await broker.publish("a", {"n": 1})
+        assert broker.subscriber_count("a") == 0
+
+    async def test_slow_subscriber_drops_oldest(self):
+        """큐가 가득 차면 가장 오래된 메시지를 버려야 합니다."""
+        broker = InMemoryBroker()
+        subscription = broker.subscribe("a", maxsize=2)
+        for n in range(3):
+            await broker.publish("a", {"n": n})
+
+        assert subscription.dropped == 1
+        assert await subscription.get(timeout=0.1) == {"n": 1}
+        assert await subscription.get(timeout=0.1) == {"n": 2}
+
+    async def test_sse_stream_format_and_heartbeat(self):
+        """메시지는 SSE 이벤트로, 유휴 시에는 주석 행을 내보내야 합니다."""
+        broker = InMemoryBroker()
+        stream = sse_stream(broker, ("a",), heartbeat=0.01)
+        # 스트림이 시작되기 전에는 구독하지 않음
+        assert broker.subscriber_count("a") == 0
+
+        assert await stream.__anext__() == ": ping\n\n"
+        assert broker.subscriber_count("a") == 1
+        await broker.publish("a", {"type": "created", "docNo": "1"})
+        chunk = await stream.__anext__()
+        assert chunk.startswith("event: created\ndata: ")
+        assert json.loads(chunk.split("data: ", 1)[1]) == {"type": "created", "docNo": "1"}
+
+        await stream.aclose()
+        assert broker.subscriber_count("a") == 0
+
+
+class TestLogisticsChangeEvents:
+    """반출입 변경 이벤트 발행 검증"""
+
+    async def test_publishes_after_commit(self, logistics_db: AsyncSession):
+        """등록/수정/삭제 시 전체 토픽과 사업장 토픽에 이벤트를 발행해야 합니다."""
+        broker = InMemoryBroker()
+        set_broker(broker)
+        try:
+            site = broker.subscribe(*LogisticsService.event_topics("1"))
+            other_site = broker.subscribe(*LogisticsService.event_topics("2"))
+            everything = broker.subscribe(*LogisticsService.event_topics())
+            service = LogisticsService(logistics_db)
+
+            created = await service.create(
+                LogisticsCreateRequest(
+                    busi_place="1",
+                    export_date="2026-03-10",
+                    author_name="홍길동",
+                    author_dept="D01",
+                    partner_company="협력업체",
+                    transport_type="01",
+                    items=[ItemCreateSchema(item_name="볼트")],
+                ),
+                "u1",
+            )
+            await service.update(
+                created.doc_no, LogisticsUpdateRequest(security_check_yn="Y"), "u2"
+            )
+            await service.delete(created.doc_no, "u2")
+
+            events = [await site.get(timeout=0.1) for _ in range(3)]
+            assert [event["type"] for event in events] == ["created", "updated", "deleted"]
+            assert events[0]["docNo"] == created.doc_no
+            assert events[1]["securityCheckYn"] == "Y"
+            assert events[2]["busiPlace"] == "1"
+            assert (await everything.get(timeout=0.1))["type"] == "created"
+            assert await other_site.get(timeout=0.01) is None
+        finally:
+            set_broker(InMemoryBroker())
@@ -0,0 +1,203 @@
+"""
+단위 테스트: Rate Limiting
+InMemoryRateLimitBackend(토큰 버킷/유휴 제거), RateLimitMiddleware 정책 적용,
+로그인 의존성(IP + loginId 버킷) 검증
+"""
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from server.app.core import rate_limit
+from server.app.core.config import settings
+from server.app.core.rate_limit import (
+    LOGIN_POLICY,
+    InMemoryRateLimitBackend,
+    RateLimitMiddleware,
+    RateLimitPolicy,
+    enforce_login_rate_limit,
+)
+from server.app.domain.auth.service import ALGORITHM
+
+STRICT = RateLimitPolicy(
+    name="login",
+    capacity=2,
+    refill_per_second=1,
+    path_prefix="/login",
+    methods=frozenset({"POST"}),
+)
+LENIENT = RateLimitPolicy(name="read", capacity=5, refill_per_second=1)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryRateLimitBackend:
+    """토큰 버킷 저장소 단위 테스트"""
+
+    async def test_burst_then_refill(self):
+        """버킷 크기만큼 허용 후 거부되고, 시간이 지나면 충전되어야 합니다."""
+        clock = FakeClock()
+        backend = InMemoryRateLimitBackend(clock=clock)
+
+        assert await backend.consume("k", STRICT) == 0
+        assert await backend.consume("k", STRICT) == 0
+        assert await backend.consume("k", STRICT) == 1.0
+
+        clock.now = 1.0
+        assert await backend.consume("k", STRICT) == 0
+        assert await backend.consume("k", STRICT) > 0
+
+    async def test_idle_buckets_are_evicted(self):
+        """idle_seconds 동안 사용되지 않은 버킷은 제거되어야 합니다."""
+        clock = FakeClock()
+        backend = InMemoryRateLimitBackend(idle_seconds=10, clock=clock)
+        await backend.consume("old", STRICT)
+
+        clock.now = 5.0
+        await backend.consume("recent", STRICT)
+        clock.now = 11.0
+        await backend.consume("new", STRICT)
+
+        assert len(backend) == 2
+        assert "old" not in backend._buckets
+
+    async def test_max_keys_bound(self):
+        """버킷 수는 max_keys를 넘지 않고 가장 오래 미사용 버킷부터 제거되어야 합니다."""
+        backend = InMemoryRateLimitBackend(max_keys=3, clock=FakeClock())
+        for key in ("a", "b", "c"):
+            await backend.consume(key, STRICT)
+        await backend.consume("a", STRICT)
+        await backend.consume("d", STRICT)
+
+        assert len(backend) == 3
+        assert set(backend._buckets) == {"c", "a", "d"}
+
+
+class TestRateLimitMiddleware:
+    """정책별 제한 및 429 응답 검증"""
+
+    def _client(self, **kwargs) -> TestClient:
+        app = FastAPI()
+
+        @app.post("/login")
+        async def login():
+            return {"ok": True}
+
+        @app.get("/items")
+        async def items():
+            return {"ok": True}
+
+        app.add_middleware(
+            RateLimitMiddleware,
+            backend=InMemoryRateLimitBackend(),
+            policies=(STRICT, LENIENT),
+            **kwargs,
+        )
+        return TestClient(app)
+
+    def test_strict_policy_returns_429(self):
+        """엄격한 정책 초과 시 429와 Retry-After를 응답해야 합니다."""
+        client = self._client()
+        assert client.post("/login").status_code == 200
+        assert client.post("/login").status_code == 200
+
+        response = client.post("/login")
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "1"
+        assert "detail" in response.json()
+
+        # 다른 정책의 버킷은 영향받지 않음
+        assert client.get("/items").status_code == 200
+
+    def test_user_bucket_is_separate_per_token(self):
+        """인증 사용자는 IP 버킷과 별개로 사용자 버킷도 차감되어야 합니다."""
+        client = self._client()
+        token = jwt.encode({"sub": "u1"}, settings.SECRET_KEY, algorithm=ALGORITHM)
+        headers = {"Authorization": f"Bearer {token}"}
+        for _ in range(LENIENT.capacity):
+            assert client.get("/items", headers=headers).status_code == 200
+        assert client.get("/items", headers=headers).status_code == 429
+
+    def test_user_bucket_uses_unverified_subject(self):
+        """서명이 다른 토큰도 payload의 sub로 같은 사용자 버킷을 차감해야 합니다."""
+        client = self._client()
+        for i in range(LENIENT.capacity + 1):
+            token = jwt.encode({"sub": "u1"}, f"other-secret-{i}", algorithm=ALGORITHM)
+            response = client.get("/items", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 429
+
+    def test_forwarded_header_only_when_trusted(self):
+        """X-Forwarded-For는 trust_forwarded일 때만 클라이언트 IP로 사용해야 합니다."""
+        untrusted = self._client()
+        for i in range(3):
+            response = untrusted.post("/login", headers={"X-Forwarded-For": f"10.0.0.{i}"})
+        assert response.status_code == 429
+
+        trusted = self._client(trust_forwarded=True)
+        for i in range(3):
+            response = trusted.post("/login", headers={"X-Forwarded-For": f"10.0.0.{i}"})
+        assert response.status_code == 200
+
+
+class TestLoginRateLimit:
+    """로그인 의존성: (IP + loginId) 버킷 검증"""
+
+    def _client(self, monkeypatch) -> TestClient:
+        monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+        monkeypatch.setattr(rate_limit, "_backend", InMemoryRateLimitBackend())
+        app = FastAPI()
+
+        @app.post("/login", dependencies=[Depends(enforce_login_rate_limit)])
+        async def login(body: dict):
+            return body
+
+        return TestClient(app)
+
+    def test_bucket_is_per_login_id(self, monkeypatch):
+        """같은 IP라도 loginId가 다르면 서로 제한하지 않아야 합니다."""
+        client = self._client(monkeypatch)
+        for _ in range(LOGIN_POLICY.capacity):
+            assert client.post("/login", json={"loginId": "kim"}).status_code == 200
+
+        response = client.post("/login", json={"loginId": " KIM "})
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) >= 1
+
+        # 같은 IP의 다른 사용자, 본문은 라우트에서도 그대로 읽힘
+        response = client.post("/login", json={"loginId": "lee"})
+        assert response.status_code == 200
+        assert response.json() == {"loginId": "lee"}
+
+
+class TestSharedBackend:
+    """미들웨어와 로그인 의존성의 버킷 저장소 공유 검증"""
+
+    def test_application_middleware_uses_shared_backend(self, monkeypatch):
+        """애플리케이션의 미들웨어는 설정값으로 만든 공용 저장소를 사용해야 합니다."""
+        from server.main import create_application
+
+        monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+        monkeypatch.setattr(rate_limit, "_backend", None)
+        app = create_application()
+
+        shared = rate_limit.get_rate_limit_backend()
+        assert len(shared) == 0
+        [entry] = [m for m in app.user_middleware if m.cls is RateLimitMiddleware]
+        assert entry.kwargs["backend"] is shared
+
+        layer = app.build_middleware_stack()
+        while not isinstance(layer, RateLimitMiddleware):
+            layer = layer.app
+        assert layer.backend is shared
+
+    def test_default_backend_is_shared(self, monkeypatch):
+        """backend를 지정하지 않으면 공용 저장소를 사용해야 합니다."""
+        monkeypatch.setattr(rate_limit, "_backend", None)
+        middleware = RateLimitMiddleware(FastAPI())
+        assert middleware.backend is rate_limit.get_rate_limit_backend()
@@ -0,0 +1,68 @@
+"""
+단위 테스트: JSON 응답 클래스
+FastJSONResponse(기본 응답) / ModelResponse(재검증 없는 모델 직렬화) 검증
+"""
+
+import json
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from server.app.core.responses import FastJSONResponse, ModelResponse
+from server.app.domain.logistics.schemas import LogisticsListItemSchema, LogisticsListResponse
+
+ITEM = LogisticsListItemSchema(
+    doc_no="1000000000001",
+    out_site="1",
+    out_site_name="본사",
+    company="삼성전자",
+    status="반출",
+)
+
+
+class TestFastJSONResponse:
+    """기본 응답 클래스 검증"""
+
+    def test_render_matches_standard_json(self):
+        content = {"name": "삼성전자", "n": 1, "items": [None, 1.5]}
+        assert json.loads(FastJSONResponse(content).body) == content
+        assert "삼성전자".encode() in FastJSONResponse(content).body
+
+    def test_render_datetime_and_int_keys(self):
+        body = FastJSONResponse({1: datetime(2026, 3, 10, 8, 0)}).body
+        assert json.loads(body) == {"1": "2026-03-10T08:00:00"}
+
+
+class TestModelResponse:
+    """ModelResponse 검증"""
+
+    def test_render_uses_aliases(self):
+        body = json.loads(ModelResponse(LogisticsListResponse(items=[ITEM], total=1)).body)
+        assert body["items"][0]["docNo"] == "1000000000001"
+        assert body["items"][0]["outSiteName"] == "본사"
+
+    def test_endpoint_skips_response_model_validation(self, monkeypatch):
+        """ModelResponse를 반환하면 response_model 재검증 없이 그대로 응답해야 합니다."""
+        app = FastAPI(default_response_class=FastJSONResponse)
+
+        @app.get("/list", response_model=LogisticsListResponse)
+        async def get_list() -> Response:
+            return ModelResponse(LogisticsListResponse(items=[ITEM], total=1))
+
+        calls: list[str] = []
+        original = LogisticsListResponse.model_validate
+
+        def counting(*args, **kwargs):
+            calls.append("validate")
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(LogisticsListResponse, "model_validate", counting)
+        response = TestClient(app).get("/list")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["items"][0]["docNo"] == "1000000000001"
+        assert calls == []
+        assert "LogisticsListResponse" in str(app.openapi())
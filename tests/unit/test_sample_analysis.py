@@ -0,0 +1,96 @@
+"""
+단위 테스트: 샘플 분석 계산기
+NumPy 분석 커널 결과, Isolation Forest 이상치 탐지, 프로세스 풀(공유 메모리) 실행 검증
+"""
+
+import numpy as np
+import pytest
+
+from server.app.core import process_pool
+from server.app.core.config import settings
+from server.app.core.process_pool import ProcessPool
+from server.app.examples.sample_domain.calculators import SampleAnalysisCalculator
+from server.app.examples.sample_domain.calculators.kernels import (
+    anomaly_kernel,
+    isolation_forest_scores,
+    statistical_kernel,
+    trend_kernel,
+)
+from server.app.examples.sample_domain.schemas import SampleCalculatorInput
+
+
+def _input(analysis_type: str, values: list[float]) -> SampleCalculatorInput:
+    return SampleCalculatorInput(value=values[0], analysis_type=analysis_type, values=values)
+
+
+class TestKernels:
+    """분석 커널 검증"""
+
+    def test_statistical_kernel_matches_numpy(self):
+        values = np.random.default_rng(1).normal(50, 5, 1000)
+        metrics = statistical_kernel(values)
+        assert metrics["mean"] == pytest.approx(values.mean())
+        assert metrics["median"] == pytest.approx(np.median(values))
+        assert metrics["std_dev"] == pytest.approx(values.std(ddof=1))
+        assert abs(metrics["skewness"]) < 0.3
+
+    def test_trend_kernel_fits_line(self):
+        values = 3.0 + 2.0 * np.arange(20, dtype=np.float64)
+        metrics = trend_kernel(values)
+        assert metrics["slope"] == pytest.approx(2.0)
+        assert metrics["trend_strength"] == pytest.approx(1.0)
+        assert metrics["trend_direction"] == 1.0
+        assert metrics["forecast_next"] == pytest.approx(43.0)
+
+    def test_single_value_is_flat(self):
+        values = np.array([42.5])
+        assert trend_kernel(values)["trend_direction"] == 0.0
+        assert statistical_kernel(values)["std_dev"] == 0.0
+        assert anomaly_kernel(values)["is_anomaly"] == 0.0
+
+    def test_isolation_forest_scores_injected_outliers_highest(self):
+        values = np.random.default_rng(2).normal(100, 1, 2000)
+        values[[10, 500]] = [130.0, 60.0]
+        scores = isolation_forest_scores(values)
+        assert set(np.argsort(scores)[-2:]) == {10, 500}
+        assert np.array_equal(scores, isolation_forest_scores(values))
+
+    def test_anomaly_kernel_votes(self):
+        values = np.random.default_rng(3).uniform(0, 1, 1000)
+        assert anomaly_kernel(values)["is_anomaly"] == 0.0
+
+        values[7] = 5.0
+        metrics = anomaly_kernel(values)
+        assert metrics["is_anomaly"] == 1.0
+        assert metrics["anomaly_count"] == 1
+        assert metrics["confidence"] == 1.0
+
+
+class TestSampleAnalysisCalculator:
+    """계산기 분석 유형별 검증"""
+
+    async def test_statistical_analysis(self):
+        output = await SampleAnalysisCalculator().calculate(_input("statistical", [1, 2, 3, 4, 100]))
+        assert output.metrics["median"] == 3.0
+        assert "큰 값 쪽" in output.insights[0]
+
+    async def test_trend_analysis(self):
+        output = await SampleAnalysisCalculator().calculate(_input("trend", [10, 8, 6, 4, 2]))
+        assert output.metrics["trend_direction"] == -1.0
+        assert output.insights[0] == "하락 트렌드가 관찰됩니다"
+
+    async def test_large_input_runs_in_process_pool(self, monkeypatch):
+        pool = ProcessPool(max_workers=1, max_queue=1)
+        monkeypatch.setattr(settings, "PROCESS_POOL_MIN_ITEMS", 1000)
+        monkeypatch.setattr(process_pool, "_process_pool", pool)
+        try:
+            values = np.random.default_rng(4).normal(10, 2, 5000)
+            output = await SampleAnalysisCalculator().calculate(
+                _input("statistical", values.tolist())
+            )
+            assert output.metrics == statistical_kernel(values)
+            stats = pool.stats()
+            assert stats["completed"] == 1
+            assert stats["shared_bytes"] == values.nbytes
+        finally:
+            pool.shutdown()
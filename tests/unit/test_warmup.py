@@ -0,0 +1,131 @@
+"""
+단위 테스트: 기동 워밍업
+연결 사전 생성, 쿼리 사전 컴파일, 단계 실패/시간 초과 처리, 공통 코드 캐시 검증
+"""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from benchmarks.seed import create_schema
+from server.app.core.warmup import open_pool_connections, precompile, run_warmup
+from server.app.domain.common.code_cache import CommonCodeCache
+from server.app.domain.logistics.repositories.logistics_repository import LogisticsRepository
+from server.app.domain.logistics.schemas import LogisticsSearchParams
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestWarmup:
+    """워밍업 단계 검증"""
+
+    async def test_open_pool_connections_fills_pool(self, tmp_path):
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=3,
+        )
+        try:
+            assert await open_pool_connections(engine, 3) == 3
+            assert engine.pool.checkedin() == 3
+            assert engine.pool.checkedout() == 0
+        finally:
+            await engine.dispose()
+
+    async def test_precompiled_statement_is_reused_with_other_values(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}")
+        try:
+            await create_schema(engine)
+            async with AsyncSession(engine) as session:
+                repo = LogisticsRepository(session)
+                assert precompile(engine, repo.warmup_statements()) == 18
+                cached = len(engine.sync_engine._compiled_cache)
+
+                await repo.get_list(
+                    LogisticsSearchParams(out_site="1", start_date="2024-01-01", end_date="2024-12-31")
+                )
+                await repo.get_by_doc_no("1202401010001")
+                assert len(engine.sync_engine._compiled_cache) == cached
+        finally:
+            await engine.dispose()
+
+    async def test_failed_step_does_not_stop_others(self):
+        async def fail():
+            raise ConnectionError("down")
+
+        async def ok():
+            return "ok"
+
+        timings = await run_warmup([("db", fail), ("cache", ok)], timeout=5)
+        assert list(timings) == ["cache"]
+
+    async def test_timeout_skips_remaining_steps(self):
+        async def slow():
+            await asyncio.sleep(5)
+
+        async def ok():
+            return "ok"
+
+        timings = await run_warmup([("fast", ok), ("slow", slow), ("late", ok)], timeout=0.05)
+        assert list(timings) == ["fast"]
+
+
+class TestCommonCodeCache:
+    """공통 코드 캐시 검증"""
+
+    async def test_reuses_until_ttl_expires(self):
+        clock = FakeClock()
+        cache = CommonCodeCache(ttl_seconds=60, clock=clock)
+        loads: list[int] = []
+
+        async def loader():
+            loads.append(1)
+            return len(loads)
+
+        assert await cache.get_or_load("units", loader) == 1
+        assert await cache.get_or_load("units", loader) == 1
+        clock.now = 61
+        assert await cache.get_or_load("units", loader) == 2
+
+    async def test_concurrent_misses_load_once(self):
+        cache = CommonCodeCache(ttl_seconds=60)
+        loads: list[int] = []
+
+        async def loader():
+            loads.append(1)
+            await asyncio.sleep(0.01)
+            return "sites"
+
+        results = await asyncio.gather(*(cache.get_or_load("sites", loader) for _ in range(5)))
+        assert results == ["sites"] * 5
+        assert len(loads) == 1
+
+    async def test_invalidate_during_load_discards_result(self):
+        cache = CommonCodeCache(ttl_seconds=60)
+        values = iter(["stale", "fresh"])
+
+        async def loader():
+            value = next(values)
+            if value == "stale":
+                cache.invalidate()
+            return value
+
+        assert await cache.get_or_load("depts", loader) == "stale"
+        assert await cache.get_or_load("depts", loader) == "fresh"
+
+    async def test_zero_ttl_disables_cache(self):
+        cache = CommonCodeCache(ttl_seconds=0)
+        values = iter([1, 2])
+
+        async def loader():
+            return next(values)
+
+        assert await cache.get_or_load("units", loader) == 1
+        assert await cache.get_or_load("units", loader) == 2